@@ -1,36 +1,231 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
 __all__ = [
+    "ANION_FAMILIES",
+    "CATION_FAMILIES",
+    "FamilyClassifier",
     "Molecule",
+    "MoleculeInternTable",
+    "SaltBatch",
+    "anion_classifier",
+    "cation_classifier",
+    "classify_ion",
+    "molecule_intern_table",
 ]
 
 import math
+import multiprocessing
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import NamedTuple, override
+from functools import partial
+from itertools import chain
+from typing import Generic, NamedTuple, Self, TypeVar, override
 
+import pandas as pd
 from rdkit import Chem
+from rdkit.Chem import rdMolDescriptors
 
+from . import settings
 from .exceptions import (
     InvalidChargeError,
+    InvalidSmilesError,
     IonicLiquidCationError,
     UnsupportedSaltTypeError,
 )
+from .stats import Stats
 
+_V = TypeVar("_V")
+_S = TypeVar("_S", bound="Salt")
 
-@dataclass
+
+def _mol_from_smiles(smiles: str) -> Chem.Mol:
+    """Parse a SMILES, raising `InvalidSmilesError` if it cannot be parsed."""
+    if (rdkit_mol := Chem.MolFromSmiles(smiles)) is None:
+        msg = f"could not parse SMILES {smiles!r}"
+
+        raise InvalidSmilesError(msg)
+
+    return rdkit_mol
+
+
+class MoleculeInternTable:
+    """Bounded table of parsed molecules, shared by the molecules of a process.
+
+    SMILES are mapped to their canonical form and to the RDKit molecule parsed
+    from it, so that parsing a SMILES seen before is a lookup. Both the SMILES as
+    given and its canonical form are mapped, as molecules are often created
+    again from the canonical SMILES of another one. SMILES of several fragments,
+    such as those of salts, are mapped to their fragments as well. Once the table
+    is full, the least recently used SMILES are evicted.
+
+    Lookups are counted in `stats`, as `intern.hits` and `intern.misses`.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the table.
+
+        Args:
+            max_size: The maximum number of SMILES mapped to molecules, and to
+                fragments. Nothing is interned if zero.
+        """
+        self.max_size = max_size
+        self.stats = Stats()
+
+        self._molecules: OrderedDict[str, tuple[str, Chem.Mol]] = OrderedDict()
+        self._fragments: OrderedDict[str, tuple[tuple[str, Chem.Mol], ...]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def parse(self, smiles: str) -> tuple[str, Chem.Mol]:
+        """Parse a SMILES, or look it up if parsed before.
+
+        The RDKit molecule is shared with the other molecules parsed from the
+        same SMILES, so it must not be modified.
+
+        Args:
+            smiles: The SMILES.
+
+        Returns:
+            The canonical SMILES, without stereochemistry nor E/Z isomerism, and
+            the RDKit molecule parsed from the SMILES.
+
+        Raises:
+            InvalidSmilesError: If the SMILES cannot be parsed.
+        """
+        if (molecule := self._lookup(self._molecules, smiles)) is not None:
+            return molecule
+
+        rdkit_mol = _mol_from_smiles(smiles)
+
+        return self._intern(
+            smiles, Chem.MolToSmiles(rdkit_mol, isomericSmiles=False), rdkit_mol
+        )
+
+    def parse_fragments(self, smiles: str) -> tuple[tuple[str, Chem.Mol], ...]:
+        """Parse a SMILES of several fragments, or look it up if parsed before.
+
+        The SMILES is parsed once and split into its fragments, which are
+        canonicalized and interned as by `parse`.
+
+        Args:
+            smiles: The SMILES.
+
+        Returns:
+            The canonical SMILES and the RDKit molecules of the distinct
+            fragments, in order of first occurrence.
+
+        Raises:
+            InvalidSmilesError: If the SMILES cannot be parsed.
+        """
+        if (fragments := self._lookup(self._fragments, smiles)) is not None:
+            return fragments
+
+        molecules: dict[str, tuple[str, Chem.Mol]] = {}
+
+        for fragment in Chem.GetMolFrags(_mol_from_smiles(smiles), asMols=True):
+            if (
+                canonical_smiles := Chem.MolToSmiles(fragment, isomericSmiles=False)
+            ) not in molecules:
+                molecules[canonical_smiles] = self._intern(
+                    canonical_smiles, canonical_smiles, fragment
+                )
+
+        fragments = tuple(molecules.values())
+
+        with self._lock:
+            self._store(self._fragments, [smiles], fragments)
+
+        return fragments
+
+    def clear(self) -> None:
+        """Remove all the molecules from the table."""
+        with self._lock:
+            self._molecules.clear()
+            self._fragments.clear()
+
+    def _lookup(self, table: OrderedDict[str, _V], smiles: str) -> _V | None:
+        """Look up a SMILES, counting the hit or miss."""
+        with self._lock:
+            if (value := table.get(smiles)) is not None:
+                table.move_to_end(smiles)
+
+        self.stats.increment("intern.misses" if value is None else "intern.hits")
+
+        return value
+
+    def _intern(
+        self, smiles: str, canonical_smiles: str, rdkit_mol: Chem.Mol
+    ) -> tuple[str, Chem.Mol]:
+        """Map a SMILES and its canonical form to a molecule.
+
+        If the canonical SMILES is already mapped, its molecule is reused, so that
+        the RDKit molecules of molecules parsed from different SMILES are shared.
+        """
+        with self._lock:
+            molecule = self._molecules.get(canonical_smiles) or (
+                canonical_smiles,
+                rdkit_mol,
+            )
+            self._store(self._molecules, [smiles, canonical_smiles], molecule)
+
+        return molecule
+
+    def _store(self, table: OrderedDict[str, _V], keys: list[str], value: _V) -> None:
+        """Map SMILES to a value, evicting the least recently used SMILES."""
+        for key in dict.fromkeys(keys):
+            table[key] = value
+            table.move_to_end(key)
+
+        while len(table) > self.max_size:
+            table.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._molecules) + len(self._fragments)
+
+
+molecule_intern_table = MoleculeInternTable(settings.MOLECULE_INTERN_SIZE)
+"""The table interning the molecules parsed by the process."""
+
+
+@dataclass(slots=True)
 class Molecule(ABC):
     """Abstract base class for molecules.
 
     This class basically wraps an RDKit molecule object to provide some additional
     functionality and checks.
+
+    Molecules are compact: the charge and whether the molecule is organic are
+    computed once, and molecules are pickled as their canonical SMILES, the binary
+    form of their RDKit molecule and these properties. The RDKit molecule of an
+    unpickled molecule is rebuilt from its binary form on first access.
+    Subclasses must define `__slots__` as well.
     """
 
     smiles: str
     """The SMILES representation of the molecule."""
 
-    rdkit_mol: Chem.Mol = field(init=False, repr=False, compare=False)
-    """The wrapped RDKit molecule object."""
+    charge_number: int = field(default=0, init=False, repr=False, compare=False)
+    """The formal charge of the molecule."""
+
+    _organic: bool = field(default=False, init=False, repr=False, compare=False)
+    """Whether the molecule is organic."""
+
+    _rdkit_mol: Chem.Mol | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """The wrapped RDKit molecule object, or `None` if not rebuilt yet."""
+
+    _binary: bytes | None = field(default=None, init=False, repr=False, compare=False)
+    """The binary form of the RDKit molecule, or `None` if not computed yet."""
 
     @abstractmethod
     def post_init_check(self) -> None:
@@ -38,35 +233,102 @@ class Molecule(ABC):
 
     def __post_init__(self) -> None:
         """Initialize the RDKit molecule and perform post-initialization checks."""
-        self.rdkit_mol = Chem.MolFromSmiles(self.smiles)
-
         # SMILES is reassigned to ensure that it is canonical. Stereochemistry
-        # and E/Z isomerism are also discarded.
-        self.smiles = Chem.MolToSmiles(self.rdkit_mol, isomericSmiles=False)
+        # and E/Z isomerism are also discarded. The RDKit molecule is shared with
+        # the other molecules parsed from the same SMILES.
+        self.smiles, rdkit_mol = molecule_intern_table.parse(self.smiles)
+        self._set_rdkit_mol(rdkit_mol)
 
         # Perform additional checks.
         self.post_init_check()
 
+    @classmethod
+    def from_rdkit_mol(
+        cls, smiles: str, rdkit_mol: Chem.Mol, charge_number: int | None = None
+    ) -> Self:
+        """Create a molecule from an already parsed RDKit molecule.
+
+        Unlike the regular initialization, the SMILES is not parsed, so it must be
+        the canonical SMILES of the RDKit molecule, as returned by
+        `MoleculeInternTable.parse`.
+
+        Args:
+            smiles: The canonical SMILES of the molecule.
+            rdkit_mol: The RDKit molecule.
+            charge_number: The formal charge of the RDKit molecule, if already
+                computed.
+
+        Returns:
+            The molecule.
+        """
+        molecule = cls.__new__(cls)
+
+        molecule.smiles = smiles
+        molecule._set_rdkit_mol(rdkit_mol, charge_number)  # noqa: SLF001
+        molecule.post_init_check()
+
+        return molecule
+
+    @property
+    def rdkit_mol(self) -> Chem.Mol:
+        """Return the wrapped RDKit molecule object."""
+        if self._rdkit_mol is None:
+            self._rdkit_mol = Chem.Mol(self._binary)  # type: ignore[call-overload]
+
+        return self._rdkit_mol
+
+    @property
+    def binary(self) -> bytes:
+        """Return the binary form of the RDKit molecule, see `Chem.Mol.ToBinary`."""
+        if self._binary is None:
+            self._binary = self.rdkit_mol.ToBinary()
+
+        return self._binary
+
     # NOTE: Other relevant properties from the RDKIT `Mol` object can be wrapped here.
 
     def is_organic(self) -> bool:
         """Return `True` if the molecule is organic, `False` otherwise."""
-        return any(
+        return self._organic
+
+    @property
+    def heavy_atom_count(self) -> int:
+        """Return the number of heavy atoms of the molecule."""
+        return self.rdkit_mol.GetNumHeavyAtoms()
+
+    @property
+    def formula(self) -> str:
+        """Return the molecular formula of the molecule, e.g. `C2H8N+`."""
+        return rdMolDescriptors.CalcMolFormula(self.rdkit_mol)
+
+    def _set_rdkit_mol(
+        self, rdkit_mol: Chem.Mol, charge_number: int | None = None
+    ) -> None:
+        """Set the RDKit molecule and compute the properties derived from it."""
+        self._rdkit_mol = rdkit_mol
+        self._binary = None
+        self.charge_number = (
+            Chem.GetFormalCharge(rdkit_mol) if charge_number is None else charge_number
+        )
+        self._organic = any(
             atom.GetSymbol() == "C"
-            for atom in self.rdkit_mol.GetAtoms()  # type: ignore[no-untyped-call]
+            for atom in rdkit_mol.GetAtoms()  # type: ignore[no-untyped-call]
             if atom.GetAtomicNum()
         )
 
-    @property
-    def charge_number(self) -> int:
-        """Return the formal charge of the molecule."""
-        return Chem.GetFormalCharge(self.rdkit_mol)
+    def __getstate__(self) -> tuple[str, bytes, int, bool]:
+        return self.smiles, self.binary, self.charge_number, self._organic
+
+    def __setstate__(self, state: tuple[str, bytes, int, bool]) -> None:
+        self.smiles, self._binary, self.charge_number, self._organic = state
+        self._rdkit_mol = None
 
 
-@dataclass
 class Ion(Molecule):
     """Represent an ion, i.e. a charged molecule."""
 
+    __slots__ = ()
+
     @override
     def post_init_check(self) -> None:
         if self.charge_number == 0:
@@ -75,10 +337,11 @@ class Ion(Molecule):
             raise InvalidChargeError(msg)
 
 
-@dataclass
 class Cation(Ion):
     """Represents a cation, i.e. a positively charged ion."""
 
+    __slots__ = ()
+
     @override
     def post_init_check(self) -> None:
         super().post_init_check()
@@ -89,10 +352,11 @@ class Cation(Ion):
             raise InvalidChargeError(msg)
 
 
-@dataclass
 class Anion(Ion):
     """Represents an anion, i.e. a negatively charged ion."""
 
+    __slots__ = ()
+
     @override
     def post_init_check(self) -> None:
         super().post_init_check()
@@ -127,27 +391,34 @@ class Salt:
     """The anion of the salt."""
 
     def __post_init__(self) -> None:
-        """Initialize the cation and anion from the SMILES string."""
+        """Initialize the cation and anion from the SMILES string.
+
+        The SMILES is parsed once, and the cation and anion are created from its
+        fragments.
+        """
         try:
-            cation_smiles, anion_smiles = set(smiles_codes := self.smiles.split("."))
+            cation, anion = (
+                fragments := molecule_intern_table.parse_fragments(self.smiles)
+            )
         except ValueError as e:
             msg = (
                 f"salts must contain exactly one type of both cation and anion; "
-                f"found {len(smiles_codes)} type(s)"
+                f"found {len(fragments)} type(s)"
             )
 
             raise UnsupportedSaltTypeError(msg) from e
 
-        if any(
-            [
-                (cation := Ion(cation_smiles)).charge_number < 0,
-                (anion := Ion(anion_smiles)).charge_number > 0,
-            ]
-        ):
+        # The charges are computed once, to order the fragments, and passed on to
+        # the ions.
+        cation_charge = Chem.GetFormalCharge(cation[1])
+        anion_charge = Chem.GetFormalCharge(anion[1])
+
+        if cation_charge < 0 or anion_charge > 0:
             cation, anion = anion, cation
+            cation_charge, anion_charge = anion_charge, cation_charge
 
-        self.cation = Cation(cation.smiles)
-        self.anion = Anion(anion.smiles)
+        self.cation = Cation.from_rdkit_mol(*cation, cation_charge)
+        self.anion = Anion.from_rdkit_mol(*anion, anion_charge)
 
     @property
     def stoichiometry(self) -> Stoichiometry:
@@ -159,6 +430,51 @@ class Salt:
 
         return Stoichiometry(cation=lcm // z_cation, anion=lcm // z_anion)
 
+    @classmethod
+    def from_smiles_batch(
+        cls,
+        smiles: Sequence[str | None],
+        max_workers: int | None = None,
+        chunksize: int = 1024,
+    ) -> SaltBatch[Self]:
+        """Create salts from many SMILES, in parallel, collecting the errors.
+
+        The SMILES are split into chunks parsed by a pool of processes, so that
+        large lists of candidates are validated on all cores. Batches of a single
+        chunk, or with a single worker, are parsed in the current process.
+
+        Salts that cannot be created, as well as missing SMILES, are reported in
+        the errors of the batch, rather than raised.
+
+        Args:
+            smiles: The SMILES of the salts, or `None` if missing.
+            max_workers: The number of processes parsing the SMILES. If `None`,
+                the number of processors of the machine.
+            chunksize: The number of SMILES parsed per task.
+
+        Returns:
+            The salts created and the errors.
+        """
+        create_salts = partial(_create_salts, cls)
+        chunks = [
+            smiles[start : start + chunksize]
+            for start in range(0, len(smiles), chunksize)
+        ]
+
+        if len(chunks) <= 1 or max_workers == 1:
+            return SaltBatch.from_outcomes(
+                smiles, chain.from_iterable(map(create_salts, chunks))
+            )
+
+        # The processes are started by a fork server rather than forked from the
+        # current process, which may run threads.
+        with ProcessPoolExecutor(
+            max_workers, mp_context=multiprocessing.get_context("forkserver")
+        ) as executor:
+            return SaltBatch.from_outcomes(
+                smiles, chain.from_iterable(executor.map(create_salts, chunks))
+            )
+
 
 @dataclass
 class IonicLiquid(Salt):
@@ -174,3 +490,196 @@ class IonicLiquid(Salt):
             msg = "cations in ionic liquids must be organic"
 
             raise IonicLiquidCationError(msg)
+
+
+@dataclass
+class SaltBatch(Generic[_S]):
+    """Salts created from a batch of SMILES, see `Salt.from_smiles_batch`."""
+
+    salts: list[_S]
+    """The salts created, in the order of their SMILES."""
+
+    indices: list[int]
+    """The positions of the SMILES of the salts in the batch."""
+
+    errors: pd.DataFrame
+    """The SMILES that could not be created, one row per SMILES.
+
+    The `index`, `smiles`, `error` and `message` columns hold the position of the
+    SMILES in the batch, the SMILES, the name of the exception raised, e.g.
+    `UnsupportedSaltTypeError`, and its message.
+    """
+
+    @classmethod
+    def from_outcomes(
+        cls, smiles: Sequence[str | None], outcomes: Iterable[_S | tuple[str, str]]
+    ) -> SaltBatch[_S]:
+        """Collect the outcomes of the creation of salts.
+
+        Args:
+            smiles: The SMILES of the salts.
+            outcomes: The salt created from each SMILES, or the name and message
+                of the exception raised.
+
+        Returns:
+            The batch.
+        """
+        salts: list[_S] = []
+        indices: list[int] = []
+        errors: list[tuple[int, str | None, str, str]] = []
+
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, tuple):
+                errors.append((index, smiles[index], *outcome))
+            else:
+                salts.append(outcome)
+                indices.append(index)
+
+        return cls(
+            salts,
+            indices,
+            pd.DataFrame(errors, columns=["index", "smiles", "error", "message"]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.salts)
+
+
+def _create_salts(
+    cls: type[_S], smiles: Sequence[str | None]
+) -> list[_S | tuple[str, str]]:
+    """Create salts from a chunk of SMILES, see `Salt.from_smiles_batch`.
+
+    Any exception raised by a salt is reported as its outcome, so that a single
+    malformed item does not abort the batch.
+    """
+    outcomes: list[_S | tuple[str, str]] = []
+
+    for salt_smiles in smiles:
+        if not isinstance(salt_smiles, str):
+            msg = f"SMILES must be a string, got {type(salt_smiles).__name__}"
+            outcomes.append((TypeError.__name__, msg))
+
+            continue
+
+        try:
+            outcomes.append(cls(salt_smiles))
+        except Exception as e:  # noqa: BLE001
+            outcomes.append((type(e).__name__, str(e)))
+
+    return outcomes
+
+
+class FamilyClassifier:
+    """Classifies molecules into families by substructure matching.
+
+    The SMARTS patterns of the families are compiled once, when the classifier is
+    created, and matched in order, so that more specific families must be listed
+    before more general ones, e.g. pyrrolidinium before ammonium.
+    """
+
+    def __init__(self, families: Mapping[str, str], default: str = "other") -> None:
+        """Initialize the classifier.
+
+        Args:
+            families: The SMARTS patterns of the families, by name, in order of
+                precedence.
+            default: The family of the molecules matching no pattern.
+
+        Raises:
+            ValueError: If a SMARTS pattern cannot be parsed.
+        """
+        self.default = default
+        self._patterns: list[tuple[str, Chem.Mol]] = []
+
+        for family, smarts in families.items():
+            if (pattern := Chem.MolFromSmarts(smarts)) is None:
+                msg = f"could not parse SMARTS {smarts!r} of family {family!r}"
+
+                raise ValueError(msg)
+
+            self._patterns.append((family, pattern))
+
+    @property
+    def families(self) -> list[str]:
+        """Return the names of the families, in order of precedence."""
+        return [family for family, _ in self._patterns]
+
+    def __call__(self, molecule: Molecule) -> str:
+        """Return the family of a molecule.
+
+        Args:
+            molecule: The molecule.
+
+        Returns:
+            The first family whose pattern matches the molecule, or the default
+            family if none does.
+        """
+        rdkit_mol = molecule.rdkit_mol
+
+        for family, pattern in self._patterns:
+            if rdkit_mol.HasSubstructMatch(pattern):
+                return family
+
+        return self.default
+
+    def classify(self, molecules: Iterable[Molecule]) -> list[str]:
+        """Return the families of molecules.
+
+        Args:
+            molecules: The molecules.
+
+        Returns:
+            The family of each molecule.
+        """
+        return [self(molecule) for molecule in molecules]
+
+
+CATION_FAMILIES = {
+    "imidazolium": "[n+]1ccnc1",
+    "pyridinium": "[n+]1ccccc1",
+    "pyrrolidinium": "[N+]1CCCC1",
+    "piperidinium": "[N+]1CCCCC1",
+    "morpholinium": "[N+]1CCOCC1",
+    "guanidinium": "[NX3]C(=[NX3+])[NX3]",
+    "ammonium": "[NX4+]",
+    "phosphonium": "[PX4+]",
+    "sulfonium": "[SX3+]",
+}
+"""The SMARTS patterns of the cation families, in order of precedence."""
+
+ANION_FAMILIES = {
+    "bistriflimide": "FC(F)(F)S(=O)(=O)[N-]S(=O)(=O)C(F)(F)F",
+    "fluorosulfonylimide": "FS(=O)(=O)[N-]S(=O)(=O)F",
+    "triflate": "[O-]S(=O)(=O)C(F)(F)F",
+    "alkylsulfate": "[O-]S(=O)(=O)O[#6]",
+    "hydrogensulfate": "[O-]S(=O)(=O)[OX2H1]",
+    "sulfonate": "[O-]S(=O)(=O)[#6]",
+    "tetrafluoroborate": "F[B-](F)(F)F",
+    "hexafluorophosphate": "F[P-](F)(F)(F)(F)F",
+    "phosphate": "[O-]P(=O)(O)O",
+    "dicyanamide": "N#C[N-]C#N",
+    "thiocyanate": "[S-]C#N",
+    "nitrate": "[O-][N+](=O)[O-]",
+    "carboxylate": "[O-][CX3]=O",
+    "halide": "[F-,Cl-,Br-,I-]",
+}
+"""The SMARTS patterns of the anion families, in order of precedence."""
+
+cation_classifier = FamilyClassifier(CATION_FAMILIES)
+"""The classifier of cations into the families of `CATION_FAMILIES`."""
+
+anion_classifier = FamilyClassifier(ANION_FAMILIES)
+"""The classifier of anions into the families of `ANION_FAMILIES`."""
+
+
+def classify_ion(ion: Ion) -> str:
+    """Return the family of an ion, see `CATION_FAMILIES` and `ANION_FAMILIES`.
+
+    Args:
+        ion: The ion.
+
+    Returns:
+        The family of the ion, or `other` if it belongs to none.
+    """
+    return (cation_classifier if isinstance(ion, Cation) else anion_classifier)(ion)
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+from typing import Any
+
+__all__ = [
+    "CircuitBreaker",
+    "TokenBucket",
+    "backoff_delay",
+    "create_session",
+    "get_entry_data",
+]
+
+import random
+import threading
+import time
+
+import requests
+
+from . import settings
+from .exceptions import CircuitOpenError
+from .stats import SIZE_BOUNDS, Stats
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+"""The HTTP status codes of the responses that are retried."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Tokens are added at a constant rate, up to a capacity, and every request takes
+    one. Requests are thus allowed in bursts of up to the capacity, but at the
+    rate on average. A request finding the bucket empty reserves the next token,
+    and waits until it is added.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """Initialize the bucket, full.
+
+        Args:
+            rate: The number of tokens added per second.
+            capacity: The maximum number of tokens in the bucket.
+        """
+        self.rate = rate
+        self.capacity = capacity
+
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token, waiting until one is available.
+
+        Returns:
+            The time waited, in seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+
+            wait = max(0.0, -self._tokens / self.rate)
+
+        if wait:
+            time.sleep(wait)
+
+        return wait
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker.
+
+    The circuit opens after a number of consecutive failures, and then rejects all
+    calls until a timeout has elapsed. A single trial call is then let through,
+    which closes the circuit if it succeeds, or opens it again otherwise.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """Initialize the circuit breaker, closed.
+
+        Args:
+            failure_threshold: The number of consecutive failures opening the
+                circuit.
+            reset_timeout: The time after which a trial call is let through, in
+                seconds.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Return `True` if calls are currently rejected, `False` otherwise."""
+        with self._lock:
+            return (
+                self._opened_at is not None
+                and time.monotonic() - self._opened_at < self.reset_timeout
+            )
+
+    def check(self) -> None:
+        """Check that a call is allowed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+
+            if (now := time.monotonic()) - self._opened_at < self.reset_timeout:
+                msg = "requests to ILThermo are suspended after repeated failures"
+
+                raise CircuitOpenError(msg)
+
+            # The call is the trial call, so the circuit is opened again for the
+            # others until its outcome is recorded.
+            self._opened_at = now
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if needed."""
+        with self._lock:
+            self._failures += 1
+
+            if self._opened_at is not None or (
+                self._failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = settings.ILTHERMO_BACKOFF_BASE,
+    cap: float = settings.ILTHERMO_BACKOFF_MAX,
+) -> float:
+    """Return the delay before retrying a request, with exponential backoff.
+
+    The delay is drawn uniformly up to the exponential bound ("full jitter"), so
+    that clients failing together do not retry together.
+
+    Args:
+        attempt: The number of the failed attempt, starting from zero.
+        base: The bound of the delay after the first attempt, in seconds.
+        cap: The maximum delay, in seconds.
+
+    Returns:
+        The delay, in seconds.
+    """
+    return random.uniform(0.0, min(cap, base * 2**attempt))  # noqa: S311
+
+
+def create_session(
+    pool_size: int = settings.ILTHERMO_MAX_CONCURRENCY,
+) -> requests.Session:
+    """Create an HTTP session for ILThermo requests.
+
+    Args:
+        pool_size: The maximum number of connections kept alive by the session.
+
+    Returns:
+        The HTTP session.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_size)
+
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+_session = create_session()
+"""The session used for ILThermo requests by default."""
+
+_rate_limiter = (
+    TokenBucket(settings.ILTHERMO_RATE_LIMIT, settings.ILTHERMO_RATE_BURST)
+    if settings.ILTHERMO_RATE_LIMIT > 0
+    else None
+)
+"""The rate limiter shared by all ILThermo requests, if any."""
+
+_circuit_breaker = CircuitBreaker(
+    settings.ILTHERMO_BREAKER_THRESHOLD, settings.ILTHERMO_BREAKER_TIMEOUT
+)
+"""The circuit breaker shared by all ILThermo requests."""
+
+
+def get_entry_data(
+    code: str,
+    session: requests.Session | None = None,
+    stats: Stats | None = None,
+) -> dict[str, Any]:
+    """Retrieve the raw data of an entry from ILThermo.
+
+    This is a replacement for `ilthermopy.requests.GetEntryData` that sends
+    requests through an HTTP session, so that connections to ILThermo are reused.
+
+    Requests are throttled by a token bucket shared by all requests, according
+    to `ILTHERMO_RATE_LIMIT` and `ILTHERMO_RATE_BURST`. Failed requests, due to
+    connection errors, timeouts, or responses with status codes in
+    `RETRY_STATUS_CODES`, are retried up to `ILTHERMO_MAX_RETRIES` times, after
+    the delay requested by the server or given by `backoff_delay`. After
+    `ILTHERMO_BREAKER_THRESHOLD` consecutive failures, requests are suspended
+    for `ILTHERMO_BREAKER_TIMEOUT` seconds by a shared circuit breaker.
+
+    Args:
+        code: The identifier of the entry.
+        session: The HTTP session to use. Defaults to a module-level session.
+        stats: The stats object recording the duration of the requests, as
+            `fetch.seconds`, the size of the response, as `fetch.bytes`, the time
+            waited for the rate limiter, as `fetch.throttle_seconds`, and the
+            numbers of failed and retried requests, as `fetch.errors` and
+            `fetch.retries`.
+
+    Returns:
+        The ILThermo response.
+
+    Raises:
+        CircuitOpenError: If requests to ILThermo are suspended.
+        requests.RequestException: If the request fails for good.
+    """
+    if stats is None:
+        stats = Stats()
+
+    attempt = 0
+
+    while True:
+        _circuit_breaker.check()
+
+        if _rate_limiter:
+            stats.observe("fetch.throttle_seconds", _rate_limiter.acquire())
+
+        try:
+            with stats.time("fetch.seconds"):
+                response = (session or _session).get(
+                    settings.ILTHERMO_DATA_URL,
+                    params={"set": code},
+                    timeout=settings.ILTHERMO_TIMEOUT,
+                )
+                response.raise_for_status()
+        except requests.RequestException as e:
+            if not _is_retryable(e):
+                # The server responded, so it is not failing.
+                _circuit_breaker.record_success()
+
+                raise
+
+            _circuit_breaker.record_failure()
+            stats.increment("fetch.errors")
+
+            if attempt >= settings.ILTHERMO_MAX_RETRIES:
+                raise
+
+            stats.increment("fetch.retries")
+            time.sleep(
+                _retry_after(e)
+                or backoff_delay(
+                    attempt,
+                    settings.ILTHERMO_BACKOFF_BASE,
+                    settings.ILTHERMO_BACKOFF_MAX,
+                )
+            )
+
+            attempt += 1
+
+            continue
+
+        _circuit_breaker.record_success()
+        stats.observe("fetch.bytes", len(response.content), SIZE_BOUNDS)
+
+        return response.json()  # type: ignore [no-any-return]
+
+
+def _is_retryable(error: requests.RequestException) -> bool:
+    """Return `True` if a failed request may succeed if retried."""
+    if isinstance(error, requests.HTTPError):
+        return (
+            error.response is not None
+            and error.response.status_code in RETRY_STATUS_CODES
+        )
+
+    return isinstance(error, requests.ConnectionError | requests.Timeout)
+
+
+def _retry_after(error: requests.RequestException) -> float | None:
+    """Return the delay requested by the server with `Retry-After`, if any."""
+    if error.response is None:
+        return None
+
+    try:
+        delay = float(error.response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+    return min(delay, settings.ILTHERMO_BACKOFF_MAX)
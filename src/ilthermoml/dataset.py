@@ -1,33 +1,277 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, Literal, Self, TypeVar, cast
 
-from ilthermoml.chemistry import Anion, Cation, IonicLiquid
+from ilthermoml.chemistry import Anion, Cation, IonicLiquid, classify_ion
 
 if TYPE_CHECKING:
+    import os
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Executor, Future
+
+    import requests
+
     from ilthermoml.chemistry import Ion
+    from ilthermoml.failures import FailureLog
+    from ilthermoml.progress import ProgressCallback
 
 __all__ = [
+    "AsyncEntryClient",
+    "Column",
     "Dataset",
     "Entry",
+    "get_entry",
 ]
 
+import asyncio
+import inspect
+import json
+import multiprocessing
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import InitVar, dataclass, field
+from functools import cache, partial
+from pathlib import Path
 
 import ilthermopy as ilt
+import joblib
+import numpy as np
 import pandas as pd
-from tqdm import tqdm
 
-from .exceptions import ChemistryError, DatasetError, EntryError
+from . import __version__, settings
+from .client import create_session, get_entry_data
+from .exceptions import (
+    ChemistryError,
+    CircuitOpenError,
+    DatasetError,
+    EntryError,
+    EntryFetchError,
+    MissingColumnError,
+)
+from .failures import Failure, open_failure_log
 from .memory import ilt_memory
+from .mirror import open_mirror
+from .progress import EntryEvent, Progress, TqdmProgress
+from .registry import Registry
+from .similarity import FingerprintIndex
+from .stats import Stats
+
+
+def get_entry(
+    code: str,
+    session: requests.Session | None = None,
+    stats: Stats | None = None,
+) -> ilt.Entry:
+    """Retrieve an entry from ILThermo.
+
+    This is a replacement for `ilthermopy.GetEntry` that sends requests through an
+    HTTP session, so that connections to ILThermo are reused.
+
+    Args:
+        code: The identifier of the entry.
+        session: The HTTP session to use. Defaults to a module-level session.
+        stats: The stats object recording the request, see `get_entry_data`.
+
+    Returns:
+        The ILThermo entry.
+    """
+    return ilt.data_structs.ResponseToEntry(code, get_entry_data(code, session, stats))
+
+
+_cached_get_entry = ilt_memory.cache(get_entry, ignore=["session", "stats"])
+
+
+def GetEntry(  # noqa: N802
+    code: str,
+    session: requests.Session | None = None,
+    stats: Stats | None = None,
+) -> ilt.Entry:
+    """Retrieve an entry from the local mirror, the cache, or ILThermo.
+
+    If a mirror is configured with `ILTHERMO_MIRROR`, entries are read from it,
+    and entries missing from it are retrieved from ILThermo and added to it, unless
+    `ILTHERMO_OFFLINE` is set. Otherwise, entries are retrieved from ILThermo
+    through the cache.
+
+    Args:
+        code: The identifier of the entry.
+        session: The HTTP session to use. Defaults to a module-level session.
+        stats: The stats object recording the duration of the retrieval, as
+            `get_entry.seconds`, and the hits and misses of the mirror or the
+            cache, as `mirror.hits` and `mirror.misses`, or `cache.hits` and
+            `cache.misses`, along with the requests sent to ILThermo.
+
+    Returns:
+        The ILThermo entry.
+
+    Raises:
+        EntryFetchError: If the entry is not mirrored and ILThermo is offline.
+    """
+    if stats is None:
+        stats = Stats()
+
+    with stats.time("get_entry.seconds"):
+        if not settings.ILTHERMO_MIRROR:
+            ilt_entry, cached = _cached_get_entry.call_cached(
+                code, session=session, stats=stats
+            )
+            stats.increment("cache.hits" if cached else "cache.misses")
+
+            return ilt_entry
+
+        mirror = open_mirror(settings.ILTHERMO_MIRROR)
+
+        if (response := mirror.get(code)) is None:
+            stats.increment("mirror.misses")
+
+            if settings.ILTHERMO_OFFLINE:
+                msg = f"entry {code!r} is not mirrored and ILThermo is offline"
+
+                raise EntryFetchError(msg)
+
+            mirror.put(code, response := get_entry_data(code, session, stats))
+        else:
+            stats.increment("mirror.hits")
+
+        return ilt.data_structs.ResponseToEntry(code, response)
+
+
+class AsyncEntryClient:
+    """Asynchronous client for retrieving ILThermo entries.
+
+    Requests are sent through a pooled HTTP session from a dedicated pool of
+    worker threads, so that the event loop is never blocked and the concurrency is
+    not capped by the default executor, while a semaphore limits the number of
+    requests in flight. Entries are retrieved with `GetEntry`, so they are read
+    from and written to the same mirror or cache as in the synchronous case.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = settings.ILTHERMO_MAX_CONCURRENCY,
+        stats: Stats | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            max_concurrency: The maximum number of requests in flight.
+            stats: The stats object recording the retrievals, see `GetEntry`.
+        """
+        self.session = create_session(max_concurrency)
+        self.stats = Stats() if stats is None else stats
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_concurrency, thread_name_prefix="ilthermo-client"
+        )
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        # The pending requests are cancelled and the running ones awaited, so that
+        # no request is sent through the closed session.
+        await asyncio.to_thread(self._executor.shutdown, cancel_futures=True)
+        self.session.close()
+
+    async def get_entry(self, code: str, stats: Stats | None = None) -> ilt.Entry:
+        """Retrieve an entry from ILThermo.
+
+        Args:
+            code: The identifier of the entry.
+            stats: The stats object recording the retrieval. Defaults to the stats
+                of the client.
+
+        Returns:
+            The ILThermo entry.
+
+        Raises:
+            CircuitOpenError: If requests to ILThermo are suspended.
+            EntryFetchError: If the entry cannot be retrieved from ILThermo.
+        """
+        async with self._semaphore:
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    partial(
+                        GetEntry,
+                        code,
+                        session=self.session,
+                        stats=self.stats if stats is None else stats,
+                    ),
+                )
+            except CircuitOpenError:
+                raise
+            except Exception as e:
+                msg = f"failed to retrieve ILThermo entry {code!r}"
+
+                raise EntryFetchError(msg) from e
+
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _bounded_map(
+    executor: Executor,
+    fn: Callable[[_T], _R],
+    items: Iterable[_T],
+    limit: int,
+) -> Iterator[_R]:
+    """Map a function over items using an executor, preserving the input order.
+
+    Unlike `Executor.map`, items are submitted lazily so that at most `limit` calls
+    are pending at any time.
+
+    Args:
+        executor: The executor to submit the calls to.
+        fn: The function to map.
+        items: The items to map the function over.
+        limit: The maximum number of pending calls.
+
+    Yields:
+        The results of the calls, in the order of the items.
+    """
+    pending: deque[Future[_R]] = deque()
+
+    for item in items:
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+
+        pending.append(executor.submit(fn, item))
+
+    while pending:
+        yield pending.popleft().result()
+
 
-GetEntry = ilt_memory.cache(ilt.GetEntry)
+@dataclass(frozen=True)
+class Column:
+    """Declares a column selected from the data of an entry with `Entry.select`."""
+
+    name: str
+    """The name of the column in the selected data."""
+
+    source: str
+    """The name of the column in the data of the entry."""
+
+    scale: float = 1.0
+    """The factor by which the values of the column are multiplied."""
+
+    default: float | None = None
+    """The value of the column if missing from the data. If `None`, it is required."""
 
 
 @dataclass
 class Entry:
-    """Represents a single entry in the dataset."""
+    """Represents a single entry in the dataset.
+
+    Lazy entries only keep the metadata of the ILThermo entry, such as its ionic
+    liquid, once initialized. Their data are retrieved and prepared on first
+    access instead, and can be released afterwards, so that passes over many
+    entries that do not need the data hold little memory.
+    """
 
     id: str
     """The identifier of the entry."""
@@ -35,28 +279,85 @@ class Entry:
     ionic_liquid: IonicLiquid = field(init=False, repr=False)
     """The ionic liquid associated with the entry."""
 
-    data: pd.DataFrame = field(init=False, repr=False)
-    """The data associated with the entry."""
-
     dataset: InitVar[Dataset | None] = None
     """The dataset to which this entry belongs."""
 
-    def __post_init__(self, dataset: Dataset | None) -> None:
+    ilt_entry: InitVar[ilt.Entry | None] = None
+    """The ILThermo entry, if already retrieved."""
+
+    lazy: bool = False
+    """Whether the data are loaded on first access rather than on initialization."""
+
+    stats: InitVar[Stats | None] = None
+    """The stats object recording the creation of the entry.
+
+    Defaults to the stats of the dataset. Besides those recorded by `GetEntry`,
+    the durations of the validation of the components and of the parsing of the
+    ionic liquid are recorded as `parse_entry.seconds`, and those of
+    `Dataset.prepare_entry` as `prepare_entry.seconds`.
+    """
+
+    session: InitVar[requests.Session | None] = None
+    """The HTTP session retrieving the entry, see `GetEntry`."""
+
+    _data: pd.DataFrame | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """The data associated with the entry, or `None` if not loaded."""
+
+    _num_data_points: int = field(default=0, init=False, repr=False, compare=False)
+    """The number of data points of the entry when its data are not loaded."""
+
+    _data_version: int = field(default=0, init=False, repr=False, compare=False)
+    """The number of times the data were replaced, but not reloaded."""
+
+    _dataset: Dataset | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """The dataset against which the data of a lazy entry are prepared."""
+
+    def __post_init__(
+        self,
+        dataset: Dataset | None,
+        ilt_entry: ilt.Entry | None,
+        stats: Stats | None,
+        session: requests.Session | None,
+    ) -> None:
         """Initialize the entry by retrieving data from ILThermo.
 
         Args:
             dataset: The dataset to which this entry belongs.
+            ilt_entry: The ILThermo entry. If not given, it is retrieved using
+                `GetEntry`.
+            stats: The stats object recording the creation of the entry.
+            session: The HTTP session retrieving the entry. Defaults to the
+                module-level session.
 
         Raises:
-            EntryError: If the entry cannot be retrieved from ILThermo.
+            EntryFetchError: If the entry cannot be retrieved from ILThermo.
+            EntryError: If the entry is not supported.
         """
+        if stats is None:
+            stats = dataset.stats if dataset else Stats()
+
+        if ilt_entry is None:
+            ilt_entry = self._retrieve(stats, session)
+
+        start = time.perf_counter()
+
         try:
-            ilt_entry = GetEntry(self.id)
-        except Exception as e:
-            msg = f"failed to retrieve ILThermo entry {self.id!r}"
+            self._parse(ilt_entry)
+        finally:
+            stats.observe("parse_entry.seconds", time.perf_counter() - start)
 
-            raise EntryError(msg) from e
+        if self.lazy:
+            self._dataset = dataset
+            self._num_data_points = len(ilt_entry.data)
+        else:
+            self._load(ilt_entry, dataset, stats)
 
+    def _parse(self, ilt_entry: ilt.Entry) -> None:
+        """Validate the components of the ILThermo entry and parse its ionic liquid."""
         if len(components := ilt_entry.components) > 1:
             msg = "entries with multiple components are not supported"
 
@@ -78,49 +379,702 @@ class Entry:
 
             raise EntryError(msg) from e
 
-        self.data = ilt_entry.data.copy().rename(columns=ilt_entry.header)
         self.ionic_liquid_id = ilt_entry.components[0].id
 
-        if dataset:
+    @property
+    def data(self) -> pd.DataFrame:
+        """Return the data associated with the entry.
+
+        The data of lazy entries are retrieved and prepared on first access, and
+        kept until released.
+
+        Raises:
+            EntryFetchError: If the entry cannot be retrieved from ILThermo.
+            EntryError: If the data of the entry are not supported.
+        """
+        if self._data is None:
+            stats = self._dataset.stats if self._dataset else Stats()
+            data_version = self._data_version
+
+            self._load(self._retrieve(stats), self._dataset, stats)
+
+            # Reloading the data of a lazy entry does not replace them.
+            self._data_version = data_version
+
+        return cast(pd.DataFrame, self._data)
+
+    @data.setter
+    def data(self, data: pd.DataFrame) -> None:
+        self._data = data
+        self._data_version += 1
+
+    @property
+    def num_data_points(self) -> int:
+        """Return the number of data points of the entry.
+
+        The data of lazy entries are not loaded. If they were never loaded, the
+        number of data points is the one before preparation.
+        """
+        return self._num_data_points if self._data is None else len(self._data)
+
+    def release(self) -> None:
+        """Release the data of a lazy entry, to be loaded again on next access.
+
+        Raises:
+            EntryError: If the entry is not lazy.
+        """
+        if not self.lazy:
+            msg = "only the data of lazy entries can be released"
+
+            raise EntryError(msg)
+
+        if self._data is not None:
+            self._num_data_points = len(self._data)
+            self._data = None
+
+    def _retrieve(
+        self, stats: Stats, session: requests.Session | None = None
+    ) -> ilt.Entry:
+        """Retrieve the ILThermo entry, using `GetEntry`."""
+        try:
+            return GetEntry(self.id, session=session, stats=stats)
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            msg = f"failed to retrieve ILThermo entry {self.id!r}"
+
+            raise EntryFetchError(msg) from e
+
+    def _load(
+        self, ilt_entry: ilt.Entry, dataset: Dataset | None, stats: Stats
+    ) -> None:
+        """Load the data from the ILThermo entry and prepare them."""
+        # The columns are renamed without copying the data, which are not shared
+        # with anything but the ILThermo entry.
+        self.data = ilt_entry.data.rename(columns=ilt_entry.header, copy=False)
+
+        if not dataset:
+            return
+
+        start = time.perf_counter()
+
+        try:
             dataset.prepare_entry(self)
+        except BaseException:
+            # Lazy entries are loaded again on next access, rather than keeping
+            # data that were not prepared.
+            self._data = None
+
+            raise
+        finally:
+            stats.observe("prepare_entry.seconds", time.perf_counter() - start)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The dataset is not pickled along with its entries; lazy entries are
+        # attached to the dataset they are restored into instead.
+        return {**self.__dict__, "_dataset": None}
+
+    def select(self, *columns: Column) -> None:
+        """Replace the data with a selection of its columns.
+
+        This is meant to be used by `Dataset.prepare_entry`. The selected columns
+        that are not scaled are views on the data, so that only the scaled
+        columns and the defaults are materialized.
+
+        Args:
+            columns: The columns to select, in order.
+
+        Raises:
+            MissingColumnError: If a required column is missing from the data.
+        """
+        selected: dict[str, pd.Series] = {}
+
+        for column in columns:
+            if column.source in self.data.columns:
+                values = self.data[column.source]
+
+                selected[column.name] = (
+                    values if column.scale == 1.0 else values * column.scale
+                )
+            elif column.default is not None:
+                selected[column.name] = pd.Series(
+                    np.full(len(self.data), column.default), index=self.data.index
+                )
+            else:
+                msg = f"required column {column.source!r} is missing"
+
+                raise MissingColumnError(msg)
+
+        self.data = pd.DataFrame(selected, index=self.data.index, copy=False)
+
+    @classmethod
+    def from_data(
+        cls, entry_id: str, ionic_liquid: IonicLiquid, data: pd.DataFrame
+    ) -> Self:
+        """Create an entry from already prepared data.
+
+        Unlike the regular initialization, nothing is retrieved from ILThermo and
+        the entry is not prepared.
+
+        Args:
+            entry_id: The identifier of the entry.
+            ionic_liquid: The ionic liquid associated with the entry.
+            data: The data associated with the entry.
+
+        Returns:
+            The entry.
+        """
+        entry = cls.__new__(cls)
+
+        entry.id = entry_id
+        entry.ionic_liquid = ionic_liquid
+        entry.data = data
+        entry.ionic_liquid_id = ionic_liquid.id
+
+        return entry
+
+
+class _Checkpoint:
+    """Append-only on-disk store of dataset entries.
+
+    Every save writes a new segment file holding only the entries passed, so the
+    cost of a checkpoint does not grow with the size of the dataset. Segments are
+    stored in a subdirectory named after a version, e.g. that of the preparation
+    of the entries, so that entries of different versions are never mixed.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], version: str) -> None:
+        self.path = Path(path) / version
+
+    def load(self) -> list[Entry]:
+        """Load the entries from all segments, in the order they were saved."""
+        entries: list[Entry] = []
+
+        for segment in sorted(self.path.glob("segment-*.joblib")):
+            entries.extend(joblib.load(segment))
+
+        return entries
+
+    def save(self, entries: list[Entry]) -> None:
+        """Save the entries to a new segment."""
+        if not entries:
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        index = len(list(self.path.glob("segment-*.joblib")))
+        segment = self.path / f"segment-{index:06d}.joblib"
+
+        # The segment is written under a temporary name first, so that an
+        # interrupted write never leaves a corrupted segment behind.
+        joblib.dump(entries, temp := segment.with_suffix(".tmp"))
+        temp.replace(segment)
+
+
+def _ion_key(ion: Ion) -> str:
+    return ion.smiles
+
+
+def _ion_properties(ion: Ion) -> dict[str, Any]:
+    return {
+        "smiles": ion.smiles,
+        "type": type(ion).__name__,
+        "charge": ion.charge_number,
+        "organic": ion.is_organic(),
+        "heavy_atoms": ion.heavy_atom_count,
+        "formula": ion.formula,
+        "family": classify_ion(ion),
+    }
+
+
+def _ionic_liquid_key(ionic_liquid: IonicLiquid) -> tuple[str, str]:
+    return ionic_liquid.cation.smiles, ionic_liquid.anion.smiles
+
+
+def _ionic_liquid_properties(ionic_liquid: IonicLiquid) -> dict[str, Any]:
+    stoichiometry = ionic_liquid.stoichiometry
+
+    return {
+        "smiles": ionic_liquid.smiles,
+        "id": ionic_liquid.id,
+        "cations": stoichiometry.cation,
+        "anions": stoichiometry.anion,
+    }
+
+
+def _index_by_entry(entry: Entry) -> pd.DataFrame:
+    """Return a view on the data of an entry, indexed by entry and data point."""
+    data = entry.data.copy(deep=False)
+    data.index = pd.MultiIndex.from_arrays(
+        [np.full(len(data), entry.id, dtype=object), data.index],
+        names=["entry_id", "data_point_id"],
+    )
+
+    return data
+
+
+@cache
+def _validation_version(prepare_entry: Callable[[Entry], None]) -> str:
+    """Return the version of the validation of entries by `prepare_entry`.
+
+    The version changes along with the source code of `prepare_entry`, as well as
+    with the version of the package, which validates the entries before.
+    """
+    try:
+        source = inspect.getsource(prepare_entry)
+    except (OSError, TypeError):
+        source = ""
+
+    return str(
+        joblib.hash(
+            (prepare_entry.__module__, prepare_entry.__qualname__, source, __version__)
+        )
+    )
+
+
+def _failure(entry_id: str, error: EntryError) -> Failure:
+    """Describe an entry that failed validation, by the cause of the error."""
+    return Failure(entry_id, type(error.__cause__ or error).__name__, str(error))
+
+
+@cache
+def _process_dataset(dataset_type: type[Dataset]) -> Dataset:
+    """Return the dataset against which a worker process prepares entries."""
+    return dataset_type()
+
+
+_STAGE_HISTOGRAMS = {
+    "fetch": "get_entry.seconds",
+    "parse": "parse_entry.seconds",
+    "prepare": "prepare_entry.seconds",
+    "dedup": "dedup.seconds",
+}
+"""The histograms recording the durations of the stages of the entries."""
+
+
+class _Reporter:
+    """Reports the progress of the population of a dataset to callbacks."""
+
+    def __init__(
+        self, total: int, callbacks: Iterable[ProgressCallback] | None
+    ) -> None:
+        self.progress = Progress(total)
+        self.callbacks: list[ProgressCallback] = (
+            [TqdmProgress()] if callbacks is None else list(callbacks)
+        )
+
+    def __enter__(self) -> Self:
+        for callback in self.callbacks:
+            callback.on_start(self.progress)
+
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        for callback in self.callbacks:
+            callback.on_end(self.progress)
+
+    def report(self, collected: tuple[Entry | None, EntryEvent]) -> Entry | None:
+        """Report a collected entry and return it, see `Dataset._collect`."""
+        entry, event = collected
+
+        self.progress.update(event)
+
+        for callback in self.callbacks:
+            callback.on_entry(event, self.progress)
+
+        return entry
+
+
+def _make_entry_in_process(
+    dataset_type: type[Dataset], item: tuple[str, ilt.Entry | None, Stats]
+) -> tuple[str, Entry | Failure | None, Stats]:
+    """Create an entry from an ILThermo entry in a worker process.
+
+    Args:
+        dataset_type: The type of the dataset to which the entry belongs.
+        item: The identifier of the entry, the ILThermo entry if retrieved, and
+            the statistics recorded while retrieving it.
+
+    Returns:
+        The outcome of the creation of the entry, see `Dataset._create_entry`.
+    """
+    entry_id, ilt_entry, stats = item
+
+    if ilt_entry is None:
+        return entry_id, None, stats
+
+    return _process_dataset(dataset_type)._create_entry(  # noqa: SLF001
+        entry_id, ilt_entry, stats
+    )
 
 
 @dataclass
 class Dataset(ABC):
     """Abstract base class for datasets."""
 
+    lazy: bool = field(default=False, kw_only=True)
+    """Whether the entries are lazy, see `Entry`.
+
+    Lazy entries are validated against the metadata of the ILThermo entries only,
+    while `prepare_entry` runs when their data are first accessed.
+
+    Lazy mode only saves memory, not retrieval: the ILThermo entries are still
+    retrieved in full when the entries are created, and retrieved again when
+    their data are accessed, from the mirror or the cache if any, or else from
+    ILThermo.
+    """
+
     entries: list[Entry] = field(default_factory=list, init=False, repr=False)
     """The list of entries in the dataset."""
 
-    ionic_liquids: list[IonicLiquid] = field(
-        default_factory=list, init=False, repr=False
+    ionic_liquids: Registry[IonicLiquid] = field(
+        default_factory=partial(
+            Registry, key=_ionic_liquid_key, properties=_ionic_liquid_properties
+        ),
+        init=False,
+        repr=False,
     )
-    """The list of ionic liquids in the dataset"""
+    """The registry of ionic liquids in the dataset.
+
+    Its table holds the SMILES, the ILThermo identifier and the stoichiometry of
+    the ionic liquids, as the `smiles`, `id`, `cations` and `anions` columns.
+    """
 
-    ions: list[Ion | Cation | Anion] = field(
-        default_factory=list, init=False, repr=False
+    ions: Registry[Ion] = field(
+        default_factory=partial(Registry, key=_ion_key, properties=_ion_properties),
+        init=False,
+        repr=False,
     )
-    """The list of ions in the dataset"""
+    """The registry of ions in the dataset.
+
+    Its table holds the SMILES, the type, the formal charge, whether they are
+    organic, the number of heavy atoms, the formula and the family of the ions, as
+    the `smiles`, `type`, `charge`, `organic`, `heavy_atoms`, `formula` and
+    `family` columns. Families are those of `classify_ion`.
+    """
+
+    _data: pd.DataFrame | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """The cached concatenated data from the entries in `_data_sources`."""
+
+    _data_sources: list[tuple[Entry, int]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    """The entries, along with the versions of their data, concatenated into
+    `_data`."""
+
+    _ion_fingerprints: FingerprintIndex = field(
+        default_factory=FingerprintIndex, init=False, repr=False, compare=False
+    )
+    """The fingerprint index of the ions in `ions`, see `ion_fingerprints`."""
+
+    stats: Stats = field(default_factory=Stats, init=False, repr=False, compare=False)
+    """The statistics of the retrieval and preparation of the entries.
+
+    Besides those recorded by `Entry`, the numbers of entries created and failed
+    are counted as `entries.created` and `entries.failed`, and the durations of
+    the deduplication of their ionic liquids are recorded as `dedup.seconds`.
+    Entries failing validation are also counted by reason as `failures.<reason>`,
+    and known failures skipped as `entries.skipped`.
+    """
+
+    @property
+    def ionic_liquid_indices(self) -> pd.Series:
+        """Return the indices of the ionic liquids of the entries.
+
+        Returns:
+            The indices of the ionic liquids in `ionic_liquids`, indexed by the
+            entry IDs.
+        """
+        return pd.Series(
+            [self.ionic_liquids.index(entry.ionic_liquid) for entry in self.entries],
+            index=pd.Index([entry.id for entry in self.entries], name="entry_id"),
+            name="ionic_liquid_id",
+            dtype="int64",
+        )
+
+    @property
+    def ion_indices(self) -> pd.DataFrame:
+        """Return the indices of the ions of the ionic liquids.
+
+        Returns:
+            The indices of the cations and anions in `ions`, indexed by the indices
+            of the ionic liquids in `ionic_liquids`.
+        """
+        return pd.DataFrame(
+            [
+                (
+                    self.ions.index(ionic_liquid.cation),
+                    self.ions.index(ionic_liquid.anion),
+                )
+                for ionic_liquid in self.ionic_liquids
+            ],
+            columns=["cation", "anion"],
+            index=pd.RangeIndex(len(self.ionic_liquids), name="ionic_liquid_id"),
+            dtype="int64",
+        )
+
+    @property
+    def ionic_liquid_families(self) -> pd.DataFrame:
+        """Return the families of the ions of the ionic liquids.
+
+        The families are looked up in the table of `ions`, where each ion is
+        classified once, when registered.
+
+        Returns:
+            The families of the cations and anions, see `classify_ion`, indexed by
+            the indices of the ionic liquids in `ionic_liquids`.
+        """
+        ion_indices = self.ion_indices
+        families = self.ions.table.get("family", pd.Series(dtype=object)).to_numpy()
+
+        return pd.DataFrame(
+            {
+                "cation": families[ion_indices["cation"].to_numpy()],
+                "anion": families[ion_indices["anion"].to_numpy()],
+            },
+            index=ion_indices.index,
+            dtype="category",
+        )
+
+    @property
+    def ion_fingerprints(self) -> FingerprintIndex:
+        """Return the fingerprint index of the ions.
+
+        Ions registered since the last access, e.g. while populating the dataset,
+        are added to the index, so that their fingerprints are computed once.
+
+        Returns:
+            The fingerprint index, in which the position of an ion is its index in
+            `ions`.
+        """
+        if (num_indexed := len(self._ion_fingerprints)) < len(self.ions):
+            self._ion_fingerprints.add(self.ions[num_indexed:])
+
+        return self._ion_fingerprints
+
+    def nearest_ions(self, ions: Iterable[Ion], k: int = 5) -> pd.DataFrame:
+        """Return the registered ions most similar to ions, by fingerprint.
+
+        Cations are compared to the registered cations and anions to the
+        registered anions, by the Tanimoto similarity of their fingerprints, see
+        `ion_fingerprints`.
+
+        Args:
+            ions: The query ions, registered or not.
+            k: The number of neighbours per query ion.
+
+        Returns:
+            The `k` nearest ions of each query ion, by decreasing similarity, with
+            the position of the query ion, the rank of the neighbour, its index in
+            `ions` and its similarity as the `query`, `rank`, `ion_id` and
+            `similarity` columns.
+        """
+        index = self.ion_fingerprints
+        types = self.ions.table.get("type", pd.Series(dtype=object))
+        queries = list(ions)
+        frames = []
+
+        for ion_type in (Cation, Anion):
+            positions = [
+                position
+                for position, ion in enumerate(queries)
+                if isinstance(ion, ion_type)
+            ]
+            neighbours, similarities = index.search(
+                [queries[position] for position in positions],
+                k=k,
+                mask=(types == ion_type.__name__).to_numpy(),
+            )
+
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "query": np.repeat(positions, neighbours.shape[1]),
+                        "rank": np.tile(np.arange(neighbours.shape[1]), len(positions)),
+                        "ion_id": neighbours.ravel(),
+                        "similarity": similarities.ravel(),
+                    }
+                )
+            )
+
+        return (
+            pd.concat(frames, ignore_index=True)
+            .sort_values(["query", "rank"], ignore_index=True)
+            .astype({"query": "int64", "rank": "int64", "ion_id": "int64"})
+        )
 
     @property
     def data(self) -> pd.DataFrame:
         """Concatenate and return the data from all entries in the dataset.
 
+        The concatenated data are cached between accesses, and the data of
+        entries added in the meantime are appended to the cache, copying it once.
+        The cache is rebuilt if an entry was removed or its data replaced, but not
+        if the data of lazy entries were released. Since the returned frame is
+        shared, it should not be modified in place.
+
+        The data of lazy entries are loaded as needed, and those that fail
+        `prepare_entry` are removed and recorded as failures.
+
         Returns:
             The concatenated data from all entries.
 
         Raises:
             DatasetError: If the dataset is empty.
+            EntryFetchError: If the data of a lazy entry cannot be retrieved.
         """
-        if entries := self.entries:
-            return pd.concat(
-                {entry.id: entry.data for entry in entries},
-                names=["entry_id", "data_point_id"],
+        if not self.entries:
+            msg = "dataset is empty"
+
+            raise DatasetError(msg)
+
+        if len(self._data_sources) > len(self.entries) or any(
+            entry is not source_entry or entry._data_version != data_version  # noqa: SLF001
+            for entry, (source_entry, data_version) in zip(
+                self.entries, self._data_sources, strict=False
+            )
+        ):
+            self._data = None
+            self._data_sources.clear()
+
+        self._load_entries(self.entries[len(self._data_sources) :])
+
+        if not (entries := self.entries):
+            msg = "dataset is empty"
+
+            raise DatasetError(msg)
+
+        if new_entries := entries[len(self._data_sources) :]:
+            # The cache and the data of the new entries are concatenated at once, so
+            # that the data of the new entries are copied once.
+            self._data = pd.concat(
+                [
+                    *([] if self._data is None else [self._data]),
+                    *(_index_by_entry(entry) for entry in new_entries),
+                ]
             )
+            self._data_sources.extend(
+                (entry, entry._data_version)  # noqa: SLF001
+                for entry in new_entries
+            )
+
+        return cast(pd.DataFrame, self._data)
+
+    def compact_data(self, float_dtype: str | None = "float32") -> pd.DataFrame:
+        """Return the concatenated data in a compact representation.
+
+        Unlike `data`, the returned frame is flat, as training usually requires.
+        The entry IDs are a categorical column, in the order of the entries, and
+        the ionic liquids of the entries are coded by their indices in
+        `ionic_liquids`. The IDs of the data points and the integer columns are
+        downcast to the smallest integer type holding their values, and the float
+        columns are cast to `float_dtype`.
+
+        Args:
+            float_dtype: The type to which the float columns are cast. If `None`,
+                they are kept as is.
+
+        Returns:
+            The data, with `entry_id`, `ionic_liquid_id` and `data_point_id`
+            columns followed by the columns of the data.
+
+        Raises:
+            DatasetError: If the dataset is empty.
+        """
+        data = self.data
 
-        msg = "dataset is empty"
+        columns: dict[str, Any] = {
+            "entry_id": pd.Categorical(
+                data.index.get_level_values("entry_id"),
+                categories=[entry.id for entry in self.entries],
+            ),
+            "ionic_liquid_id": pd.to_numeric(
+                np.repeat(
+                    self.ionic_liquid_indices.to_numpy(),
+                    [entry.num_data_points for entry in self.entries],
+                ),
+                downcast="integer",
+            ),
+            "data_point_id": pd.to_numeric(
+                data.index.get_level_values("data_point_id").to_numpy(),
+                downcast="integer",
+            ),
+        }
+
+        for column, values in data.items():
+            if values.dtype.kind == "f" and float_dtype is not None:
+                columns[str(column)] = values.to_numpy(dtype=float_dtype)
+            elif values.dtype.kind in "iu":
+                columns[str(column)] = pd.to_numeric(
+                    values.to_numpy(), downcast="integer"
+                )
+            else:
+                columns[str(column)] = values.array
+
+        return pd.DataFrame(columns, copy=False)
+
+    def memory_report(self, float_dtype: str | None = "float32") -> pd.DataFrame:
+        """Return the memory usage of the data and of their compact representation.
+
+        Args:
+            float_dtype: The type to which the float columns of the compact
+                representation are cast, see `compact_data`.
+
+        Returns:
+            The numbers of bytes used by the index and by each column of `data`
+            and `compact_data`, in the `data` and `compact` columns, along with
+            their totals. Columns missing from either are counted as zero bytes.
+
+        Raises:
+            DatasetError: If the dataset is empty.
+        """
+        report = (
+            pd.concat(
+                {
+                    "data": self.data.memory_usage(deep=True),
+                    "compact": self.compact_data(float_dtype).memory_usage(deep=True),
+                },
+                axis=1,
+            )
+            .fillna(0)
+            .astype("int64")
+        )
+        report.loc["Total"] = report.sum()
 
-        raise DatasetError(msg)
+        return report
+
+    @property
+    def failures(self) -> list[Failure]:
+        """Return the entries that failed validation, from the failure log.
+
+        Entries that fail validation, i.e. that raise `EntryError` for reasons
+        other than their retrieval, are recorded in the failure log configured
+        with `ILTHERMO_FAILURE_LOG`, and skipped when populating the dataset
+        afterwards. Failures are recorded for the current `prepare_entry`, so that
+        changing it invalidates them.
+
+        Returns:
+            The failures, or an empty list if no failure log is configured.
+        """
+        if (failure_log := self._open_failure_log()) is None:
+            return []
+
+        return failure_log.get(_validation_version(self.prepare_entry))
+
+    @property
+    def failure_summary(self) -> dict[str, int]:
+        """Return the numbers of entries that failed validation by reason.
+
+        Returns:
+            The numbers of failures in the failure log, by the names of the
+            exceptions that caused them.
+        """
+        if (failure_log := self._open_failure_log()) is None:
+            return {}
+
+        return failure_log.summary(_validation_version(self.prepare_entry))
 
     @staticmethod
     @abstractmethod
@@ -140,35 +1094,616 @@ class Dataset(ABC):
             entry: The entry to prepare.
         """
 
-    def populate(self) -> None:
-        """Populate the dataset with entries."""
+    def populate(
+        self,
+        max_workers: int = 1,
+        checkpoint_dir: str | os.PathLike[str] | None = None,
+        checkpoint_interval: int = 100,
+        max_processes: int | None = None,
+        callbacks: Iterable[ProgressCallback] | None = None,
+    ) -> None:
+        """Populate the dataset with entries.
+
+        Entries are retrieved and prepared by a pool of worker threads, so that
+        waiting for ILThermo responses overlaps. Regardless of the order in which
+        the workers finish, entries are added to the dataset in the order of the
+        entry IDs. Entries already in the dataset are not retrieved again.
+
+        If a checkpoint directory is given, the entries stored there by previous
+        runs are restored first, and the new entries are stored there as they are
+        added. Thus, an interrupted run can be resumed, and a run against a grown
+        list of entry IDs only retrieves and prepares the new entries. Entries are
+        checkpointed under the version of `prepare_entry`, as for the failure log,
+        so that only entries prepared by the current `prepare_entry` are restored,
+        and only those whose IDs are still returned by `get_entry_ids`.
+
+        If a number of processes is given, entries are only retrieved by the
+        worker threads, while they are parsed and prepared by a pool of worker
+        processes, so that CPU-bound preparation overlaps with retrieval and runs
+        on several cores. The worker processes are started by a fork server
+        rather than forked from the current process, which runs threads, so that
+        they do not inherit locks held by those threads. Each worker process
+        prepares entries against its own instance of the dataset class, which
+        must thus be defined at module level of an importable module. The
+        prepared entries are sent back, and their ionic liquids and
+        ions deduplicated by the dataset, as usual.
+
+        The progress is reported to the callbacks as each entry is processed,
+        with the durations of its stages, see `ilthermoml.progress`.
+
+        If requests to ILThermo are suspended by the circuit breaker, the
+        population is aborted, rather than the remaining entries dropped. The
+        entries added so far are kept, and checkpointed, so that the run can be
+        resumed once ILThermo recovers.
+
+        Args:
+            max_workers: The maximum number of entries retrieved concurrently.
+                If greater than one and no processes are used, `prepare_entry`
+                must be thread-safe.
+            checkpoint_dir: The directory in which the entries are checkpointed.
+            checkpoint_interval: The number of new entries between checkpoints.
+            max_processes: The number of processes preparing entries. If `None`,
+                entries are prepared by the worker threads. Ignored if the
+                dataset is lazy, as entries are not prepared then.
+            callbacks: The subscribers to the progress. Defaults to a `tqdm`
+                progress bar.
+
+        Raises:
+            CircuitOpenError: If requests to ILThermo are suspended.
+        """
         entry_ids = self.get_entry_ids()
 
-        for entry_id in tqdm(entry_ids, desc="Populating dataset"):
-            try:
-                entry = Entry(entry_id, dataset=self)
-            except EntryError:
-                continue
-
-            if entry.ionic_liquid not in self.ionic_liquids:
-                if entry.ionic_liquid.cation not in self.ions:
-                    self.ions.append(entry.ionic_liquid.cation)
-                else:
-                    entry.ionic_liquid.cation = cast(
-                        Cation, self.ions[self.ions.index(entry.ionic_liquid.cation)]
-                    )
+        checkpoint = (
+            _Checkpoint(checkpoint_dir, _validation_version(self.prepare_entry))
+            if checkpoint_dir
+            else None
+        )
+        if checkpoint:
+            entry_id_set = set(entry_ids)
 
-                if entry.ionic_liquid.anion not in self.ions:
-                    self.ions.append(entry.ionic_liquid.anion)
-                else:
-                    entry.ionic_liquid.anion = cast(
-                        Anion, self.ions[self.ions.index(entry.ionic_liquid.anion)]
-                    )
+            for checkpointed_entry in self._new_entries(checkpoint.load()):
+                if checkpointed_entry.id in entry_id_set:
+                    self._add_entry(checkpointed_entry)
+
+        new_entries: list[Entry] = []
 
-                self.ionic_liquids.append(entry.ionic_liquid)
+        try:
+            for entry in self._iter_entries(
+                entry_ids, max_workers, max_processes, callbacks
+            ):
+                self.entries.append(entry)
+
+                if checkpoint:
+                    new_entries.append(entry)
+
+                    if len(new_entries) >= checkpoint_interval:
+                        checkpoint.save(new_entries)
+                        new_entries.clear()
+        finally:
+            if checkpoint:
+                checkpoint.save(new_entries)
+
+    def iter_entries(
+        self,
+        max_workers: int = 1,
+        max_processes: int | None = None,
+        callbacks: Iterable[ProgressCallback] | None = None,
+    ) -> Iterator[Entry]:
+        """Retrieve, prepare and yield entries one by one.
+
+        The entries are retrieved as in `populate`, and their ionic liquids and
+        ions are deduplicated against the registries of the dataset, but the
+        entries themselves are not added to the dataset. Thus, entries can be
+        streamed into a sink without holding the whole dataset in memory.
+
+        Args:
+            max_workers: The maximum number of entries retrieved concurrently.
+                If greater than one and no processes are used, `prepare_entry`
+                must be thread-safe.
+            max_processes: The number of processes preparing entries. If `None`,
+                entries are prepared by the worker threads. Ignored if the
+                dataset is lazy, as entries are not prepared then.
+            callbacks: The subscribers to the progress. Defaults to a `tqdm`
+                progress bar.
+
+        Yields:
+            The entries not in the dataset yet, in the order of the entry IDs.
+
+        Raises:
+            CircuitOpenError: If requests to ILThermo are suspended.
+        """
+        return self._iter_entries(
+            self.get_entry_ids(), max_workers, max_processes, callbacks
+        )
+
+    def _iter_entries(
+        self,
+        entry_ids: Iterable[str],
+        max_workers: int,
+        max_processes: int | None,
+        callbacks: Iterable[ProgressCallback] | None,
+    ) -> Iterator[Entry]:
+        """Retrieve, prepare and yield the entries of IDs, see `iter_entries`."""
+        entry_ids = self._new_entry_ids(entry_ids)
+
+        with ExitStack() as stack:
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers))
+
+            # The workers share a session whose pool holds a connection per worker,
+            # so that connections to ILThermo are reused rather than discarded.
+            session = stack.enter_context(create_session(max_workers))
+
+            if max_processes is None or self.lazy:
+                outcomes = _bounded_map(
+                    executor,
+                    partial(self._create_entry, session=session),
+                    entry_ids,
+                    limit=2 * max_workers,
+                )
             else:
-                entry.ionic_liquid = self.ionic_liquids[
-                    self.ionic_liquids.index(entry.ionic_liquid)
+                process_executor = stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_processes,
+                        mp_context=multiprocessing.get_context("forkserver"),
+                    )
+                )
+
+                # Retrieval and preparation are pipelined, so that entries are
+                # prepared by the processes while the next ones are retrieved.
+                ilt_entries = _bounded_map(
+                    executor,
+                    partial(self._fetch_entry, session=session),
+                    entry_ids,
+                    limit=2 * max_workers,
+                )
+                outcomes = _bounded_map(
+                    process_executor,
+                    partial(_make_entry_in_process, type(self)),
+                    ilt_entries,
+                    limit=2 * max_processes,
+                )
+
+            reporter = stack.enter_context(_Reporter(len(entry_ids), callbacks))
+
+            for outcome in outcomes:
+                if (entry := reporter.report(self._collect(outcome))) is not None:
+                    yield entry
+
+    def iter_batches(
+        self,
+        batch_size: int,
+        max_workers: int = 1,
+        max_processes: int | None = None,
+        callbacks: Iterable[ProgressCallback] | None = None,
+    ) -> Iterator[list[Entry]]:
+        """Retrieve, prepare and yield entries in batches.
+
+        This is the batched counterpart of `iter_entries`.
+
+        Args:
+            batch_size: The number of entries in each batch but the last.
+            max_workers: The maximum number of entries retrieved concurrently.
+                If greater than one and no processes are used, `prepare_entry`
+                must be thread-safe.
+            max_processes: The number of processes preparing entries. If `None`,
+                entries are prepared by the worker threads.
+            callbacks: The subscribers to the progress. Defaults to a `tqdm`
+                progress bar.
+
+        Yields:
+            The batches of entries not in the dataset yet.
+
+        Raises:
+            CircuitOpenError: If requests to ILThermo are suspended.
+        """
+        batch: list[Entry] = []
+
+        for entry in self.iter_entries(max_workers, max_processes, callbacks):
+            batch.append(entry)
+
+            if len(batch) == batch_size:
+                yield batch
+
+                batch = []
+
+        if batch:
+            yield batch
+
+    async def apopulate(
+        self,
+        max_concurrency: int = settings.ILTHERMO_MAX_CONCURRENCY,
+        callbacks: Iterable[ProgressCallback] | None = None,
+    ) -> None:
+        """Populate the dataset with entries asynchronously.
+
+        This is the asynchronous counterpart of `populate`. Entries are retrieved
+        using `AsyncEntryClient`, while `get_entry_ids` and the construction and
+        preparation of entries run in worker threads, so that the event loop is
+        never blocked.
+
+        Args:
+            max_concurrency: The maximum number of entries retrieved concurrently.
+                If greater than one, `prepare_entry` must be thread-safe.
+            callbacks: The subscribers to the progress. Defaults to a `tqdm`
+                progress bar.
+
+        Raises:
+            CircuitOpenError: If requests to ILThermo are suspended.
+        """
+        entry_ids = self._new_entry_ids(await asyncio.to_thread(self.get_entry_ids))
+
+        async with AsyncEntryClient(max_concurrency, stats=self.stats) as client:
+            tasks = [
+                asyncio.ensure_future(self._acreate_entry(client, entry_id))
+                for entry_id in entry_ids
+            ]
+
+            # The entries are collected in order as they complete, so that the
+            # registries do not depend on the order of completion. If collecting
+            # fails, the remaining tasks are cancelled before the client is closed.
+            try:
+                with _Reporter(len(entry_ids), callbacks) as reporter:
+                    for task in tasks:
+                        if (
+                            entry := reporter.report(self._collect(await task))
+                        ) is not None:
+                            self.entries.append(entry)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def release(self) -> None:
+        """Release the data of the lazy entries and the concatenated data.
+
+        The data are loaded again when next accessed. The data of entries that are
+        not lazy are kept.
+        """
+        for entry in self.entries:
+            if entry.lazy:
+                entry.release()
+
+        self._data = None
+        self._data_sources.clear()
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Save a snapshot of the dataset.
+
+        The snapshot is a directory holding the data of the entries column by
+        column, as NumPy arrays, along with a JSON manifest describing the entries,
+        the ionic liquids and the ions.
+
+        Args:
+            path: The directory to save the snapshot to.
+
+        Raises:
+            DatasetError: If the dataset is empty or has non-numeric data.
+        """
+        data = self.data
+
+        if non_numeric_columns := [
+            column for column, dtype in data.dtypes.items() if dtype.kind not in "biuf"
+        ]:
+            msg = f"cannot save non-numeric columns {non_numeric_columns!r}"
+
+            raise DatasetError(msg)
+
+        (path := Path(path)).mkdir(parents=True, exist_ok=True)
+
+        for index, column in enumerate(data.columns):
+            np.save(path / f"column-{index}.npy", data[column].to_numpy())
+
+        np.save(
+            path / "data_point_id.npy",
+            data.index.get_level_values("data_point_id").to_numpy(dtype="int64"),
+        )
+
+        manifest = {
+            "columns": list(data.columns),
+            "entries": [
+                {
+                    "id": entry.id,
+                    "ionic_liquid": self.ionic_liquids.index(entry.ionic_liquid),
+                    "size": len(entry.data),
+                }
+                for entry in self.entries
+            ],
+            "ionic_liquids": [
+                {"smiles": ionic_liquid.smiles, "id": ionic_liquid.id}
+                for ionic_liquid in self.ionic_liquids
+            ],
+            "ions": [
+                {"smiles": ion.smiles, "type": type(ion).__name__} for ion in self.ions
+            ],
+        }
+
+        (path / "manifest.json").write_text(json.dumps(manifest))
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], *, mmap: bool = True) -> Self:
+        """Load a snapshot of the dataset saved with `save`.
+
+        By default, the data columns are memory-mapped rather than read, so that
+        processes loading the same snapshot share its pages. The data of the
+        entries, as well as the concatenated data of the dataset, are views on the
+        memory-mapped columns.
+
+        Args:
+            path: The directory to load the snapshot from.
+            mmap: Whether to memory-map the data columns.
+
+        Returns:
+            The dataset.
+        """
+        dataset = cls()
+        dataset._restore(Path(path), mmap=mmap)  # noqa: SLF001
+
+        return dataset
+
+    def _restore(self, path: Path, *, mmap: bool) -> None:
+        """Restore the dataset from a snapshot saved with `save`."""
+        manifest = json.loads((path / "manifest.json").read_text())
+        mmap_mode: Literal["r"] | None = "r" if mmap else None
+
+        # Memory maps are viewed as plain arrays, which pandas handles better.
+        columns = {
+            column: np.asarray(
+                np.load(path / f"column-{index}.npy", mmap_mode=mmap_mode)
+            )
+            for index, column in enumerate(manifest["columns"])
+        }
+        data_point_ids = np.asarray(
+            np.load(path / "data_point_id.npy", mmap_mode=mmap_mode)
+        )
+
+        ion_types = {"Cation": Cation, "Anion": Anion}
+        for ion in manifest["ions"]:
+            self.ions.add(ion_types[ion["type"]](ion["smiles"]))
+
+        for ionic_liquid in manifest["ionic_liquids"]:
+            self._add_ionic_liquid(
+                IonicLiquid(ionic_liquid["smiles"], id=ionic_liquid["id"])
+            )
+
+        start = 0
+        for entry in manifest["entries"]:
+            stop = start + entry["size"]
+
+            self.entries.append(
+                Entry.from_data(
+                    entry["id"],
+                    self.ionic_liquids[entry["ionic_liquid"]],
+                    pd.DataFrame(
+                        {
+                            column: values[start:stop]
+                            for column, values in columns.items()
+                        },
+                        index=pd.Index(data_point_ids[start:stop]),
+                        copy=False,
+                    ),
+                )
+            )
+
+            start = stop
+
+        # The concatenated data are set up as views on the columns as well, as
+        # concatenating the data of the entries would copy them.
+        self._data = pd.DataFrame(
+            columns,
+            index=pd.MultiIndex.from_arrays(
+                [
+                    np.repeat(
+                        np.array(
+                            [entry["id"] for entry in manifest["entries"]], object
+                        ),
+                        [entry["size"] for entry in manifest["entries"]],
+                    ),
+                    data_point_ids,
+                ],
+                names=["entry_id", "data_point_id"],
+            ),
+            copy=False,
+        )
+        self._data_sources = [
+            (entry, entry._data_version)  # noqa: SLF001
+            for entry in self.entries
+        ]
+
+    def _new_entry_ids(self, entry_ids: Iterable[str]) -> list[str]:
+        """Return the entry IDs that are not in the dataset nor known to fail."""
+        existing_entry_ids = {entry.id for entry in self.entries}
+        entry_ids = [
+            entry_id for entry_id in entry_ids if entry_id not in existing_entry_ids
+        ]
+
+        if (failure_log := self._open_failure_log()) is None:
+            return entry_ids
+
+        failed_entry_ids = failure_log.entry_ids(
+            _validation_version(self.prepare_entry)
+        )
+        new_entry_ids = [
+            entry_id for entry_id in entry_ids if entry_id not in failed_entry_ids
+        ]
+
+        if skipped := len(entry_ids) - len(new_entry_ids):
+            self.stats.increment("entries.skipped", skipped)
+
+        return new_entry_ids
+
+    def _new_entries(self, entries: Iterable[Entry]) -> list[Entry]:
+        """Return the entries whose IDs are not in the dataset yet."""
+        existing_entry_ids = {entry.id for entry in self.entries}
+
+        return [entry for entry in entries if entry.id not in existing_entry_ids]
+
+    def _create_entry(
+        self,
+        entry_id: str,
+        ilt_entry: ilt.Entry | None = None,
+        stats: Stats | None = None,
+        session: requests.Session | None = None,
+    ) -> tuple[str, Entry | Failure | None, Stats]:
+        """Create an entry, recording its statistics separately.
+
+        Args:
+            entry_id: The identifier of the entry.
+            ilt_entry: The ILThermo entry, if already retrieved.
+            stats: The statistics recorded for the entry so far, if any.
+            session: The HTTP session retrieving the entry, if not retrieved.
+
+        Returns:
+            The identifier of the entry, the entry, its failure if it failed
+            validation, or `None` if it could not be retrieved, and the statistics
+            recorded while creating it. The outcome is collected with `_collect`.
+
+        Raises:
+            CircuitOpenError: If requests to ILThermo are suspended, so that the
+                population is aborted rather than the entry dropped.
+        """
+        if stats is None:
+            stats = Stats()
+
+        try:
+            entry = Entry(
+                entry_id,
+                dataset=self,
+                ilt_entry=ilt_entry,
+                lazy=self.lazy,
+                stats=stats,
+                session=session,
+            )
+        except CircuitOpenError:
+            raise
+        except EntryFetchError:
+            return entry_id, None, stats
+        except EntryError as e:
+            return entry_id, _failure(entry_id, e), stats
+
+        return entry_id, entry, stats
+
+    def _fetch_entry(
+        self, entry_id: str, session: requests.Session | None = None
+    ) -> tuple[str, ilt.Entry | None, Stats]:
+        """Retrieve an ILThermo entry, or `None` if it cannot be retrieved."""
+        stats = Stats()
+
+        try:
+            return entry_id, GetEntry(entry_id, session=session, stats=stats), stats
+        except CircuitOpenError:
+            raise
+        except Exception:  # noqa: BLE001
+            return entry_id, None, stats
+
+    async def _acreate_entry(
+        self, client: AsyncEntryClient, entry_id: str
+    ) -> tuple[str, Entry | Failure | None, Stats]:
+        """Create an entry asynchronously, see `_create_entry`."""
+        stats = Stats()
+
+        try:
+            ilt_entry = await client.get_entry(entry_id, stats=stats)
+        except CircuitOpenError:
+            raise
+        except EntryError:
+            return entry_id, None, stats
+
+        return await asyncio.to_thread(self._create_entry, entry_id, ilt_entry, stats)
+
+    def _collect(
+        self, outcome: tuple[str, Entry | Failure | None, Stats]
+    ) -> tuple[Entry | None, EntryEvent]:
+        """Collect the outcome of the creation of an entry, see `_create_entry`.
+
+        The ionic liquid and ions of a created entry are deduplicated against the
+        registries, failures are recorded, and the statistics of the entry are
+        merged into those of the dataset.
+
+        Returns:
+            The entry, or `None` if it failed, and the event describing it.
+        """
+        entry_id, entry, stats = outcome
+        reason: str | None = None
+
+        if isinstance(entry, Entry):
+            with stats.time("dedup.seconds"):
+                entry.ionic_liquid = self._add_ionic_liquid(entry.ionic_liquid)
+
+            stats.increment("entries.created")
+        else:
+            if isinstance(entry, Failure):
+                self._record_failure(entry)
+
+            reason = entry.reason if entry else EntryFetchError.__name__
+            stats.increment("entries.failed")
+
+        self.stats.merge(stats)
+
+        event = EntryEvent(
+            entry_id,
+            reason,
+            {
+                stage: histogram.total
+                for stage, name in _STAGE_HISTOGRAMS.items()
+                if (histogram := stats.histograms.get(name)) is not None
+            },
+        )
+
+        return (entry if isinstance(entry, Entry) else None), event
+
+    def _record_failure(self, failure: Failure) -> None:
+        """Record an entry that failed validation."""
+        self.stats.increment(f"failures.{failure.reason}")
+
+        if (failure_log := self._open_failure_log()) is not None:
+            failure_log.add(_validation_version(self.prepare_entry), failure)
+
+    def _open_failure_log(self) -> FailureLog | None:
+        """Open the failure log, or return `None` if none is configured."""
+        if not settings.ILTHERMO_FAILURE_LOG:
+            return None
+
+        return open_failure_log(settings.ILTHERMO_FAILURE_LOG)
+
+    def _load_entries(self, entries: list[Entry]) -> None:
+        """Load the data of entries, removing those failing validation.
+
+        Raises:
+            EntryFetchError: If the data of a lazy entry cannot be retrieved.
+        """
+        failed_entries: set[int] = set()
+
+        try:
+            for entry in entries:
+                try:
+                    _ = entry.data
+                except EntryFetchError:
+                    raise
+                except EntryError as e:
+                    self._record_failure(_failure(entry.id, e))
+                    self.stats.increment("entries.failed")
+
+                    failed_entries.add(id(entry))
+        finally:
+            if failed_entries:
+                self.entries = [
+                    entry for entry in self.entries if id(entry) not in failed_entries
                 ]
 
-            self.entries.append(entry)
+    def _add_entry(self, entry: Entry) -> None:
+        """Add an entry, deduplicating its ionic liquid and ions."""
+        entry.ionic_liquid = self._add_ionic_liquid(entry.ionic_liquid)
+
+        if entry.lazy:
+            entry._dataset = self  # noqa: SLF001
+
+        self.entries.append(entry)
+
+    def _add_ionic_liquid(self, ionic_liquid: IonicLiquid) -> IonicLiquid:
+        """Add an ionic liquid with its ions and return the registered ionic liquid."""
+        if (registered := self.ionic_liquids.add(ionic_liquid)) is ionic_liquid:
+            ionic_liquid.cation = cast(Cation, self.ions.add(ionic_liquid.cation))
+            ionic_liquid.anion = cast(Anion, self.ions.add(ionic_liquid.anion))
+
+        return registered
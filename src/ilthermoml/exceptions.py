@@ -1,10 +1,14 @@
 __all__ = [
     "ChemistryError",
+    "CircuitOpenError",
     "DatasetError",
     "EntryError",
+    "EntryFetchError",
     "ILThermoMLException",
     "InvalidChargeError",
+    "InvalidSmilesError",
     "IonicLiquidCationError",
+    "MissingColumnError",
     "UnsupportedSaltTypeError",
 ]
 
@@ -17,6 +21,18 @@ class EntryError(ILThermoMLException):
     """Exception raised for errors in the entry retrieval."""
 
 
+class EntryFetchError(EntryError):
+    """Exception raised when an entry cannot be retrieved from ILThermo."""
+
+
+class CircuitOpenError(EntryFetchError):
+    """Exception raised when requests to ILThermo are suspended after failures."""
+
+
+class MissingColumnError(EntryError):
+    """Exception raised when a required column is missing from an entry."""
+
+
 class DatasetError(ILThermoMLException):
     """Exception raised for errors in the dataset operations."""
 
@@ -25,6 +41,10 @@ class ChemistryError(ILThermoMLException):
     """Exception raised for errors in the chemistry operations."""
 
 
+class InvalidSmilesError(ChemistryError):
+    """Exception raised for SMILES that cannot be parsed."""
+
+
 class UnsupportedSaltTypeError(ChemistryError):
     """Exception raised for unsupported types of salts."""
 
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import os
+
+__all__ = [
+    "Failure",
+    "FailureLog",
+    "open_failure_log",
+]
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+from . import settings
+
+
+@dataclass(frozen=True)
+class Failure:
+    """Represents an entry that failed validation."""
+
+    entry_id: str
+    """The identifier of the entry."""
+
+    reason: str
+    """The name of the exception that caused the failure."""
+
+    message: str
+    """The message of the error raised for the entry."""
+
+
+class FailureLog:
+    """Persistent record of entries that failed validation.
+
+    Failures are recorded under a version, which identifies the validation that
+    rejected the entries. Failures recorded under other versions are ignored, so
+    that changing the validation invalidates them.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._connection = sqlite3.connect(
+            self.path, timeout=settings.SQLITE_TIMEOUT, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS failures ("
+                "version TEXT NOT NULL, entry_id TEXT NOT NULL, "
+                "reason TEXT NOT NULL, message TEXT NOT NULL, "
+                "created REAL NOT NULL, PRIMARY KEY (version, entry_id))"
+            )
+
+    def add(self, version: str, failure: Failure) -> None:
+        """Record a failure, replacing the one recorded for the entry, if any.
+
+        Args:
+            version: The version of the validation.
+            failure: The failure.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO failures "
+                "(version, entry_id, reason, message, created) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    version,
+                    failure.entry_id,
+                    failure.reason,
+                    failure.message,
+                    time.time(),
+                ),
+            )
+
+    def get(self, version: str) -> list[Failure]:
+        """Return the failures recorded under a version.
+
+        Args:
+            version: The version of the validation.
+
+        Returns:
+            The failures, in the order they were recorded.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT entry_id, reason, message FROM failures "
+                "WHERE version = ? ORDER BY created",
+                (version,),
+            ).fetchall()
+
+        return [Failure(*row) for row in rows]
+
+    def entry_ids(self, version: str) -> set[str]:
+        """Return the identifiers of the entries failed under a version."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT entry_id FROM failures WHERE version = ?", (version,)
+            ).fetchall()
+
+        return {row[0] for row in rows}
+
+    def summary(self, version: str) -> dict[str, int]:
+        """Return the numbers of failures recorded under a version by reason."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT reason, COUNT(*) FROM failures WHERE version = ? "
+                "GROUP BY reason ORDER BY reason",
+                (version,),
+            ).fetchall()
+
+        return dict(rows)
+
+    def clear(self, version: str | None = None) -> None:
+        """Remove the failures recorded under a version, or all of them.
+
+        Args:
+            version: The version of the validation. If `None`, all failures are
+                removed.
+        """
+        with self._lock, self._connection:
+            if version is None:
+                self._connection.execute("DELETE FROM failures")
+            else:
+                self._connection.execute(
+                    "DELETE FROM failures WHERE version = ?", (version,)
+                )
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        self._connection.close()
+
+
+@cache
+def open_failure_log(path: Path) -> FailureLog:
+    """Open a failure log, reusing the one already opened for the same path.
+
+    Args:
+        path: The path of the failure log database.
+
+    Returns:
+        The failure log.
+    """
+    return FailureLog(path)
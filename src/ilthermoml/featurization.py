@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from functools import cached_property
 from typing import Any
 
 import padelpy  # type: ignore [import-untyped]
@@ -8,15 +9,30 @@ from rdkit.Chem.Descriptors import CalcMolDescriptors
 from .chemistry import Molecule, Salt
 from .exceptions import FeaturizerError
 from .memory import ilt_memory
+from .stats import Stats
 
 padel_calc_descriptors = ilt_memory.cache(padelpy.from_smiles)
 
 
 class MoleculeFeaturizer(ABC):
-    """Abstract class describing molecule featurizers."""
+    """Abstract class describing molecule featurizers.
+
+    The durations of the featurizations are recorded in `stats` as
+    `featurize.seconds`.
+    """
+
+    @cached_property
+    def stats(self) -> Stats:
+        """Return the statistics of the featurizer, created on first access.
+
+        Since the statistics are not created by `__init__`, subclasses need not
+        call it.
+        """
+        return Stats()
 
     def __call__(self, molecule: Molecule) -> dict[str, Any]:
-        descriptors = self._featurize(molecule)
+        with self.stats.time("featurize.seconds"):
+            descriptors = self._featurize(molecule)
 
         if any(
             [
@@ -43,7 +59,19 @@ class RDKitMoleculeFeaturizer(MoleculeFeaturizer):
 
 
 class PadelMoleculeFeaturizer(MoleculeFeaturizer):
-    """Molecule featurizer class for calculating descriptors using padel."""
+    """Molecule featurizer class for calculating descriptors using padel.
+
+    The statistics of the persistent descriptor cache, which is shared by all
+    instances, are attached to `stats` as `padel_calc_descriptors`.
+    """
+
+    @cached_property
+    def stats(self) -> Stats:
+        """Return the statistics of the featurizer, created on first access."""
+        stats = Stats()
+        stats.add_child("padel_calc_descriptors", padel_calc_descriptors.stats)
+
+        return stats
 
     def _featurize(self, molecule: Molecule) -> dict[str, Any]:
         descriptors = padel_calc_descriptors(molecule.smiles)
@@ -53,19 +81,32 @@ class PadelMoleculeFeaturizer(MoleculeFeaturizer):
             except ValueError:
                 continue
 
-        return descriptors  # type: ignore [no-any-return]
+        return descriptors
 
 
 class CachingMoleculeFeaturizer(MoleculeFeaturizer):
-    """Wrapper molecule featurizer class that caches calculated descriptors."""
+    """Wrapper molecule featurizer class that caches calculated descriptors.
+
+    Cache hits and misses are counted in `stats` as `cache.hits` and
+    `cache.misses`, and the statistics of the wrapped featurizer are attached to
+    it as `featurizer`, if it is a `MoleculeFeaturizer`.
+    """
 
     def __init__(self, featurizer: MoleculeFeaturizer) -> None:
+        super().__init__()
+
         self._inner_featurize = featurizer
         self._cache: dict[str, dict[str, Any]] = {}
 
+        if isinstance(featurizer, MoleculeFeaturizer):
+            self.stats.add_child("featurizer", featurizer.stats)
+
     def _featurize(self, molecule: Molecule) -> dict[str, Any]:
         if molecule.smiles not in self._cache:
+            self.stats.increment("cache.misses")
             self._cache[molecule.smiles] = self._inner_featurize(molecule)
+        else:
+            self.stats.increment("cache.hits")
         return self._cache[molecule.smiles]
 
 
@@ -80,6 +121,11 @@ class SaltFeaturizer:
         self.combination_rule = combination_rule
         self.featurize = CachingMoleculeFeaturizer(featurize)
 
+    @property
+    def stats(self) -> Stats:
+        """Return the statistics of the caching molecule featurizer."""
+        return self.featurize.stats
+
     def __call__(self, salt: Salt) -> dict[str, Any]:
         cation_features = self.featurize(salt.cation)
         anion_features = self.featurize(salt.anion)
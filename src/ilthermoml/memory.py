@@ -1,6 +1,392 @@
-from joblib import Memory
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Generic, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+__all__ = [
+    "Cache",
+    "CachedFunction",
+    "DiskCache",
+    "NullCache",
+    "create_cache",
+    "ilt_memory",
+]
+
+import functools
+import inspect
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import joblib
 
 from . import settings
+from .stats import Stats
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_ACCESS_BATCH_SIZE = 64
+"""The number of accesses to values recorded in memory before being written."""
+
+
+class Cache(ABC):
+    """Abstract base class for cache backends.
+
+    Values are stored by string keys. Functions are memoized with `cache`, which
+    mirrors `joblib.Memory.cache`.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Any:  # noqa: ANN401
+        """Return the value stored by a key.
+
+        Args:
+            key: The key of the value.
+
+        Returns:
+            The value.
+
+        Raises:
+            KeyError: If no value is stored by the key.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Store a value by a key, replacing the value stored by it, if any.
+
+        Args:
+            key: The key of the value.
+            value: The value.
+        """
+
+    def cache(
+        self, func: Callable[P, R], ignore: Iterable[str] = ()
+    ) -> CachedFunction[P, R]:
+        """Memoize a function.
+
+        Args:
+            func: The function to memoize.
+            ignore: The names of the arguments that do not affect the result.
+
+        Returns:
+            The memoized function.
+        """
+        return CachedFunction(self, func, ignore)
+
+
+class CachedFunction(Generic[P, R]):
+    """Function memoized in a cache.
+
+    Calls are keyed by the qualified name and the source code of the function,
+    along with the hash of its arguments, so that results are invalidated when the
+    function changes.
+
+    Cache hits and misses are counted in `stats`, as `cache.hits` and
+    `cache.misses`, and the durations of the calls are recorded as
+    `cache.hit_seconds` and `cache.miss_seconds`.
+    """
+
+    def __init__(
+        self, cache: Cache, func: Callable[P, R], ignore: Iterable[str] = ()
+    ) -> None:
+        self.cache = cache
+        self.func = func
+        self.ignore = frozenset(ignore)
+        self.stats = Stats()
+
+        self._signature = inspect.signature(func)
+
+        try:
+            source = inspect.getsource(func)
+        except (OSError, TypeError):
+            source = ""
+
+        self._prefix = f"{func.__module__}.{func.__qualname__}:{joblib.hash(source)}"
+
+        functools.update_wrapper(self, func)
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        return self.call_cached(*args, **kwargs)[0]
+
+    def call_cached(self, *args: P.args, **kwargs: P.kwargs) -> tuple[R, bool]:
+        """Call the function through the cache.
+
+        Returns:
+            The result of the call, and whether it was retrieved from the cache.
+        """
+        start = time.perf_counter()
+        key = self._key(*args, **kwargs)
+
+        try:
+            result = self.cache.get(key)
+        except KeyError:
+            self.cache.set(key, result := self.func(*args, **kwargs))
+            cached = False
+        else:
+            cached = True
+
+        self.stats.increment("cache.hits" if cached else "cache.misses")
+        self.stats.observe(
+            "cache.hit_seconds" if cached else "cache.miss_seconds",
+            time.perf_counter() - start,
+        )
+
+        return result, cached
+
+    def refresh(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        """Call the function, bypassing the cache, and cache the result.
+
+        Returns:
+            The result of the call.
+        """
+        self.cache.set(self._key(*args, **kwargs), result := self.func(*args, **kwargs))
+        self.stats.increment("cache.refreshes")
+
+        return result
+
+    def check_call_in_cache(self, *args: P.args, **kwargs: P.kwargs) -> bool:
+        """Return `True` if the result of a call is cached, `False` otherwise."""
+        try:
+            self.cache.get(self._key(*args, **kwargs))
+        except KeyError:
+            return False
+
+        return True
+
+    def _key(self, *args: Any, **kwargs: Any) -> str:  # noqa: ANN401
+        bound_arguments = self._signature.bind(*args, **kwargs)
+        bound_arguments.apply_defaults()
+
+        arguments = {
+            name: value
+            for name, value in bound_arguments.arguments.items()
+            if name not in self.ignore
+        }
+
+        return f"{self._prefix}:{joblib.hash(arguments)}"
+
+
+class NullCache(Cache):
+    """Cache backend that stores nothing."""
+
+    def get(self, key: str) -> Any:  # noqa: ANN401
+        raise KeyError(key)
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        pass
+
+
+class DiskCache(Cache):
+    """Size-bounded cache backend stored in a SQLite database.
+
+    Values are pickled and optionally compressed. Once the total size of the
+    values exceeds the limit, the least recently used ones are evicted, and values
+    older than the time to live are evicted as well. The database can be shared
+    by several processes, each opening its own connection.
+
+    The total size of the values is kept up to date by triggers in a one-row
+    table, so that it is not summed on every write. Accesses to values are
+    recorded in memory and written in batches, along with the next write or every
+    `_ACCESS_BATCH_SIZE` accesses, so that reads do not take the write lock of the
+    database. Thus, the order of eviction only approximates the order of the
+    accesses of other processes.
+    """
+
+    def __init__(
+        self,
+        location: str | os.PathLike[str],
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        compression: int = 0,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            location: The directory of the cache database.
+            max_bytes: The maximum total size of the values. Unlimited if `None`.
+            ttl: The time to live of the values, in seconds. Unlimited if `None`.
+            compression: The zlib compression level; values are not compressed
+                if zero.
+        """
+        self.path = Path(location) / "cache.db"
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.compression = compression
+
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        self._accesses: dict[str, float] = {}
+
+    def get(self, key: str) -> Any:  # noqa: ANN401
+        now = time.time()
+
+        with self._lock, self._connect() as connection:
+            row = connection.execute(
+                "SELECT value, compressed, created FROM items WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and self.ttl is not None and row[2] + self.ttl < now:
+                connection.execute("DELETE FROM items WHERE key = ?", (key,))
+
+                row = None
+            elif row is not None:
+                self._accesses[key] = now
+
+                if len(self._accesses) >= _ACCESS_BATCH_SIZE:
+                    self._write_accesses(connection)
+
+        if row is None:
+            raise KeyError(key)
+
+        value, compressed, _ = row
+
+        return pickle.loads(zlib.decompress(value) if compressed else value)  # noqa: S301
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        now = time.time()
+
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if compressed := self.compression > 0:
+            data = zlib.compress(data, self.compression)
+
+        with self._lock, self._connect() as connection:
+            self._accesses.pop(key, None)
+            self._write_accesses(connection)
+
+            # Replaced values are updated rather than deleted and inserted again,
+            # so that the triggers keeping the total size run.
+            connection.execute(
+                "INSERT INTO items (key, value, compressed, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value, "
+                "compressed = excluded.compressed, size = excluded.size, "
+                "created = excluded.created, accessed = excluded.accessed",
+                (key, data, compressed, len(data), now, now),
+            )
+
+            self._evict(connection, now)
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        with self._lock, self._connect() as connection:
+            self._accesses.clear()
+            connection.execute("DELETE FROM items")
+
+    @property
+    def size(self) -> int:
+        """Return the total size of the values in the cache."""
+        with self._lock, self._connect() as connection:
+            return self._size(connection)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections must not be shared with child processes, so a new one is
+        # opened whenever the cache is used by a different process.
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            self._connection = sqlite3.connect(
+                self.path, timeout=settings.SQLITE_TIMEOUT, check_same_thread=False
+            )
+            self._pid = os.getpid()
+
+            with self._connection as connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS items ("
+                    "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                    "compressed INTEGER NOT NULL, size INTEGER NOT NULL, "
+                    "created REAL NOT NULL, accessed REAL NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS items_accessed ON items (accessed)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS items_created ON items (created)"
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS total ("
+                    "id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL)"
+                )
+                connection.execute(
+                    "INSERT OR IGNORE INTO total (id, size) "
+                    "SELECT 0, COALESCE(SUM(size), 0) FROM items"
+                )
+                connection.execute(
+                    "CREATE TRIGGER IF NOT EXISTS items_insert AFTER INSERT ON items "
+                    "BEGIN UPDATE total SET size = size + new.size; END"
+                )
+                connection.execute(
+                    "CREATE TRIGGER IF NOT EXISTS items_update "
+                    "AFTER UPDATE OF size ON items "
+                    "BEGIN UPDATE total SET size = size + new.size - old.size; END"
+                )
+                connection.execute(
+                    "CREATE TRIGGER IF NOT EXISTS items_delete AFTER DELETE ON items "
+                    "BEGIN UPDATE total SET size = size - old.size; END"
+                )
+
+        return self._connection
+
+    def _size(self, connection: sqlite3.Connection) -> int:
+        (size,) = connection.execute("SELECT size FROM total").fetchone()
+
+        return int(size)
+
+    def _write_accesses(self, connection: sqlite3.Connection) -> None:
+        connection.executemany(
+            "UPDATE items SET accessed = ? WHERE key = ?",
+            [(accessed, key) for key, accessed in self._accesses.items()],
+        )
+        self._accesses.clear()
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        if self.ttl is not None:
+            connection.execute("DELETE FROM items WHERE created < ?", (now - self.ttl,))
+
+        if self.max_bytes is None:
+            return
+
+        if (size := self._size(connection)) <= self.max_bytes:
+            return
+
+        evicted_keys = []
+        for key, item_size in connection.execute(
+            "SELECT key, size FROM items ORDER BY accessed"
+        ):
+            if size <= self.max_bytes:
+                break
+
+            evicted_keys.append((key,))
+            size -= item_size
+
+        connection.executemany("DELETE FROM items WHERE key = ?", evicted_keys)
+
+
+def create_cache() -> Cache:
+    """Create the cache backend configured in the settings.
+
+    Returns:
+        The cache backend.
+    """
+    if settings.CACHE_BACKEND == "null":
+        return NullCache()
+
+    return DiskCache(
+        settings.CACHE_LOCATION,
+        max_bytes=settings.CACHE_MAX_BYTES,
+        ttl=settings.CACHE_TTL,
+        compression=settings.CACHE_COMPRESSION,
+    )
+
 
-ilt_memory = Memory(location=".ilt_cache", verbose=settings.JOBLIB_CACHE_VERBOSITY)
-"""Memory object for caching ILThermo data."""
+ilt_memory = create_cache()
+"""Cache for ILThermo data and molecular descriptors."""
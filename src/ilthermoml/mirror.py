@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable
+
+__all__ = [
+    "Mirror",
+    "open_mirror",
+]
+
+import json
+import sqlite3
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from pathlib import Path
+
+import ilthermopy as ilt
+import requests
+from tqdm import tqdm
+
+from . import settings
+from .client import create_session, get_entry_data
+
+
+class Mirror:
+    """Local mirror of ILThermo entries.
+
+    The mirror is a single SQLite database holding the raw ILThermo responses,
+    compressed and indexed by the entry IDs. Once populated, it allows entries to
+    be retrieved without contacting ILThermo.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._connection = sqlite3.connect(
+            self.path, timeout=settings.SQLITE_TIMEOUT, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(id TEXT PRIMARY KEY, response BLOB NOT NULL)"
+            )
+
+    def get(self, entry_id: str) -> dict[str, Any] | None:
+        """Return the mirrored response for an entry.
+
+        Args:
+            entry_id: The identifier of the entry.
+
+        Returns:
+            The ILThermo response, or `None` if the entry is not mirrored.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response FROM entries WHERE id = ?", (entry_id,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return json.loads(zlib.decompress(row[0]))  # type: ignore [no-any-return]
+
+    def put(self, entry_id: str, response: dict[str, Any]) -> None:
+        """Store the response for an entry, replacing the mirrored one, if any.
+
+        Args:
+            entry_id: The identifier of the entry.
+            response: The ILThermo response.
+        """
+        blob = zlib.compress(json.dumps(response).encode())
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries (id, response) VALUES (?, ?)",
+                (entry_id, blob),
+            )
+
+    def entry_ids(self) -> list[str]:
+        """Return the identifiers of the mirrored entries."""
+        with self._lock:
+            rows = self._connection.execute("SELECT id FROM entries").fetchall()
+
+        return [row[0] for row in rows]
+
+    def download(
+        self,
+        entry_ids: Iterable[str],
+        max_workers: int = settings.ILTHERMO_MAX_CONCURRENCY,
+    ) -> list[str]:
+        """Download the entries that are not mirrored yet.
+
+        Entries that cannot be retrieved are skipped, so that they are attempted
+        again by the next download. If requests to ILThermo are suspended by the
+        circuit breaker, the download is aborted instead, rather than skipping all
+        the remaining entries. The entries downloaded so far are kept.
+
+        Args:
+            entry_ids: The identifiers of the entries.
+            max_workers: The maximum number of entries retrieved concurrently.
+
+        Returns:
+            The identifiers of the entries downloaded.
+
+        Raises:
+            CircuitOpenError: If requests to ILThermo are suspended.
+        """
+        mirrored_entry_ids = set(self.entry_ids())
+        entry_ids = [
+            entry_id
+            for entry_id in dict.fromkeys(entry_ids)
+            if entry_id not in mirrored_entry_ids
+        ]
+
+        def download_entry(entry_id: str) -> bool:
+            try:
+                response = get_entry_data(entry_id, session=session)
+            except requests.RequestException:
+                return False
+
+            self.put(entry_id, response)
+
+            return True
+
+        with (
+            create_session(max_workers) as session,
+            ThreadPoolExecutor(max_workers) as executor,
+        ):
+            downloaded = list(
+                tqdm(
+                    executor.map(download_entry, entry_ids),
+                    total=len(entry_ids),
+                    desc="Downloading entries",
+                )
+            )
+
+        return [
+            entry_id
+            for entry_id, is_downloaded in zip(entry_ids, downloaded, strict=True)
+            if is_downloaded
+        ]
+
+    def download_property(
+        self,
+        prop: str,
+        max_workers: int = settings.ILTHERMO_MAX_CONCURRENCY,
+    ) -> list[str]:
+        """Download the entries of a property that are not mirrored yet.
+
+        Args:
+            prop: The name of the property, as listed by ILThermo.
+            max_workers: The maximum number of entries retrieved concurrently.
+
+        Returns:
+            The identifiers of the entries downloaded.
+        """
+        return self.download(ilt.Search(prop=prop)["id"], max_workers=max_workers)
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        self._connection.close()
+
+    def __contains__(self, entry_id: object) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM entries WHERE id = ?", (entry_id,)
+            ).fetchone()
+
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()
+
+        return int(count)
+
+
+@cache
+def open_mirror(path: Path) -> Mirror:
+    """Open a mirror, reusing the one already opened for the same path.
+
+    Args:
+        path: The path of the mirror database.
+
+    Returns:
+        The mirror.
+    """
+    return Mirror(path)
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from typing import Any
+
+__all__ = [
+    "STAGES",
+    "EntryEvent",
+    "Progress",
+    "ProgressCallback",
+    "TqdmProgress",
+]
+
+import time
+from dataclasses import dataclass, field
+
+from tqdm import tqdm
+
+STAGES = ("fetch", "parse", "prepare", "dedup")
+"""The stages of the creation of an entry, in order.
+
+- `fetch`: the retrieval of the ILThermo entry, see `GetEntry`.
+- `parse`: the validation of its components and the parsing of its ionic liquid.
+- `prepare`: the preparation of the entry, see `Dataset.prepare_entry`.
+- `dedup`: the deduplication of its ionic liquid and ions by the dataset.
+"""
+
+
+@dataclass(frozen=True)
+class EntryEvent:
+    """Describes an entry processed while populating a dataset."""
+
+    entry_id: str
+    """The identifier of the entry."""
+
+    reason: str | None = None
+    """The name of the exception the entry failed with, or `None` if created."""
+
+    timings: dict[str, float] = field(default_factory=dict)
+    """The durations of the stages the entry went through, in seconds."""
+
+    @property
+    def failed(self) -> bool:
+        """Return whether the entry failed to be created."""
+        return self.reason is not None
+
+
+@dataclass
+class Progress:
+    """Aggregate progress of the population of a dataset."""
+
+    total: int
+    """The number of entries to process."""
+
+    completed: int = 0
+    """The number of entries processed, whether created or failed."""
+
+    failed: int = 0
+    """The number of entries that failed to be created."""
+
+    stage_seconds: dict[str, float] = field(
+        default_factory=lambda: dict.fromkeys(STAGES, 0.0)
+    )
+    """The total durations of the stages of the entries processed, in seconds."""
+
+    start: float = field(default_factory=time.perf_counter)
+    """The time at which the population started, from `time.perf_counter`."""
+
+    @property
+    def elapsed(self) -> float:
+        """Return the time elapsed since the population started, in seconds."""
+        return time.perf_counter() - self.start
+
+    @property
+    def throughput(self) -> float:
+        """Return the number of entries processed per second."""
+        return self.completed / elapsed if (elapsed := self.elapsed) > 0 else 0.0
+
+    def update(self, event: EntryEvent) -> None:
+        """Account for a processed entry.
+
+        Args:
+            event: The event describing the entry.
+        """
+        self.completed += 1
+        self.failed += event.failed
+
+        for stage, seconds in event.timings.items():
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the progress as a JSON-serializable dictionary."""
+        return {
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "stage_seconds": dict(self.stage_seconds),
+        }
+
+
+class ProgressCallback:
+    """Base class for subscribers to the progress of the population of a dataset.
+
+    Callbacks are called from the thread iterating over the entries, in the order
+    of the entry IDs. The methods do nothing by default, so that subscribers only
+    override the ones they need.
+    """
+
+    def on_start(self, progress: Progress) -> None:
+        """Handle the start of the population.
+
+        Args:
+            progress: The progress, with nothing processed yet.
+        """
+
+    def on_entry(self, event: EntryEvent, progress: Progress) -> None:
+        """Handle a processed entry.
+
+        Args:
+            event: The event describing the entry.
+            progress: The progress, accounting for the entry.
+        """
+
+    def on_end(self, progress: Progress) -> None:
+        """Handle the end of the population, even if interrupted.
+
+        Args:
+            progress: The final progress.
+        """
+
+
+class TqdmProgress(ProgressCallback):
+    """Subscriber displaying the progress as a `tqdm` progress bar."""
+
+    def __init__(self, desc: str = "Populating dataset") -> None:
+        """Initialize the subscriber.
+
+        Args:
+            desc: The description of the progress bar.
+        """
+        self.desc = desc
+        self._bar: tqdm[Any] | None = None
+
+    def on_start(self, progress: Progress) -> None:
+        self._bar = tqdm(total=progress.total, desc=self.desc)
+
+    def on_entry(self, event: EntryEvent, progress: Progress) -> None:  # noqa: ARG002
+        if self._bar is not None:
+            self._bar.set_postfix(failed=progress.failed, refresh=False)
+            self._bar.update()
+
+    def on_end(self, progress: Progress) -> None:  # noqa: ARG002
+        if self._bar is not None:
+            self._bar.close()
+            self._bar = None
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+__all__ = [
+    "Registry",
+]
+
+import sys
+from collections.abc import Callable, Hashable, Iterator, Mapping, Sequence
+from typing import Any, TypeVar, cast, overload
+
+import pandas as pd
+
+T = TypeVar("T")
+
+
+class Registry(Sequence[T]):
+    """Ordered collection of unique items.
+
+    Items are identified by a key computed from each item, and kept in the order
+    of their registration. Both membership tests and index lookups are performed
+    by key in constant time, so the position of an item can be used as its integer
+    index, e.g. for rows of feature matrices.
+
+    Properties of the items can be computed once, as they are registered, and
+    stored in columns, so that they can be queried and filtered as a table.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[T], Hashable],
+        properties: Callable[[T], Mapping[str, Any]] | None = None,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            key: The function computing the key of an item.
+            properties: The function computing the properties of an item, by name.
+                It must return the same names for all items.
+        """
+        self._key = key
+        self._properties = properties
+        self._items: list[T] = []
+        self._indices: dict[Hashable, int] = {}
+        self._columns: dict[str, list[Any]] = {}
+        self._table: pd.DataFrame | None = None
+
+    def add(self, item: T) -> T:
+        """Register an item unless an item with the same key is already registered.
+
+        Args:
+            item: The item to register.
+
+        Returns:
+            The registered item with the key of `item`.
+        """
+        if (index := self._indices.get(key := self._key(item))) is not None:
+            return self._items[index]
+
+        if self._properties is not None:
+            for name, value in self._properties(item).items():
+                self._columns.setdefault(name, []).append(value)
+
+            self._table = None
+
+        self._indices[key] = len(self._items)
+        self._items.append(item)
+
+        return item
+
+    @property
+    def table(self) -> pd.DataFrame:
+        """Return the properties of the items, computed when they were registered.
+
+        The table is cached until another item is registered, so it should not be
+        modified in place.
+
+        Returns:
+            The properties of the items, one column per property, indexed by the
+            indices of the items.
+        """
+        if self._table is None:
+            self._table = pd.DataFrame(
+                self._columns, index=pd.RangeIndex(len(self._items))
+            )
+
+        return self._table
+
+    def get(self, key: Hashable) -> T | None:
+        """Return the item registered with a key, or `None` if there is no such item.
+
+        Args:
+            key: The key of the item.
+
+        Returns:
+            The item registered with the key.
+        """
+        if (index := self._indices.get(key)) is not None:
+            return self._items[index]
+
+        return None
+
+    def index(self, value: object, start: int = 0, stop: int = sys.maxsize) -> int:
+        """Return the index of the item with the same key as `value`.
+
+        Args:
+            value: The item to look up.
+            start: The start of the index range to search.
+            stop: The end of the index range to search.
+
+        Returns:
+            The index of the item.
+
+        Raises:
+            ValueError: If no such item is registered within the index range.
+        """
+        index = self._lookup(value)
+
+        if index is None or not start <= index < stop:
+            msg = f"{value!r} is not registered"
+
+            raise ValueError(msg)
+
+        return index
+
+    def __contains__(self, value: object) -> bool:
+        return self._lookup(value) is not None
+
+    def _lookup(self, value: object) -> int | None:
+        """Return the index of the item with the same key as `value`, if any.
+
+        Objects whose key cannot be computed, e.g. of another type, are not
+        registered.
+        """
+        try:
+            return self._indices.get(self._key(cast(T, value)))
+        except (AttributeError, TypeError):
+            return None
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | Sequence[T]:
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._items!r})"
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = [
+    "MAX_COMPONENTS",
+    "search",
+    "search_entry_ids",
+]
+
+import time
+from collections.abc import Collection
+
+import ilthermopy as ilt
+import numpy as np
+
+from . import settings
+from .memory import ilt_memory
+
+MAX_COMPONENTS = 3
+"""The maximum number of components of ILThermo entries."""
+
+
+def _search(prop: str) -> tuple[float, pd.DataFrame]:
+    return time.time(), ilt.Search(prop=prop)
+
+
+_cached_search = ilt_memory.cache(_search)
+
+_searches: dict[str, tuple[float, pd.DataFrame]] = {}
+"""The indexed search results by property, along with the time of the search."""
+
+
+def _is_fresh(searched_at: float) -> bool:
+    return time.time() - searched_at < settings.ILTHERMO_SEARCH_TTL
+
+
+def search(prop: str, *, refresh: bool = False) -> pd.DataFrame:
+    """Return the ILThermo entries of a property, indexed for querying.
+
+    The search results are cached on disk and kept in memory, so that ILThermo is
+    queried once per property, until the results are older than
+    `ILTHERMO_SEARCH_TTL` seconds, one day by default, or a refresh is requested.
+    Thus, new ILThermo entries are eventually found, e.g. by incremental runs of
+    `Dataset.populate` against a grown list of entry IDs. The results are kept
+    along with the derived columns:
+
+    - `cmp1_num_ions` to `cmp3_num_ions`: the numbers of ions of the components,
+      that is of dot-separated fragments in their SMILES, or `<NA>` if the SMILES
+      of the component is unknown.
+
+    The `property` and `phases` columns are categorical, so that filtering on them
+    compares integer codes rather than strings.
+
+    Args:
+        prop: The name of the property, as listed by ILThermo.
+        refresh: Whether to query ILThermo again, bypassing both caches.
+
+    Returns:
+        The search results. The data frame is shared between calls and must not be
+        modified.
+    """
+    if not refresh and (memo := _searches.get(prop)) and _is_fresh(memo[0]):
+        return memo[1]
+
+    if refresh or not _is_fresh((searched := _cached_search(prop))[0]):
+        searched = _cached_search.refresh(prop)
+
+    searched_at, results = searched
+
+    results = results.copy()
+
+    for i in range(1, MAX_COMPONENTS + 1):
+        if (column := f"cmp{i}_smiles") in results:
+            results[f"cmp{i}_num_ions"] = (
+                results[column].str.count(r"\.").add(1).astype("Int8")
+            )
+
+    results = results.astype(
+        {
+            column: "category"
+            for column in ("property", "phases")
+            if column in results.columns
+        }
+    )
+    _searches[prop] = searched_at, results
+
+    return results
+
+
+def search_entry_ids(
+    prop: str,
+    limit: int | None = None,
+    *,
+    refresh: bool = False,
+    **conditions: object,
+) -> list[str]:
+    """Return the identifiers of the ILThermo entries of a property that match.
+
+    Entries are filtered in memory, on the results of `search`, so that building
+    the entry lists of many datasets queries ILThermo once per property.
+
+    Args:
+        prop: The name of the property, as listed by ILThermo.
+        limit: The maximum number of identifiers returned. Unlimited if `None`.
+        refresh: Whether to query ILThermo again, see `search`.
+        conditions: The values of the columns of the matching entries. Columns
+            matched against a list, tuple or set match any of its values.
+
+    Returns:
+        The identifiers of the matching entries, in the order of the search.
+
+    Raises:
+        KeyError: If a column of the conditions does not exist.
+    """
+    if (results := search(prop, refresh=refresh)).empty:
+        return []
+
+    mask = np.ones(len(results), dtype=bool)
+
+    for column, value in conditions.items():
+        values = results[column]
+
+        matches = (
+            values.isin(value)
+            if isinstance(value, Collection) and not isinstance(value, str)
+            else values == value
+        )
+
+        mask &= matches.to_numpy(dtype=bool, na_value=False)
+
+    entry_ids: list[str] = results["id"].to_numpy()[mask][:limit].tolist()
+
+    return entry_ids
@@ -1,8 +1,53 @@
-from environs import env
+from pathlib import Path
+
+from environs import env, validate
 
 env.read_env()
 
 
-# Joblib
+# Cache
+
+CACHE_BACKEND = env.str(
+    "CACHE_BACKEND", default="disk", validate=validate.OneOf(["disk", "null"])
+)
+CACHE_LOCATION = env.path(
+    "CACHE_LOCATION",
+    default=env.path("XDG_CACHE_HOME", default=Path.home() / ".cache") / "ilthermoml",
+)
+CACHE_MAX_BYTES = env.int("CACHE_MAX_BYTES", default=2**30)
+CACHE_TTL = env.float("CACHE_TTL", default=None)
+CACHE_COMPRESSION = env.int(
+    "CACHE_COMPRESSION", default=6, validate=validate.Range(min=0, max=9)
+)
+
+
+# ILThermo
+
+ILTHERMO_DATA_URL = env.str(
+    "ILTHERMO_DATA_URL", default="https://ilthermo.boulder.nist.gov/ILT2/ilset"
+)
+ILTHERMO_TIMEOUT = env.float("ILTHERMO_TIMEOUT", default=30.0)
+ILTHERMO_MAX_CONCURRENCY = env.int("ILTHERMO_MAX_CONCURRENCY", default=8)
+ILTHERMO_MIRROR = env.path("ILTHERMO_MIRROR", default=None)
+ILTHERMO_OFFLINE = env.bool("ILTHERMO_OFFLINE", default=False)
+ILTHERMO_FAILURE_LOG = env.path("ILTHERMO_FAILURE_LOG", default=None)
+ILTHERMO_RATE_LIMIT = env.float("ILTHERMO_RATE_LIMIT", default=10.0)
+ILTHERMO_RATE_BURST = env.int("ILTHERMO_RATE_BURST", default=8)
+ILTHERMO_MAX_RETRIES = env.int("ILTHERMO_MAX_RETRIES", default=3)
+ILTHERMO_BACKOFF_BASE = env.float("ILTHERMO_BACKOFF_BASE", default=0.5)
+ILTHERMO_BACKOFF_MAX = env.float("ILTHERMO_BACKOFF_MAX", default=30.0)
+ILTHERMO_BREAKER_THRESHOLD = env.int("ILTHERMO_BREAKER_THRESHOLD", default=5)
+ILTHERMO_BREAKER_TIMEOUT = env.float("ILTHERMO_BREAKER_TIMEOUT", default=60.0)
+ILTHERMO_SEARCH_TTL = env.float("ILTHERMO_SEARCH_TTL", default=86400.0)
+
+
+# Chemistry
+
+MOLECULE_INTERN_SIZE = env.int(
+    "MOLECULE_INTERN_SIZE", default=4096, validate=validate.Range(min=0)
+)
+
+
+# SQLite
 
-JOBLIB_CACHE_VERBOSITY = env.int("JOBLIB_CACHE_VERBOSITY", default=0)
+SQLITE_TIMEOUT = env.float("SQLITE_TIMEOUT", default=30.0)
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy.typing as npt
+
+    from .chemistry import Molecule
+
+__all__ = [
+    "FingerprintIndex",
+]
+
+import numpy as np
+from rdkit.Chem import rdFingerprintGenerator
+
+_WORD_BITS = 64
+_MAX_PAIRS = 1 << 16
+"""The maximum number of query-molecule pairs compared at once, to stay in cache."""
+
+
+class FingerprintIndex:
+    """Index of molecules searched by Tanimoto similarity of their fingerprints.
+
+    Morgan fingerprints are packed into 64-bit words, one row per molecule, and
+    their bit counts are precomputed, so that the similarities of many queries to
+    all the molecules are computed with vectorized bitwise operations. Molecules
+    are identified by their position in the index, in order of insertion, and can
+    be added at any time.
+    """
+
+    def __init__(self, radius: int = 2, num_bits: int = 2048) -> None:
+        """Initialize the index.
+
+        Args:
+            radius: The radius of the Morgan fingerprints.
+            num_bits: The number of bits of the fingerprints, a multiple of 64.
+
+        Raises:
+            ValueError: If the number of bits is not a positive multiple of 64.
+        """
+        if num_bits <= 0 or num_bits % _WORD_BITS:
+            msg = f"number of bits must be a positive multiple of 64, got {num_bits}"
+
+            raise ValueError(msg)
+
+        self._generator = rdFingerprintGenerator.GetMorganGenerator(
+            radius=radius, fpSize=num_bits
+        )
+        self._num_words = num_bits // _WORD_BITS
+        self._fingerprints = np.empty((0, self._num_words), dtype=np.uint64)
+        self._bit_counts = np.empty(0, dtype=np.int32)
+        self._size = 0
+
+    def fingerprints(self, molecules: Iterable[Molecule]) -> npt.NDArray[np.uint64]:
+        """Return the packed fingerprints of molecules.
+
+        Args:
+            molecules: The molecules.
+
+        Returns:
+            The fingerprints, one row of 64-bit words per molecule.
+        """
+        bits = [
+            self._generator.GetFingerprintAsNumPy(molecule.rdkit_mol)
+            for molecule in molecules
+        ]
+
+        if not bits:
+            return np.empty((0, self._num_words), dtype=np.uint64)
+
+        return np.packbits(np.asarray(bits, dtype=np.uint8), axis=1).view(np.uint64)
+
+    def add(self, molecules: Iterable[Molecule]) -> None:
+        """Add molecules to the index, after the ones already indexed.
+
+        The storage grows geometrically, so that adding molecules one at a time
+        takes amortized constant time.
+
+        Args:
+            molecules: The molecules.
+        """
+        fingerprints = self.fingerprints(molecules)
+
+        if (size := self._size + len(fingerprints)) > len(self._fingerprints):
+            capacity = max(size, 2 * len(self._fingerprints))
+
+            grown = np.empty((capacity, self._num_words), dtype=np.uint64)
+            grown[: self._size] = self._fingerprints[: self._size]
+            self._fingerprints = grown
+
+            bit_counts = np.empty(capacity, dtype=np.int32)
+            bit_counts[: self._size] = self._bit_counts[: self._size]
+            self._bit_counts = bit_counts
+
+        self._fingerprints[self._size : size] = fingerprints
+        self._bit_counts[self._size : size] = _bit_count(fingerprints)
+        self._size = size
+
+    def similarity(self, molecules: Iterable[Molecule]) -> npt.NDArray[np.float64]:
+        """Return the Tanimoto similarities of molecules to the indexed molecules.
+
+        Args:
+            molecules: The query molecules.
+
+        Returns:
+            The similarities, one row per query and one column per indexed
+            molecule.
+        """
+        queries = self.fingerprints(molecules)
+        fingerprints = self._fingerprints[: self._size].T.copy()
+        bit_counts = self._bit_counts[: self._size]
+        similarities = np.empty((len(queries), self._size))
+
+        for start in range(0, len(queries), chunk_size := _chunk_size(self._size)):
+            similarities[start : start + chunk_size] = _tanimoto(
+                queries[start : start + chunk_size], fingerprints, bit_counts
+            )
+
+        return similarities
+
+    def search(
+        self,
+        molecules: Iterable[Molecule],
+        k: int = 5,
+        mask: npt.NDArray[np.bool_] | None = None,
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.float64]]:
+        """Return the most similar indexed molecules of each query molecule.
+
+        Args:
+            molecules: The query molecules.
+            k: The number of neighbours per query. Fewer are returned if fewer
+                molecules are searched.
+            mask: Whether each indexed molecule is searched. All if `None`.
+
+        Returns:
+            The positions of the neighbours in the index and their similarities,
+            one row per query, by decreasing similarity.
+        """
+        queries = self.fingerprints(molecules)
+        candidates = (
+            np.arange(self._size)
+            if mask is None
+            else np.flatnonzero(mask[: self._size])
+        )
+        fingerprints = self._fingerprints[candidates].T.copy()
+        bit_counts = self._bit_counts[candidates]
+        k = min(k, len(candidates))
+
+        indices = np.empty((len(queries), k), dtype=np.intp)
+        similarities = np.empty((len(queries), k))
+
+        if not k:
+            return indices, similarities
+
+        for start in range(0, len(queries), chunk_size := _chunk_size(len(candidates))):
+            chunk = _tanimoto(
+                queries[start : start + chunk_size], fingerprints, bit_counts
+            )
+
+            top = np.argpartition(-chunk, k - 1, axis=1)[:, :k]
+            top_similarities = np.take_along_axis(chunk, top, axis=1)
+            order = np.argsort(-top_similarities, axis=1, kind="stable")
+
+            indices[start : start + chunk_size] = candidates[
+                np.take_along_axis(top, order, axis=1)
+            ]
+            similarities[start : start + chunk_size] = np.take_along_axis(
+                top_similarities, order, axis=1
+            )
+
+        return indices, similarities
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def _bit_count(fingerprints: npt.NDArray[np.uint64]) -> npt.NDArray[np.int32]:
+    """Return the number of bits set in each packed fingerprint."""
+    bit_counts: npt.NDArray[np.int32] = np.bitwise_count(fingerprints).sum(
+        axis=1, dtype=np.int32
+    )
+
+    return bit_counts
+
+
+def _chunk_size(num_candidates: int) -> int:
+    """Return the number of queries compared at once to candidate molecules."""
+    return max(1, _MAX_PAIRS // max(1, num_candidates))
+
+
+def _tanimoto(
+    queries: npt.NDArray[np.uint64],
+    fingerprints: npt.NDArray[np.uint64],
+    bit_counts: npt.NDArray[np.int32],
+) -> npt.NDArray[np.float64]:
+    """Return the Tanimoto similarities of packed fingerprints to candidates.
+
+    The bit counts of the intersections are accumulated one word at a time, in
+    preallocated buffers, so that no temporary array larger than a chunk of
+    query-candidate pairs is allocated.
+
+    Args:
+        queries: The packed fingerprints of the queries, one row per query.
+        fingerprints: The packed fingerprints of the candidates, one column per
+            candidate, so that each word is contiguous.
+        bit_counts: The number of bits set in the fingerprints of the candidates.
+
+    Returns:
+        The similarities, one row per query and one column per candidate.
+    """
+    shape = (len(queries), fingerprints.shape[1])
+    words = np.empty(shape, dtype=np.uint64)
+    word_counts = np.empty(shape, dtype=np.uint8)
+    intersections = np.zeros(shape, dtype=np.int32)
+
+    for word in range(len(fingerprints)):
+        np.bitwise_and(queries[:, word, None], fingerprints[word], out=words)
+        np.bitwise_count(words, out=word_counts)
+        intersections += word_counts
+
+    unions = _bit_count(queries)[:, None] + bit_counts - intersections
+
+    similarities: npt.NDArray[np.float64] = np.divide(
+        intersections, unions, out=np.zeros(shape), where=unions > 0
+    )
+
+    return similarities
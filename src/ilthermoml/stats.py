@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = [
+    "LATENCY_BOUNDS",
+    "SIZE_BOUNDS",
+    "Histogram",
+    "Stats",
+]
+
+import bisect
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+LATENCY_BOUNDS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+"""The default bucket bounds of latency histograms, in seconds."""
+
+SIZE_BOUNDS = tuple(float(4**exponent) for exponent in range(4, 13))
+"""The default bucket bounds of size histograms, in bytes (256 B to 16 MiB)."""
+
+
+@dataclass
+class Histogram:
+    """Histogram of observed values.
+
+    Values are counted in buckets, each holding the values up to its upper bound
+    and above the bound of the previous bucket. Values above the last bound are
+    counted in an extra bucket.
+    """
+
+    bounds: tuple[float, ...]
+    """The upper bounds of the buckets, in ascending order."""
+
+    counts: list[int] = field(init=False)
+    """The numbers of values in the buckets, including the extra one."""
+
+    count: int = field(default=0, init=False)
+    """The number of values observed."""
+
+    total: float = field(default=0.0, init=False)
+    """The sum of the values observed."""
+
+    min: float = field(default=math.inf, init=False)
+    """The smallest value observed."""
+
+    max: float = field(default=-math.inf, init=False)
+    """The largest value observed."""
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        """Record a value.
+
+        Args:
+            value: The value.
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: Histogram) -> None:
+        """Add the values observed by another histogram with the same bounds.
+
+        Args:
+            other: The other histogram.
+
+        Raises:
+            ValueError: If the histograms have different bounds.
+        """
+        if other.bounds != self.bounds:
+            msg = "cannot merge histograms with different bounds"
+
+            raise ValueError(msg)
+
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the values observed, or `None` if there are none."""
+        return self.total / self.count if self.count else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the histogram as a JSON-serializable dictionary."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "mean": self.mean,
+            "buckets": dict(
+                zip(
+                    [f"{bound:g}" for bound in self.bounds] + ["+Inf"],
+                    self.counts,
+                    strict=True,
+                )
+            ),
+        }
+
+
+class Stats:
+    """Thread-safe collection of counters and histograms.
+
+    Statistics are identified by dotted names, such as `cache.hits`. Other stats
+    objects can be attached as children, so that the statistics of a component
+    and of the components it wraps are exported together.
+    """
+
+    def __init__(self) -> None:
+        self.counters: dict[str, int] = {}
+        self.histograms: dict[str, Histogram] = {}
+        self.children: dict[str, Stats] = {}
+
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increment a counter.
+
+        Args:
+            name: The name of the counter.
+            value: The amount to increment the counter by.
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(
+        self, name: str, value: float, bounds: tuple[float, ...] = LATENCY_BOUNDS
+    ) -> None:
+        """Record a value in a histogram.
+
+        Args:
+            name: The name of the histogram.
+            value: The value.
+            bounds: The bucket bounds of the histogram, if it does not exist yet.
+        """
+        with self._lock:
+            if (histogram := self.histograms.get(name)) is None:
+                histogram = self.histograms[name] = Histogram(bounds)
+
+            histogram.observe(value)
+
+    @contextmanager
+    def time(self, name: str) -> Iterator[None]:
+        """Record the duration of a block in a latency histogram.
+
+        Args:
+            name: The name of the histogram.
+        """
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def merge(self, other: Stats) -> None:
+        """Add the counters and histograms of another stats object to this one.
+
+        This is meant for collecting the statistics recorded by worker processes.
+
+        Args:
+            other: The other stats object.
+        """
+        with other._lock:  # noqa: SLF001
+            counters = dict(other.counters)
+            histograms = list(other.histograms.items())
+
+        with self._lock:
+            for name, value in counters.items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+            for name, other_histogram in histograms:
+                if (histogram := self.histograms.get(name)) is None:
+                    histogram = self.histograms[name] = Histogram(
+                        other_histogram.bounds
+                    )
+
+                histogram.merge(other_histogram)
+
+    def add_child(self, name: str, stats: Stats) -> None:
+        """Attach another stats object, to be exported along with this one.
+
+        Args:
+            name: The name of the child.
+            stats: The stats object.
+        """
+        self.children[name] = stats
+
+    def reset(self) -> None:
+        """Clear the counters and histograms, but not those of the children."""
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the statistics as a JSON-serializable dictionary."""
+        with self._lock:
+            stats: dict[str, Any] = {
+                "counters": dict(self.counters),
+                "histograms": {
+                    name: histogram.to_dict()
+                    for name, histogram in self.histograms.items()
+                },
+            }
+
+        if self.children:
+            stats["children"] = {
+                name: child.to_dict() for name, child in self.children.items()
+            }
+
+        return stats
+
+    def __getstate__(self) -> dict[str, Any]:
+        with self._lock:
+            state = self.__dict__.copy()
+
+        del state["_lock"]
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def to_json(self, indent: int | None = None) -> str:
+        """Return the statistics as a JSON string.
+
+        Args:
+            indent: The indentation of the JSON string, compact if `None`.
+        """
+        return json.dumps(self.to_dict(), indent=indent)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from ilthermoml.client import CircuitBreaker
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pytest_mock import MockerFixture
+
+
+class ILThermoStub:
+    def __init__(self) -> None:
+        self.responses: dict[str, Any] = {}
+        self.requests: list[str] = []
+        self.errors: dict[str, list[int]] = {}
+        self.latency = 0.0
+
+    def add_entry(self, code: str, compound_id: str, values: list[float]) -> None:
+        self.responses[code] = {
+            "ref": {"full": "mock_ref", "title": "mock_title"},
+            "title": "Transport properties: Viscosity",
+            "components": [{"idout": compound_id, "name": "mock_name", "sample": []}],
+            "data": [[[value]] for value in values],
+            "dhead": [["Viscosity, Pa&#8226;s", "Liquid"]],
+        }
+
+
+@pytest.fixture
+def ilthermo_server(mocker: MockerFixture) -> Iterator[ILThermoStub]:
+    stub = ILThermoStub()
+
+    class RequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            code = parse_qs(urlparse(self.path).query)["set"][0]
+            stub.requests.append(code)
+
+            time.sleep(stub.latency)
+
+            if errors := stub.errors.get(code):
+                self.send_response(status := errors.pop(0))
+                if status == HTTPStatus.TOO_MANY_REQUESTS:
+                    self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+                return
+
+            if (response := stub.responses.get(code)) is None:
+                self.send_error(404)
+
+                return
+
+            body = json.dumps(response).encode()
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    mocker.patch(
+        "ilthermoml.settings.ILTHERMO_DATA_URL",
+        f"http://127.0.0.1:{server.server_port}/",
+    )
+    mocker.patch("ilthermoml.settings.ILTHERMO_BACKOFF_BASE", 0.001)
+    mocker.patch("ilthermoml.client._rate_limiter", None)
+    mocker.patch(
+        "ilthermoml.client._circuit_breaker",
+        CircuitBreaker(failure_threshold=100, reset_timeout=60.0),
+    )
+
+    yield stub
+
+    server.shutdown()
+    server.server_close()
@@ -1,14 +1,33 @@
 from __future__ import annotations
 
+import pickle
+from typing import TYPE_CHECKING
+
 import pytest
+from rdkit import Chem
 
-from ilthermoml.chemistry import Anion, Cation, Ion, IonicLiquid, Salt, Stoichiometry
+from ilthermoml.chemistry import (
+    Anion,
+    Cation,
+    FamilyClassifier,
+    Ion,
+    IonicLiquid,
+    MoleculeInternTable,
+    Salt,
+    Stoichiometry,
+    anion_classifier,
+    classify_ion,
+)
 from ilthermoml.exceptions import (
     InvalidChargeError,
+    InvalidSmilesError,
     IonicLiquidCationError,
     UnsupportedSaltTypeError,
 )
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 def test_ion_raises_invalid_charge_error_if_charge_zero() -> None:
     # Arrange.
@@ -103,3 +122,227 @@ def test_ionic_liquid_raises_ionic_liquid_cation_error_if_cation_inorganic() ->
     # Act & assert.
     with pytest.raises(IonicLiquidCationError):
         _ = IonicLiquid(smiles)
+
+
+def test_molecule_intern_table_parses_each_smiles_once() -> None:
+    # Arrange.
+    table = MoleculeInternTable(max_size=10)
+
+    # Act.
+    smiles, rdkit_mol = table.parse("C(C)[NH3+]")
+    canonical = table.parse(smiles)
+    again = table.parse("C(C)[NH3+]")
+
+    # Assert.
+    assert smiles == "CC[NH3+]"
+    assert canonical == again == (smiles, rdkit_mol)
+    assert canonical[1] is rdkit_mol
+    assert table.stats.counters == {"intern.hits": 2, "intern.misses": 1}
+
+
+def test_molecule_intern_table_evicts_least_recently_used_smiles() -> None:
+    # Arrange.
+    table = MoleculeInternTable(max_size=2)
+    table.parse("[Na+]")
+    table.parse("[K+]")
+
+    # Act.
+    table.parse("[Na+]")
+    table.parse("[Li+]")
+
+    # Assert.
+    assert len(table) == len(["[Na+]", "[Li+]"])
+    assert table.stats.counters["intern.misses"] == len(["[Na+]", "[K+]", "[Li+]"])
+
+    table.parse("[Na+]")
+    assert table.stats.counters["intern.hits"] == len(["[Na+]", "[Na+]"])
+
+    table.clear()
+    assert len(table) == 0
+
+
+def test_molecules_share_interned_rdkit_molecules(mocker: MockerFixture) -> None:
+    # Mock.
+    mocker.patch(
+        "ilthermoml.chemistry.molecule_intern_table", MoleculeInternTable(max_size=10)
+    )
+
+    # Act.
+    salts = [Salt("[Na+].[Cl-]"), Salt("[Cl-].[Na+]")]
+
+    # Assert.
+    assert salts[0].cation.rdkit_mol is salts[1].cation.rdkit_mol
+    assert salts[0].anion.rdkit_mol is salts[1].anion.rdkit_mol
+
+
+def test_molecule_intern_table_parses_fragments_once(mocker: MockerFixture) -> None:
+    # Arrange.
+    table = MoleculeInternTable(max_size=10)
+
+    # Mock.
+    mock_mol_from_smiles = mocker.spy(Chem, "MolFromSmiles")
+
+    # Act.
+    fragments = table.parse_fragments("[Na+].[Na+].[S-2]")
+    again = table.parse_fragments("[Na+].[Na+].[S-2]")
+    sodium = table.parse("[Na+]")
+
+    # Assert.
+    assert [smiles for smiles, _ in fragments] == ["[Na+]", "[S-2]"]
+    assert again is fragments
+    assert sodium is fragments[0]
+    mock_mol_from_smiles.assert_called_once_with("[Na+].[Na+].[S-2]")
+
+
+def test_salt_is_created_from_a_single_parse(mocker: MockerFixture) -> None:
+    # Mock.
+    mocker.patch(
+        "ilthermoml.chemistry.molecule_intern_table", MoleculeInternTable(max_size=10)
+    )
+    mock_mol_from_smiles = mocker.spy(Chem, "MolFromSmiles")
+    mock_get_formal_charge = mocker.spy(Chem, "GetFormalCharge")
+
+    # Act.
+    salt = Salt("[Cl-].C(C)[NH3+]")
+
+    # Assert.
+    assert salt.cation.smiles == "CC[NH3+]"
+    assert salt.anion.smiles == "[Cl-]"
+    assert (salt.cation.charge_number, salt.anion.charge_number) == (1, -1)
+    mock_mol_from_smiles.assert_called_once_with("[Cl-].C(C)[NH3+]")
+    assert mock_get_formal_charge.call_count == len(["cation", "anion"])
+
+
+def test_salt_raises_invalid_charge_error_if_fragment_is_neutral() -> None:
+    # Arrange.
+    smiles = "[Na+].O"
+
+    # Act & assert.
+    with pytest.raises(InvalidChargeError):
+        _ = Salt(smiles)
+
+
+def test_molecule_is_pickled_compactly_and_rebuilt_lazily() -> None:
+    # Arrange.
+    cation = Cation("C[NH3+]")
+
+    # Act.
+    unpickled = pickle.loads(pickle.dumps(cation))  # noqa: S301
+
+    # Assert.
+    assert cation.__getstate__() == ("C[NH3+]", cation.binary, 1, True)
+    assert unpickled == cation
+    assert unpickled.charge_number == 1
+    assert unpickled.is_organic()
+    assert unpickled._rdkit_mol is None  # noqa: SLF001
+    assert Chem.MolToSmiles(unpickled.rdkit_mol) == "C[NH3+]"
+    assert not hasattr(unpickled, "__dict__")
+
+
+def test_salt_raises_invalid_smiles_error_if_smiles_cannot_be_parsed() -> None:
+    # Act & assert.
+    with pytest.raises(InvalidSmilesError):
+        Salt("not a smiles")
+
+    with pytest.raises(InvalidSmilesError):
+        Cation("not a smiles")
+
+
+@pytest.mark.parametrize(("max_workers", "chunksize"), [(1, 2), (2, 2), (None, 10)])
+def test_ionic_liquid_from_smiles_batch_collects_errors(
+    max_workers: int | None, chunksize: int
+) -> None:
+    # Arrange.
+    smiles = [
+        "C[n+]1ccn(C)c1.[Cl-]",
+        "[Na+].[Cl-]",
+        "CC",
+        "not a smiles",
+        "CC[N+](C)(C)C.[Br-]",
+        None,
+    ]
+
+    # Act.
+    batch = IonicLiquid.from_smiles_batch(
+        smiles, max_workers=max_workers, chunksize=chunksize
+    )
+
+    # Assert.
+    assert len(batch) == len(batch.indices) == 2  # noqa: PLR2004
+    assert batch.indices == [0, 4]
+    assert batch.salts[1] == IonicLiquid("CC[N+](C)(C)C.[Br-]")
+    assert batch.errors.to_dict(orient="list") == {
+        "index": [1, 2, 3, 5],
+        "smiles": ["[Na+].[Cl-]", "CC", "not a smiles", None],
+        "error": [
+            "IonicLiquidCationError",
+            "UnsupportedSaltTypeError",
+            "InvalidSmilesError",
+            "TypeError",
+        ],
+        "message": [
+            "cations in ionic liquids must be organic",
+            "salts must contain exactly one type of both cation and anion; "
+            "found 1 type(s)",
+            "could not parse SMILES 'not a smiles'",
+            "SMILES must be a string, got NoneType",
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    ("ion", "family"),
+    [
+        (Cation("CCCCn1cc[n+](C)c1"), "imidazolium"),
+        (Cation("CCCC[n+]1ccccc1"), "pyridinium"),
+        (Cation("CCCC[N+]1(C)CCCC1"), "pyrrolidinium"),
+        (Cation("CCCC[N+]1(C)CCCCC1"), "piperidinium"),
+        (Cation("CCCC[N+]1(C)CCOCC1"), "morpholinium"),
+        (Cation("NC(N)=[NH2+]"), "guanidinium"),
+        (Cation("CCCC[N+](C)(C)C"), "ammonium"),
+        (Cation("CCCC[P+](CCCC)(CCCC)CCCC"), "phosphonium"),
+        (Cation("CC[S+](CC)CC"), "sulfonium"),
+        (Cation("[Li+]"), "other"),
+        (Anion("O=S(=O)([N-]S(=O)(=O)C(F)(F)F)C(F)(F)F"), "bistriflimide"),
+        (Anion("O=S(=O)(F)[N-]S(=O)(=O)F"), "fluorosulfonylimide"),
+        (Anion("O=S(=O)([O-])C(F)(F)F"), "triflate"),
+        (Anion("CCOS(=O)(=O)[O-]"), "alkylsulfate"),
+        (Anion("O=S(=O)([O-])O"), "hydrogensulfate"),
+        (Anion("Cc1ccc(S(=O)(=O)[O-])cc1"), "sulfonate"),
+        (Anion("F[B-](F)(F)F"), "tetrafluoroborate"),
+        (Anion("F[P-](F)(F)(F)(F)F"), "hexafluorophosphate"),
+        (Anion("CCOP(=O)([O-])OCC"), "phosphate"),
+        (Anion("N#C[N-]C#N"), "dicyanamide"),
+        (Anion("N#C[S-]"), "thiocyanate"),
+        (Anion("[O-][N+](=O)[O-]"), "nitrate"),
+        (Anion("O=C([O-])C(F)(F)F"), "carboxylate"),
+        (Anion("[Br-]"), "halide"),
+        (Anion("[Al-](Cl)(Cl)(Cl)Cl"), "other"),
+    ],
+)
+def test_classify_ion_returns_family_of_ion(ion: Ion, family: str) -> None:
+    # Act & assert.
+    assert classify_ion(pickle.loads(pickle.dumps(ion))) == family  # noqa: S301
+
+
+def test_family_classifier_matches_families_in_order() -> None:
+    # Arrange.
+    classifier = FamilyClassifier(
+        {"quaternary": "[NX4+;H0]", "ammonium": "[NX4+]"}, default="none"
+    )
+
+    # Act.
+    families = classifier.classify(
+        [Cation("C[N+](C)(C)C"), Cation("C[NH3+]"), Cation("[Li+]")]
+    )
+
+    # Assert.
+    assert classifier.families == ["quaternary", "ammonium"]
+    assert families == ["quaternary", "ammonium", "none"]
+    assert anion_classifier.classify([]) == []
+
+
+def test_family_classifier_raises_value_error_for_invalid_smarts() -> None:
+    # Act & assert.
+    with pytest.raises(ValueError, match="could not parse SMARTS"):
+        FamilyClassifier({"invalid": "[N+"})
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+import requests
+
+from ilthermoml.client import (
+    CircuitBreaker,
+    TokenBucket,
+    backoff_delay,
+    get_entry_data,
+)
+from ilthermoml.exceptions import CircuitOpenError
+from ilthermoml.stats import Stats
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from tests.conftest import ILThermoStub
+
+
+def test_token_bucket_allows_bursts_then_throttles(mocker: MockerFixture) -> None:
+    # Mock.
+    mocker.patch("ilthermoml.client.time.monotonic", return_value=0.0)
+    mock_sleep = mocker.patch("ilthermoml.client.time.sleep")
+
+    # Arrange.
+    bucket = TokenBucket(rate=10.0, capacity=2)
+
+    # Act.
+    waits = [bucket.acquire() for _ in range(4)]
+
+    # Assert.
+    assert waits == pytest.approx([0.0, 0.0, 0.1, 0.2])
+    assert mock_sleep.call_count == len([0.1, 0.2])
+
+
+def test_token_bucket_refills_at_rate(mocker: MockerFixture) -> None:
+    # Mock.
+    mock_monotonic = mocker.patch("ilthermoml.client.time.monotonic")
+    mocker.patch("ilthermoml.client.time.sleep")
+
+    # Arrange.
+    mock_monotonic.return_value = 0.0
+    bucket = TokenBucket(rate=10.0, capacity=1)
+    bucket.acquire()
+
+    # Act.
+    mock_monotonic.return_value = 0.1
+    wait = bucket.acquire()
+
+    # Assert.
+    assert wait == 0.0
+
+
+def test_circuit_breaker_opens_after_consecutive_failures(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mock_monotonic = mocker.patch("ilthermoml.client.time.monotonic", return_value=0.0)
+
+    # Arrange.
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0)
+
+    # Act.
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.check()
+    breaker.record_failure()
+
+    # Assert.
+    assert breaker.is_open
+
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    mock_monotonic.return_value = 10.0
+    assert not breaker.is_open
+
+
+def test_circuit_breaker_lets_single_trial_call_through_after_timeout(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mock_monotonic = mocker.patch("ilthermoml.client.time.monotonic", return_value=0.0)
+
+    # Arrange.
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+    breaker.record_failure()
+
+    # Act.
+    mock_monotonic.return_value = 10.0
+    breaker.check()
+
+    # Assert.
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    breaker.record_success()
+    breaker.check()
+
+
+def test_circuit_breaker_reopens_if_trial_call_fails(mocker: MockerFixture) -> None:
+    # Mock.
+    mock_monotonic = mocker.patch("ilthermoml.client.time.monotonic", return_value=0.0)
+
+    # Arrange.
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10.0)
+    for _ in range(3):
+        breaker.record_failure()
+
+    mock_monotonic.return_value = 10.0
+    breaker.check()
+
+    # Act.
+    mock_monotonic.return_value = 15.0
+    breaker.record_failure()
+
+    # Assert.
+    mock_monotonic.return_value = 20.0
+    assert breaker.is_open
+
+
+@pytest.mark.parametrize("attempt", [0, 1, 5, 10])
+def test_backoff_delay_is_bounded_exponentially(attempt: int) -> None:
+    # Act.
+    delays = [backoff_delay(attempt, base=0.5, cap=10.0) for _ in range(100)]
+
+    # Assert.
+    assert all(0.0 <= delay <= min(10.0, 0.5 * 2**attempt) for delay in delays)
+
+
+def test_get_entry_data_retries_transient_errors(
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Arrange.
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.errors["id_a"] = [503, 429]
+    stats = Stats()
+
+    # Act.
+    response = get_entry_data("id_a", stats=stats)
+
+    # Assert.
+    assert response["data"] == [[[1.0]]]
+    assert ilthermo_server.requests == ["id_a", "id_a", "id_a"]
+    assert stats.counters == {"fetch.errors": 2, "fetch.retries": 2}
+
+
+def test_get_entry_data_gives_up_after_max_retries(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Arrange.
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.errors["id_a"] = [500, 502, 503, 504]
+
+    # Mock.
+    mocker.patch("ilthermoml.settings.ILTHERMO_MAX_RETRIES", 2)
+
+    # Act & assert.
+    with pytest.raises(requests.HTTPError):
+        get_entry_data("id_a")
+
+    assert ilthermo_server.requests == ["id_a", "id_a", "id_a"]
+
+
+def test_get_entry_data_does_not_retry_client_errors(
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Act & assert.
+    with pytest.raises(requests.HTTPError):
+        get_entry_data("id_missing")
+
+    assert ilthermo_server.requests == ["id_missing"]
+
+
+def test_get_entry_data_retries_timeouts(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Arrange.
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.latency = 0.2
+
+    # Mock.
+    mocker.patch("ilthermoml.settings.ILTHERMO_TIMEOUT", 0.05)
+    mocker.patch("ilthermoml.settings.ILTHERMO_MAX_RETRIES", 1)
+
+    # Act & assert.
+    with pytest.raises(requests.Timeout):
+        get_entry_data("id_a")
+
+    assert ilthermo_server.requests == ["id_a", "id_a"]
+
+
+def test_get_entry_data_stops_requests_once_circuit_is_open(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Arrange.
+    ilthermo_server.errors["id_a"] = [503, 503]
+
+    # Mock.
+    mocker.patch("ilthermoml.settings.ILTHERMO_MAX_RETRIES", 0)
+    mocker.patch(
+        "ilthermoml.client._circuit_breaker",
+        CircuitBreaker(failure_threshold=2, reset_timeout=60.0),
+    )
+
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            get_entry_data("id_a")
+
+    # Act & assert.
+    with pytest.raises(CircuitOpenError):
+        get_entry_data("id_a")
+
+    assert len(ilthermo_server.requests) == len([503, 503])
+
+
+def test_get_entry_data_waits_for_rate_limiter(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Arrange.
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    stats = Stats()
+
+    # Mock.
+    mocker.patch("ilthermoml.client._rate_limiter", TokenBucket(10.0, 1))
+
+    # Act.
+    for _ in range(3):
+        get_entry_data("id_a", stats=stats)
+
+    # Assert.
+    histogram = stats.histograms["fetch.throttle_seconds"]
+    assert histogram.count == len(ilthermo_server.requests)
+    assert histogram.total > 0.0
@@ -1,16 +1,49 @@
 from __future__ import annotations
 
+import asyncio
+import gc
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from ilthermoml.dataset import Dataset, Entry
-from ilthermoml.exceptions import DatasetError, EntryError
+import ilthermoml.dataset
+from ilthermoml.chemistry import Anion, Cation, IonicLiquid
+from ilthermoml.client import CircuitBreaker
+from ilthermoml.dataset import (
+    Column,
+    Dataset,
+    Entry,
+    GetEntry,
+    _make_entry_in_process,
+    _validation_version,
+    get_entry,
+)
+from ilthermoml.exceptions import (
+    CircuitOpenError,
+    DatasetError,
+    EntryError,
+    EntryFetchError,
+    MissingColumnError,
+)
+from ilthermoml.failures import Failure
+from ilthermoml.memory import DiskCache, NullCache
+from ilthermoml.progress import EntryEvent, Progress, ProgressCallback
+from ilthermoml.stats import Stats
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
     from pytest_mock import MockerFixture
 
+    from tests.conftest import ILThermoStub
+
 
 def test_entry_attempts_to_retrieve_entry_from_ilthermo(
     mocker: MockerFixture,
@@ -36,7 +69,7 @@ def test_entry_attempts_to_retrieve_entry_from_ilthermo(
     Entry("mock_id")
 
     # Assert.
-    mock_get_entry.assert_called_once_with("mock_id")
+    mock_get_entry.assert_called_once_with("mock_id", session=None, stats=mocker.ANY)
 
 
 def test_entry_raises_entry_error_if_ilthermo_entry_cannot_be_retrieved(
@@ -46,7 +79,7 @@ def test_entry_raises_entry_error_if_ilthermo_entry_cannot_be_retrieved(
     class MockError(Exception):
         pass
 
-    def mock_get_entry(code: str) -> Any:
+    def mock_get_entry(code: str, **_kwargs: Any) -> Any:
         if code == "mock_id":
             raise MockError
 
@@ -183,6 +216,69 @@ def test_entry_is_prepared_when_instantiated_with_dataset(
     mock_dataset.prepare_entry.assert_called_once()
 
 
+def test_entry_renames_columns_without_copying_data(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    ilt_data = pd.DataFrame({"V1": [1.0, 2.0]})
+
+    # Mock.
+    mocker.patch(
+        "ilthermoml.dataset.GetEntry",
+        return_value=mocker.Mock(
+            header={"V1": "mock_header"},
+            data=ilt_data,
+            components=[
+                mocker.Mock(
+                    id="mock_id",
+                    name="mock_name",
+                    smiles="C[NH3+].[Cl-]",
+                    smiles_error=None,
+                ),
+            ],
+        ),
+    )
+
+    # Act.
+    entry = Entry("mock_id")
+
+    # Assert.
+    assert list(entry.data.columns) == ["mock_header"]
+    assert np.shares_memory(entry.data["mock_header"], ilt_data["V1"])
+
+
+def test_entry_select_selects_scales_and_defaults_columns() -> None:
+    # Arrange.
+    data = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0], "c": [5.0, 6.0]})
+    entry = Entry.from_data("mock_id", IonicLiquid("C[NH3+].[Cl-]"), data)
+
+    # Act.
+    entry.select(
+        Column("x", "a"),
+        Column("y", "b", scale=10.0),
+        Column("z", "d", default=0.5),
+    )
+
+    # Assert.
+    pd.testing.assert_frame_equal(
+        entry.data,
+        pd.DataFrame({"x": [1.0, 2.0], "y": [30.0, 40.0], "z": [0.5, 0.5]}),
+    )
+    assert np.shares_memory(entry.data["x"], data["a"])
+
+
+def test_entry_select_raises_missing_column_error_for_required_column() -> None:
+    # Arrange.
+    data = pd.DataFrame({"a": [1.0, 2.0]})
+    entry = Entry.from_data("mock_id", IonicLiquid("C[NH3+].[Cl-]"), data)
+
+    # Act & assert.
+    with pytest.raises(MissingColumnError):
+        entry.select(Column("x", "a"), Column("y", "b"))
+
+    assert entry.data is data
+
+
 def test_dataset_populate_attempts_to_retrieve_entry_ids(
     mocker: MockerFixture,
 ) -> None:
@@ -267,7 +363,7 @@ def test_dataset_populate_skips_entries_that_cannot_be_retrieved(
     dataset = MockDataset()
 
     # Mock.
-    def mock_get_entry(code: str) -> Any:
+    def mock_get_entry(code: str, **_kwargs: Any) -> Any:
         if code == "id_b":
             raise EntryError
 
@@ -296,7 +392,7 @@ def test_dataset_data_returns_concatenated_entries(
     mocker: MockerFixture,
 ) -> None:
     # Mock.
-    def mock_get_entry(code: str) -> Any:
+    def mock_get_entry(code: str, **_kwargs: Any) -> Any:
         if code == "id_a":
             return mocker.Mock(
                 header={"mock_header": "mock_header"},
@@ -383,7 +479,7 @@ def test_populate_dataset_ions_and_ionic_liquids(
     mocker: MockerFixture,
 ) -> None:
     # Mock.
-    def mock_get_entry(code: str) -> Any:
+    def mock_get_entry(code: str, **_kwargs: Any) -> Any:
         if code == "id_a":
             return mocker.Mock(
                 header={"mock_header": "mock_header"},
@@ -447,3 +543,1601 @@ def test_populate_dataset_ions_and_ionic_liquids(
     )
 
     assert len(dataset.ions) == len({ion.smiles for ion in dataset.ions})
+
+
+def test_dataset_populate_preserves_entry_order_with_multiple_workers(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    entry_ids = [f"id_{i}" for i in range(8)]
+
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return entry_ids
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            pass
+
+    dataset = MockDataset()
+
+    # Mock.
+    def mock_get_entry(code: str, **_kwargs: Any) -> Any:
+        # Entries listed first take the longest to retrieve.
+        time.sleep(0.01 * (len(entry_ids) - entry_ids.index(code)))
+
+        return mocker.Mock(
+            header={"V1": "mock_header"},
+            data=pd.DataFrame({"V1": []}),
+            components=[
+                mocker.Mock(
+                    id="mock_id",
+                    name="mock_name",
+                    smiles="C[NH3+].[Cl-]",
+                    smiles_error=None,
+                ),
+            ],
+        )
+
+    mocker.patch("ilthermoml.dataset.GetEntry", side_effect=mock_get_entry)
+
+    # Act.
+    dataset.populate(max_workers=4)
+    dataset_entry_ids = [entry.id for entry in dataset.entries]
+
+    # Assert.
+    assert dataset_entry_ids == entry_ids
+
+
+@pytest.mark.parametrize("max_processes", [None, 2])
+def test_dataset_populate_retrieves_entries_through_session_sized_to_workers(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+    max_processes: int | None,
+) -> None:
+    # Arrange.
+    dataset = ProcessDataset()
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+
+    # Mock.
+    mocker.patch("ilthermoml.dataset._cached_get_entry", NullCache().cache(get_entry))
+    mock_create_session = mocker.spy(ilthermoml.dataset, "create_session")
+    mock_get_entry = mocker.patch("ilthermoml.dataset.GetEntry", wraps=GetEntry)
+
+    # Act.
+    dataset.populate(max_workers=12, max_processes=max_processes)
+
+    # Assert.
+    mock_create_session.assert_called_once_with(12)
+    assert {call.kwargs["session"] for call in mock_get_entry.call_args_list} == {
+        mock_create_session.spy_return
+    }
+    assert [entry.id for entry in dataset.entries] == ["id_a"]
+
+
+def test_dataset_populate_deduplicates_ions_with_multiple_workers(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_a", "id_b", "id_c", "id_d"]
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            pass
+
+    dataset = MockDataset()
+
+    # Mock.
+    smiles = {
+        "id_a": "C[NH3+].[Cl-]",
+        "id_b": "C[NH3+].[Br-]",
+        "id_c": "C[NH3+].[Cl-]",
+        "id_d": "CC[NH3+].[Br-]",
+    }
+
+    def mock_get_entry(code: str, **_kwargs: Any) -> Any:
+        return mocker.Mock(
+            header={"V1": "mock_header"},
+            data=pd.DataFrame({"V1": []}),
+            components=[
+                mocker.Mock(
+                    id=f"mock_{code}",
+                    name="mock_name",
+                    smiles=smiles[code],
+                    smiles_error=None,
+                ),
+            ],
+        )
+
+    mocker.patch("ilthermoml.dataset.GetEntry", side_effect=mock_get_entry)
+
+    # Act.
+    dataset.populate(max_workers=4)
+
+    # Assert.
+    assert [ion.smiles for ion in dataset.ions] == [
+        "C[NH3+]",
+        "[Cl-]",
+        "[Br-]",
+        "CC[NH3+]",
+    ]
+
+
+def test_get_entry_retrieves_entry_from_ilthermo(
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Arrange.
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0, 2.0])
+
+    # Act.
+    ilt_entry = get_entry("id_a")
+
+    # Assert.
+    assert ilt_entry.id == "id_a"
+    assert list(ilt_entry.data["V1"]) == [1.0, 2.0]
+
+
+def test_dataset_apopulate_appends_entries_with_ids_retrieved(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_a", "id_b", "id_c"]
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            entry.data = entry.data * 1.0e003
+
+    dataset = MockDataset()
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.add_entry("id_c", "AAUFrd", [2.0, 3.0])
+
+    # Mock.
+    mocker.patch("ilthermoml.dataset.GetEntry", get_entry)
+
+    # Act.
+    asyncio.run(dataset.apopulate(max_concurrency=2))
+
+    # Assert.
+    assert [entry.id for entry in dataset.entries] == ["id_a", "id_c"]
+    assert list(dataset.data["Viscosity, Pa&#8226;s => Liquid"]) == [
+        1.0e003,
+        2.0e003,
+        3.0e003,
+    ]
+    assert len(dataset.ionic_liquids) == 1
+
+
+def test_dataset_apopulate_writes_entries_to_get_entry_cache(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_a"]
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            pass
+
+    dataset = MockDataset()
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+
+    # Mock.
+    mock_cached_get_entry = mocker.patch(
+        "ilthermoml.dataset._cached_get_entry",
+        DiskCache(tmp_path).cache(get_entry, ignore=["session", "stats"]),
+    )
+
+    # Act.
+    asyncio.run(dataset.apopulate())
+
+    # Assert.
+    assert mock_cached_get_entry.check_call_in_cache("id_a")
+
+
+def test_dataset_apopulate_cancels_remaining_entries_on_unexpected_error(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_a", "id_b", "id_c"]
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            if entry.id == "id_a":
+                msg = "unexpected"
+
+                raise RuntimeError(msg)
+
+    dataset = MockDataset()
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.add_entry("id_b", "AAUFrd", [2.0])
+    ilthermo_server.add_entry("id_c", "AAUFrd", [3.0])
+    ilthermo_server.latency = 0.05
+
+    async def apopulate() -> set[asyncio.Task[object]]:
+        with pytest.raises(RuntimeError, match="unexpected"):
+            await dataset.apopulate(max_concurrency=1)
+
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    # Mock.
+    mocker.patch("ilthermoml.dataset._cached_get_entry", NullCache().cache(get_entry))
+
+    # Act.
+    pending_tasks = asyncio.run(apopulate())
+
+    # Assert.
+    assert not pending_tasks
+    assert not dataset.entries
+
+
+def test_dataset_stats_record_retrieval_and_preparation_of_entries(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_a", "id_b", "id_missing"]
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            pass
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.add_entry("id_b", "AAUFrd", [2.0])
+
+    # Mock.
+    mocker.patch(
+        "ilthermoml.dataset._cached_get_entry",
+        DiskCache(tmp_path).cache(get_entry, ignore=["session", "stats"]),
+    )
+
+    # Act.
+    (dataset := MockDataset()).populate()
+    (cached_dataset := MockDataset()).populate()
+
+    # Assert.
+    assert dataset.stats.counters == {
+        "cache.misses": 2,
+        "entries.created": 2,
+        "entries.failed": 1,
+    }
+    assert cached_dataset.stats.counters == {
+        "cache.hits": 2,
+        "entries.created": 2,
+        "entries.failed": 1,
+    }
+
+    stats = dataset.stats.to_dict()["histograms"]
+    assert stats["get_entry.seconds"]["count"] == len(["id_a", "id_b", "id_missing"])
+    assert stats["fetch.seconds"]["count"] == len(["id_a", "id_b", "id_missing"])
+    assert stats["fetch.bytes"]["count"] == len(["id_a", "id_b"])
+    assert stats["prepare_entry.seconds"]["count"] == len(["id_a", "id_b"])
+    assert cached_dataset.stats.histograms["fetch.seconds"].count == len(["id_missing"])
+
+
+def test_dataset_populate_retries_transient_ilthermo_errors(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_a"]
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            pass
+
+    dataset = MockDataset()
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.errors["id_a"] = [503]
+
+    # Mock.
+    mocker.patch("ilthermoml.dataset._cached_get_entry", NullCache().cache(get_entry))
+
+    # Act.
+    dataset.populate()
+
+    # Assert.
+    assert [entry.id for entry in dataset.entries] == ["id_a"]
+    assert dataset.stats.counters["fetch.retries"] == 1
+
+
+def test_dataset_populate_aborts_once_circuit_opens(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_a", "id_b", "id_c", "id_d"]
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            pass
+
+    dataset = MockDataset()
+
+    for entry_id in ["id_a", "id_b", "id_c", "id_d"]:
+        ilthermo_server.add_entry(entry_id, "AAUFrd", [1.0])
+
+    ilthermo_server.errors["id_b"] = [503]
+
+    # Mock.
+    mocker.patch("ilthermoml.dataset._cached_get_entry", NullCache().cache(get_entry))
+    mocker.patch("ilthermoml.settings.ILTHERMO_MAX_RETRIES", 0)
+    mocker.patch(
+        "ilthermoml.client._circuit_breaker",
+        breaker := CircuitBreaker(failure_threshold=1, reset_timeout=60.0),
+    )
+
+    # Act & assert.
+    with pytest.raises(CircuitOpenError):
+        dataset.populate(checkpoint_dir=tmp_path)
+
+    assert [entry.id for entry in dataset.entries] == ["id_a"]
+    assert ilthermo_server.requests == ["id_a", "id_b"]
+
+    breaker.record_success()
+    (resumed_dataset := MockDataset()).populate(checkpoint_dir=tmp_path)
+
+    assert [entry.id for entry in resumed_dataset.entries] == [
+        "id_a",
+        "id_b",
+        "id_c",
+        "id_d",
+    ]
+
+
+def test_dataset_skips_entries_known_to_fail_validation(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_a", "id_b", "id_missing"]
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            try:
+                entry.data["Viscosity, Pa&#8226;s => Liquid"]
+            except KeyError as e:
+                msg = f"required column {e} is missing"
+
+                raise EntryError(msg) from e
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.add_entry("id_b", "AAUFrd", [2.0])
+    ilthermo_server.responses["id_b"]["dhead"] = [["Density, kg/m3", "Liquid"]]
+
+    # Mock.
+    mocker.patch("ilthermoml.dataset._cached_get_entry", NullCache().cache(get_entry))
+    mocker.patch("ilthermoml.settings.ILTHERMO_FAILURE_LOG", tmp_path / "failures.db")
+
+    (dataset := MockDataset()).populate()
+    ilthermo_server.requests.clear()
+
+    # Act.
+    (rebuilt_dataset := MockDataset()).populate()
+
+    # Assert.
+    assert dataset.stats.counters["failures.KeyError"] == 1
+    assert [entry.id for entry in rebuilt_dataset.entries] == ["id_a"]
+    assert sorted(ilthermo_server.requests) == ["id_a", "id_missing"]
+    assert rebuilt_dataset.stats.counters["entries.skipped"] == 1
+    assert rebuilt_dataset.failure_summary == {"KeyError": 1}
+    assert [failure.entry_id for failure in rebuilt_dataset.failures] == ["id_b"]
+
+
+def test_dataset_failures_are_invalidated_when_prepare_entry_changes(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["mock_id"]
+
+        @staticmethod
+        def prepare_entry(_entry: Entry) -> None:
+            msg = "mock error"
+
+            raise EntryError(msg)
+
+    def prepare_entry(entry: Entry) -> None:
+        pass
+
+    # Mock.
+    mocker.patch(
+        "ilthermoml.dataset.GetEntry",
+        return_value=mocker.Mock(
+            header={"V1": "mock_header"},
+            data=pd.DataFrame({"V1": [1.0]}),
+            components=[
+                mocker.Mock(
+                    id="mock_id",
+                    name="mock_name",
+                    smiles="C[NH3+].[Cl-]",
+                    smiles_error=None,
+                ),
+            ],
+        ),
+    )
+    mocker.patch("ilthermoml.settings.ILTHERMO_FAILURE_LOG", tmp_path / "failures.db")
+
+    MockDataset().populate()
+    mocker.patch.object(MockDataset, "prepare_entry", staticmethod(prepare_entry))
+
+    # Act.
+    (dataset := MockDataset()).populate()
+
+    # Assert.
+    assert [entry.id for entry in dataset.entries] == ["mock_id"]
+    assert dataset.failures == []
+
+
+def test_dataset_without_failure_log_counts_failures_by_reason(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["mock_id"]
+
+        @staticmethod
+        def prepare_entry(_entry: Entry) -> None:
+            msg = "mock error"
+
+            raise EntryError(msg)
+
+    dataset = MockDataset()
+
+    # Mock.
+    mocker.patch(
+        "ilthermoml.dataset.GetEntry",
+        return_value=mocker.Mock(
+            header={"V1": "mock_header"},
+            data=pd.DataFrame({"V1": [1.0]}),
+            components=[
+                mocker.Mock(
+                    id="mock_id",
+                    name="mock_name",
+                    smiles="C[NH3+].[Cl-]",
+                    smiles_error=None,
+                ),
+            ],
+        ),
+    )
+
+    # Act.
+    dataset.populate()
+
+    # Assert.
+    assert dataset.stats.counters["failures.EntryError"] == 1
+    assert dataset.failures == []
+    assert dataset.failure_summary == {}
+
+
+def test_validation_version_of_function_without_source_is_stable() -> None:
+    # Act.
+    version = _validation_version(id)
+
+    # Assert.
+    assert version == _validation_version(id)
+    assert version != _validation_version(
+        test_validation_version_of_function_without_source_is_stable
+    )
+
+
+def test_dataset_indices_refer_to_registered_ionic_liquids_and_ions(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_a", "id_b", "id_c"]
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            pass
+
+    dataset = MockDataset()
+
+    # Mock.
+    smiles = {
+        "id_a": "C[NH3+].[Cl-]",
+        "id_b": "CC[NH3+].[Cl-]",
+        "id_c": "[Cl-].C[NH3+]",
+    }
+
+    def mock_get_entry(code: str, **_kwargs: Any) -> Any:
+        return mocker.Mock(
+            header={"V1": "mock_header"},
+            data=pd.DataFrame({"V1": []}),
+            components=[
+                mocker.Mock(
+                    id=f"mock_{code}",
+                    name="mock_name",
+                    smiles=smiles[code],
+                    smiles_error=None,
+                ),
+            ],
+        )
+
+    mocker.patch("ilthermoml.dataset.GetEntry", side_effect=mock_get_entry)
+
+    # Act.
+    dataset.populate()
+
+    # Assert.
+    assert list(dataset.ionic_liquid_indices) == [0, 1, 0]
+    assert dataset.ion_indices.to_numpy().tolist() == [[0, 1], [2, 1]]
+    assert dataset.ions.table.to_dict(orient="list") == {
+        "smiles": ["C[NH3+]", "[Cl-]", "CC[NH3+]"],
+        "type": ["Cation", "Anion", "Cation"],
+        "charge": [1, -1, 1],
+        "organic": [True, False, True],
+        "heavy_atoms": [2, 1, 3],
+        "formula": ["CH6N+", "Cl-", "C2H8N+"],
+        "family": ["ammonium", "halide", "ammonium"],
+    }
+    assert dataset.ionic_liquids.table[["cations", "anions"]].to_numpy().tolist() == [
+        [1, 1],
+        [1, 1],
+    ]
+    assert dataset.entries[2].ionic_liquid is dataset.ionic_liquids[0]
+
+
+def test_dataset_populate_resumes_from_checkpoint(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    entry_ids = ["id_a", "id_b", "id_c"]
+
+    class MockDataset(Dataset):
+        fail_on: str | None = None
+
+        @classmethod
+        def get_entry_ids(cls) -> list[str]:
+            return entry_ids
+
+        @classmethod
+        def prepare_entry(cls, entry: Entry) -> None:
+            if entry.id == cls.fail_on:
+                raise RuntimeError
+
+    # Mock.
+    mock_get_entry = mocker.patch(
+        "ilthermoml.dataset.GetEntry",
+        return_value=mocker.Mock(
+            header={"V1": "mock_header"},
+            data=pd.DataFrame({"V1": [1.0]}),
+            components=[
+                mocker.Mock(
+                    id="mock_id",
+                    name="mock_name",
+                    smiles="C[NH3+].[Cl-]",
+                    smiles_error=None,
+                ),
+            ],
+        ),
+    )
+
+    MockDataset.fail_on = "id_c"
+
+    with pytest.raises(RuntimeError):
+        MockDataset().populate(checkpoint_dir=tmp_path, checkpoint_interval=1)
+
+    MockDataset.fail_on = None
+    mock_get_entry.reset_mock()
+
+    entry_ids.append("id_d")
+    dataset = MockDataset()
+
+    # Act.
+    dataset.populate(checkpoint_dir=tmp_path)
+
+    # Assert.
+    assert [call.args[0] for call in mock_get_entry.call_args_list] == [
+        "id_c",
+        "id_d",
+    ]
+    assert [entry.id for entry in dataset.entries] == ["id_a", "id_b", "id_c", "id_d"]
+    assert len(dataset.ionic_liquids) == 1
+
+
+def test_dataset_populate_restores_checkpointed_entries_of_same_preparation(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_a", "id_b"]
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            pass
+
+    class ScaledDataset(MockDataset):
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            entry.data = entry.data * 2.0
+
+    class ShrunkDataset(MockDataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_b"]
+
+    # Mock.
+    mock_get_entry = mocker.patch(
+        "ilthermoml.dataset.GetEntry",
+        return_value=mocker.Mock(
+            header={"V1": "mock_header"},
+            data=pd.DataFrame({"V1": [1.0]}),
+            components=[
+                mocker.Mock(
+                    id="mock_id",
+                    name="mock_name",
+                    smiles="C[NH3+].[Cl-]",
+                    smiles_error=None,
+                ),
+            ],
+        ),
+    )
+
+    MockDataset().populate(checkpoint_dir=tmp_path)
+    mock_get_entry.reset_mock()
+
+    # Act.
+    (scaled_dataset := ScaledDataset()).populate(checkpoint_dir=tmp_path)
+    (shrunk_dataset := ShrunkDataset()).populate(checkpoint_dir=tmp_path)
+
+    # Assert.
+    assert mock_get_entry.call_count == len(["id_a", "id_b"])
+    assert list(scaled_dataset.data["mock_header"]) == [2.0, 2.0]
+    assert [entry.id for entry in shrunk_dataset.entries] == ["id_b"]
+
+
+def test_dataset_populate_skips_entries_already_in_dataset(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_a", "id_b"]
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            pass
+
+    dataset = MockDataset()
+
+    # Mock.
+    mock_get_entry = mocker.patch(
+        "ilthermoml.dataset.GetEntry",
+        return_value=mocker.Mock(
+            header={"V1": "mock_header"},
+            data=pd.DataFrame({"V1": []}),
+            components=[
+                mocker.Mock(
+                    id="mock_id",
+                    name="mock_name",
+                    smiles="C[NH3+].[Cl-]",
+                    smiles_error=None,
+                ),
+            ],
+        ),
+    )
+
+    dataset.populate()
+
+    # Act.
+    dataset.populate()
+
+    # Assert.
+    assert mock_get_entry.call_count == len(dataset.entries) == 2  # noqa: PLR2004
+
+
+def test_dataset_data_is_cached_and_extended_with_new_entries(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    entry_ids = ["id_a"]
+
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return entry_ids
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            pass
+
+    dataset = MockDataset()
+
+    # Mock.
+    def mock_get_entry(code: str, **_kwargs: Any) -> Any:
+        return mocker.Mock(
+            header={"V1": "mock_header"},
+            data=pd.DataFrame({"V1": [float(entry_ids.index(code))]}),
+            components=[
+                mocker.Mock(
+                    id="mock_id",
+                    name="mock_name",
+                    smiles="C[NH3+].[Cl-]",
+                    smiles_error=None,
+                ),
+            ],
+        )
+
+    mocker.patch("ilthermoml.dataset.GetEntry", side_effect=mock_get_entry)
+
+    dataset.populate()
+    data = dataset.data
+
+    entry_ids.append("id_b")
+
+    # Act.
+    dataset.populate()
+
+    # Assert.
+    assert dataset.data is not data
+    assert dataset.data is dataset.data
+    assert list(dataset.data["mock_header"]) == [0.0, 1.0]
+
+
+def test_dataset_data_is_rebuilt_if_entry_data_replaced(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_a", "id_b"]
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            pass
+
+    dataset = MockDataset()
+
+    # Mock.
+    mocker.patch(
+        "ilthermoml.dataset.GetEntry",
+        return_value=mocker.Mock(
+            header={"V1": "mock_header"},
+            data=pd.DataFrame({"V1": [1.0]}),
+            components=[
+                mocker.Mock(
+                    id="mock_id",
+                    name="mock_name",
+                    smiles="C[NH3+].[Cl-]",
+                    smiles_error=None,
+                ),
+            ],
+        ),
+    )
+
+    dataset.populate()
+    _ = dataset.data
+
+    # Act.
+    dataset.entries[0].data = pd.DataFrame({"mock_header": [2.0]})
+
+    # Assert.
+    assert list(dataset.data["mock_header"]) == [2.0, 1.0]
+
+
+class SnapshotDataset(Dataset):
+    @staticmethod
+    def get_entry_ids() -> list[str]:
+        return ["id_a", "id_b", "id_c"]
+
+    @staticmethod
+    def prepare_entry(entry: Entry) -> None:
+        pass
+
+
+@pytest.fixture
+def snapshot_dataset(mocker: MockerFixture) -> SnapshotDataset:
+    smiles = {
+        "id_a": "C[NH3+].[Cl-]",
+        "id_b": "CC[NH3+].[Cl-]",
+        "id_c": "C[NH3+].[Cl-]",
+    }
+
+    def mock_get_entry(code: str, **_kwargs: Any) -> Any:
+        return mocker.Mock(
+            header={"V1": "mock_header", "V2": "other_header"},
+            data=pd.DataFrame({"V1": [1.0, 2.0], "V2": [1, 2]}),
+            components=[
+                mocker.Mock(
+                    id=f"mock_{code}",
+                    name="mock_name",
+                    smiles=smiles[code],
+                    smiles_error=None,
+                ),
+            ],
+        )
+
+    mocker.patch("ilthermoml.dataset.GetEntry", side_effect=mock_get_entry)
+
+    dataset = SnapshotDataset()
+    dataset.populate()
+
+    return dataset
+
+
+def test_dataset_nearest_ions_compares_ions_of_same_type(
+    snapshot_dataset: SnapshotDataset,
+) -> None:
+    # Act.
+    neighbours = snapshot_dataset.nearest_ions(
+        [Cation("CCC[NH3+]"), Anion("[Br-]"), Cation("C[NH3+]")], k=2
+    )
+
+    # Assert.
+    assert neighbours[["query", "rank", "ion_id"]].to_numpy().tolist() == [
+        [0, 0, 2],
+        [0, 1, 0],
+        [1, 0, 1],
+        [2, 0, 0],
+        [2, 1, 2],
+    ]
+    assert neighbours["similarity"].iloc[3] == pytest.approx(1.0)
+    assert len(snapshot_dataset.ion_fingerprints) == len(snapshot_dataset.ions)
+
+
+def test_dataset_ionic_liquid_families_look_up_ion_families(
+    snapshot_dataset: SnapshotDataset,
+) -> None:
+    # Act.
+    families = snapshot_dataset.ionic_liquid_families
+
+    # Assert.
+    assert families.to_numpy().tolist() == [
+        ["ammonium", "halide"],
+        ["ammonium", "halide"],
+    ]
+    assert families.index.name == "ionic_liquid_id"
+    assert SnapshotDataset().ionic_liquid_families.empty
+
+
+def test_dataset_nearest_ions_of_empty_dataset_is_empty() -> None:
+    # Arrange.
+    dataset = SnapshotDataset()
+
+    # Act.
+    neighbours = dataset.nearest_ions([Anion("[Br-]")])
+
+    # Assert.
+    assert neighbours.empty
+    assert list(neighbours.columns) == ["query", "rank", "ion_id", "similarity"]
+
+
+def test_dataset_load_restores_saved_dataset(
+    snapshot_dataset: SnapshotDataset,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    snapshot_dataset.save(tmp_path)
+
+    # Act.
+    dataset = SnapshotDataset.load(tmp_path)
+
+    # Assert.
+    pd.testing.assert_frame_equal(dataset.data, snapshot_dataset.data)
+    pd.testing.assert_frame_equal(
+        dataset.entries[1].data, snapshot_dataset.entries[1].data
+    )
+    pd.testing.assert_series_equal(
+        dataset.ionic_liquid_indices, snapshot_dataset.ionic_liquid_indices
+    )
+    pd.testing.assert_frame_equal(dataset.ion_indices, snapshot_dataset.ion_indices)
+    pd.testing.assert_frame_equal(dataset.ions.table, snapshot_dataset.ions.table)
+    assert [repr(ion) for ion in dataset.ions] == [
+        repr(ion) for ion in snapshot_dataset.ions
+    ]
+    assert dataset.entries[0].ionic_liquid is dataset.entries[2].ionic_liquid
+
+
+def test_dataset_load_memory_maps_data(
+    snapshot_dataset: SnapshotDataset,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    snapshot_dataset.save(tmp_path)
+
+    # Act.
+    dataset = SnapshotDataset.load(tmp_path)
+    dataset_in_memory = SnapshotDataset.load(tmp_path, mmap=False)
+
+    # Assert.
+    assert not dataset.data["mock_header"].to_numpy().flags.writeable
+    assert not dataset.entries[0].data["mock_header"].to_numpy().flags.writeable
+    assert dataset_in_memory.data["mock_header"].to_numpy().flags.writeable
+
+
+def test_dataset_save_raises_dataset_error_if_data_not_numeric(
+    snapshot_dataset: SnapshotDataset,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    snapshot_dataset.entries[0].data = pd.DataFrame({"mock_header": ["a"]})
+
+    # Act & assert.
+    with pytest.raises(DatasetError):
+        snapshot_dataset.save(tmp_path)
+
+
+def test_dataset_iter_entries_yields_deduplicated_entries_without_adding_them(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_a", "id_b", "id_c"]
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            pass
+
+    dataset = MockDataset()
+
+    # Mock.
+    mocker.patch(
+        "ilthermoml.dataset.GetEntry",
+        return_value=mocker.Mock(
+            header={"V1": "mock_header"},
+            data=pd.DataFrame({"V1": []}),
+            components=[
+                mocker.Mock(
+                    id="mock_id",
+                    name="mock_name",
+                    smiles="C[NH3+].[Cl-]",
+                    smiles_error=None,
+                ),
+            ],
+        ),
+    )
+
+    # Act.
+    entries = list(dataset.iter_entries())
+
+    # Assert.
+    assert [entry.id for entry in entries] == ["id_a", "id_b", "id_c"]
+    assert entries[0].ionic_liquid is entries[1].ionic_liquid is entries[2].ionic_liquid
+    assert len(dataset.ionic_liquids) == 1
+    assert not dataset.entries
+
+
+def test_dataset_iter_batches_yields_entries_in_batches(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    class MockDataset(Dataset):
+        @staticmethod
+        def get_entry_ids() -> list[str]:
+            return ["id_a", "id_b", "id_c"]
+
+        @staticmethod
+        def prepare_entry(entry: Entry) -> None:
+            pass
+
+    dataset = MockDataset()
+
+    # Mock.
+    mocker.patch(
+        "ilthermoml.dataset.GetEntry",
+        return_value=mocker.Mock(
+            header={"V1": "mock_header"},
+            data=pd.DataFrame({"V1": []}),
+            components=[
+                mocker.Mock(
+                    id="mock_id",
+                    name="mock_name",
+                    smiles="C[NH3+].[Cl-]",
+                    smiles_error=None,
+                ),
+            ],
+        ),
+    )
+
+    # Act.
+    batches = list(dataset.iter_batches(batch_size=2))
+
+    # Assert.
+    assert [[entry.id for entry in batch] for batch in batches] == [
+        ["id_a", "id_b"],
+        ["id_c"],
+    ]
+    assert len(list(dataset.iter_batches(batch_size=3))) == 1
+
+
+def test_get_entry_reads_entries_from_mirror_if_configured(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+
+    # Mock.
+    mocker.patch("ilthermoml.settings.ILTHERMO_MIRROR", tmp_path / "mirror.db")
+
+    GetEntry("id_a")
+    mocker.patch("ilthermoml.settings.ILTHERMO_OFFLINE", True)  # noqa: FBT003
+
+    # Act.
+    ilt_entry = GetEntry("id_a")
+
+    # Assert.
+    assert ilthermo_server.requests == ["id_a"]
+    assert list(ilt_entry.data["V1"]) == [1.0]
+
+
+def test_get_entry_records_mirror_hits_and_misses(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    stats = Stats()
+
+    # Mock.
+    mocker.patch("ilthermoml.settings.ILTHERMO_MIRROR", tmp_path / "mirror.db")
+
+    # Act.
+    GetEntry("id_a", stats=stats)
+    GetEntry("id_a", stats=stats)
+
+    # Assert.
+    assert stats.counters == {"mirror.hits": 1, "mirror.misses": 1}
+    assert stats.histograms["fetch.bytes"].count == 1
+
+
+def test_get_entry_raises_entry_error_if_offline_and_entry_not_mirrored(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+    tmp_path: Path,
+) -> None:
+    # Mock.
+    mocker.patch("ilthermoml.settings.ILTHERMO_MIRROR", tmp_path / "mirror.db")
+    mocker.patch("ilthermoml.settings.ILTHERMO_OFFLINE", True)  # noqa: FBT003
+
+    # Act & assert.
+    with pytest.raises(EntryError):
+        GetEntry("id_a")
+
+    assert not ilthermo_server.requests
+
+
+class ProcessDataset(Dataset):
+    @staticmethod
+    def get_entry_ids() -> list[str]:
+        return ["id_a", "id_b", "id_c", "id_missing"]
+
+    @staticmethod
+    def prepare_entry(entry: Entry) -> None:
+        entry.select(Column("eta_mpa_s", "Viscosity, Pa&#8226;s => Liquid", 1.0e3))
+
+
+def test_dataset_populate_prepares_entries_in_processes(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    dataset = ProcessDataset()
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.add_entry("id_b", "AAUFrd", [2.0])
+    ilthermo_server.add_entry("id_c", "AAUFrd", [3.0])
+    ilthermo_server.responses["id_b"]["dhead"] = [["Density, kg/m3", "Liquid"]]
+
+    # Mock.
+    mocker.patch("ilthermoml.dataset._cached_get_entry", NullCache().cache(get_entry))
+    mocker.patch("ilthermoml.settings.ILTHERMO_FAILURE_LOG", tmp_path / "failures.db")
+    mock_process_pool = mocker.patch(
+        "ilthermoml.dataset.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+    )
+
+    # Act.
+    dataset.populate(max_workers=2, max_processes=2)
+
+    # Assert.
+    assert (
+        mock_process_pool.call_args.kwargs["mp_context"].get_start_method()
+        == "forkserver"
+    )
+    assert [entry.id for entry in dataset.entries] == ["id_a", "id_c"]
+    assert list(dataset.data["eta_mpa_s"]) == [1.0e3, 3.0e3]
+    assert len(dataset.ionic_liquids) == 1
+    assert dataset.entries[0].ionic_liquid is dataset.entries[1].ionic_liquid
+    assert dataset.failure_summary == {"MissingColumnError": 1}
+    assert dataset.stats.counters["entries.created"] == len(["id_a", "id_c"])
+    assert dataset.stats.counters["entries.failed"] == len(["id_b", "id_missing"])
+    assert dataset.stats.histograms["prepare_entry.seconds"].count == len(
+        ["id_a", "id_b", "id_c"]
+    )
+
+
+@pytest.mark.parametrize(
+    "populate",
+    [
+        lambda dataset: dataset.populate(max_workers=2, max_processes=2),
+        lambda dataset: asyncio.run(dataset.apopulate(max_concurrency=2)),
+    ],
+)
+def test_dataset_populate_aborts_while_circuit_is_open(
+    mocker: MockerFixture,
+    populate: Callable[[Dataset], None],
+) -> None:
+    # Arrange.
+    dataset = ProcessDataset()
+
+    # Mock.
+    mocker.patch(
+        "ilthermoml.dataset.GetEntry",
+        side_effect=CircuitOpenError("requests to ILThermo are suspended"),
+    )
+
+    # Act & assert.
+    with pytest.raises(CircuitOpenError):
+        populate(dataset)
+
+    assert not dataset.entries
+
+
+def test_make_entry_in_process_returns_entry_or_failure_with_stats(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange.
+    def mock_ilt_entry(column: str) -> Any:
+        return mocker.Mock(
+            header={"V1": column},
+            data=pd.DataFrame({"V1": [1.0]}),
+            components=[
+                mocker.Mock(
+                    id="mock_id",
+                    name="mock_name",
+                    smiles="C[NH3+].[Cl-]",
+                    smiles_error=None,
+                ),
+            ],
+        )
+
+    fetch_stats = Stats()
+    fetch_stats.observe("get_entry.seconds", 1.0)
+
+    # Act.
+    _, entry, entry_stats = _make_entry_in_process(
+        ProcessDataset,
+        ("id_a", mock_ilt_entry("Viscosity, Pa&#8226;s => Liquid"), fetch_stats),
+    )
+    _, failure, failure_stats = _make_entry_in_process(
+        ProcessDataset, ("id_b", mock_ilt_entry("Density, kg/m3"), Stats())
+    )
+    _, missing, missing_stats = _make_entry_in_process(
+        ProcessDataset, ("id_c", None, Stats())
+    )
+
+    # Assert.
+    assert isinstance(entry, Entry)
+    assert list(entry.data["eta_mpa_s"]) == [1.0e3]
+    assert entry_stats.histograms["prepare_entry.seconds"].count == 1
+    assert failure == Failure(
+        "id_b",
+        "MissingColumnError",
+        "required column 'Viscosity, Pa&#8226;s => Liquid' is missing",
+    )
+    assert entry_stats.histograms["get_entry.seconds"].total == 1.0
+    assert failure_stats.histograms["prepare_entry.seconds"].count == 1
+    assert missing is None
+    assert missing_stats.to_dict() == {"counters": {}, "histograms": {}}
+
+
+def test_dataset_subclass_can_declare_required_fields() -> None:
+    # Arrange.
+    @dataclass
+    class MockDataset(ProcessDataset):
+        prop: str
+
+    # Act.
+    dataset = MockDataset("Viscosity", lazy=True)
+
+    # Assert.
+    assert dataset.prop == "Viscosity"
+    assert dataset.lazy
+
+
+def test_dataset_lazy_entries_load_data_on_first_access(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Arrange.
+    dataset = ProcessDataset(lazy=True)
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.add_entry("id_b", "AAUFrd", [2.0, 3.0])
+    ilthermo_server.add_entry("id_c", "AAUFrd", [4.0])
+    ilthermo_server.responses["id_b"]["dhead"] = [["Density, kg/m3", "Liquid"]]
+
+    # Mock.
+    mocker.patch("ilthermoml.dataset._cached_get_entry", NullCache().cache(get_entry))
+
+    dataset.populate(max_processes=2)
+    ilthermo_server.requests.clear()
+
+    # Act.
+    num_data_points = [entry.num_data_points for entry in dataset.entries]
+    data = dataset.entries[0].data
+
+    # Assert.
+    assert num_data_points == [1, 2, 1]
+    assert list(data["eta_mpa_s"]) == [1.0e3]
+    assert dataset.entries[0].data is data
+    assert ilthermo_server.requests == ["id_a"]
+    assert dataset.stats.histograms["prepare_entry.seconds"].count == 1
+
+    with pytest.raises(MissingColumnError):
+        dataset.entries[1].data  # noqa: B018
+
+    assert dataset.entries[1].num_data_points == len([2.0, 3.0])
+
+
+def test_dataset_release_releases_data_of_lazy_entries(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Arrange.
+    dataset = ProcessDataset(lazy=True)
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.add_entry("id_c", "AAUFrd", [2.0])
+
+    # Mock.
+    mocker.patch("ilthermoml.dataset._cached_get_entry", NullCache().cache(get_entry))
+
+    dataset.populate()
+    first_data = dataset.data
+    ilthermo_server.requests.clear()
+
+    # Act.
+    dataset.release()
+    dataset.release()
+
+    # Assert.
+    assert [entry.num_data_points for entry in dataset.entries] == [1, 1]
+    assert not ilthermo_server.requests
+    assert dataset.data is not first_data
+    assert list(dataset.data["eta_mpa_s"]) == [1.0e3, 2.0e3]
+    assert ilthermo_server.requests == ["id_a", "id_c"]
+
+
+def test_dataset_data_keeps_cache_of_released_lazy_entries(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Arrange.
+    dataset = ProcessDataset(lazy=True)
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.add_entry("id_c", "AAUFrd", [2.0])
+
+    # Mock.
+    mocker.patch("ilthermoml.dataset._cached_get_entry", NullCache().cache(get_entry))
+
+    dataset.populate()
+    data = dataset.data
+    entry_data = weakref.ref(dataset.entries[0].data)
+    ilthermo_server.requests.clear()
+
+    # Act.
+    for entry in dataset.entries:
+        entry.release()
+
+    gc.collect()
+
+    # Assert.
+    assert entry_data() is None
+    assert dataset.data is data
+    assert not ilthermo_server.requests
+
+    dataset.entries[1].data = dataset.entries[1].data * 2.0
+    assert list(dataset.data["eta_mpa_s"]) == [1.0e3, 4.0e3]
+
+
+def test_dataset_data_drops_lazy_entries_failing_preparation(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    dataset = ProcessDataset(lazy=True)
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.add_entry("id_b", "AAUFrd", [2.0, 3.0])
+    ilthermo_server.add_entry("id_c", "AAUFrd", [4.0])
+    ilthermo_server.responses["id_b"]["dhead"] = [["Density, kg/m3", "Liquid"]]
+
+    # Mock.
+    mocker.patch("ilthermoml.dataset._cached_get_entry", NullCache().cache(get_entry))
+    mocker.patch("ilthermoml.settings.ILTHERMO_FAILURE_LOG", tmp_path / "failures.db")
+
+    dataset.populate()
+
+    # Act.
+    data = dataset.data
+
+    # Assert.
+    assert [entry.id for entry in dataset.entries] == ["id_a", "id_c"]
+    assert list(data["eta_mpa_s"]) == [1.0e3, 4.0e3]
+    assert dataset.failure_summary == {"MissingColumnError": 1}
+    assert dataset.stats.counters["entries.failed"] == len(["id_missing", "id_b"])
+
+
+def test_dataset_data_raises_errors_loading_lazy_entries(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Arrange.
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.add_entry("id_b", "AAUFrd", [2.0])
+    ilthermo_server.responses["id_a"]["dhead"] = [["Density, kg/m3", "Liquid"]]
+
+    # Mock.
+    mocker.patch("ilthermoml.dataset._cached_get_entry", NullCache().cache(get_entry))
+
+    (dataset := ProcessDataset(lazy=True)).populate()
+    response = ilthermo_server.responses.pop("id_b")
+
+    # Act & assert.
+    with pytest.raises(EntryFetchError):
+        dataset.data  # noqa: B018
+
+    assert [entry.id for entry in dataset.entries] == ["id_b"]
+
+    ilthermo_server.responses["id_b"] = response
+    response["dhead"] = [["Density, kg/m3", "Liquid"]]
+
+    with pytest.raises(DatasetError, match="empty"):
+        dataset.data  # noqa: B018
+
+
+def test_dataset_lazy_entries_restored_from_checkpoint_are_prepared(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    mocker.patch(
+        "ilthermoml.dataset.GetEntry",
+        return_value=mocker.Mock(
+            header={"V1": "Viscosity, Pa&#8226;s => Liquid"},
+            data=pd.DataFrame({"V1": [1.0]}),
+            components=[
+                mocker.Mock(
+                    id="mock_id",
+                    name="mock_name",
+                    smiles="C[NH3+].[Cl-]",
+                    smiles_error=None,
+                ),
+            ],
+        ),
+    )
+
+    ProcessDataset(lazy=True).populate(checkpoint_dir=tmp_path)
+    dataset = ProcessDataset(lazy=True)
+
+    # Act.
+    dataset.populate(checkpoint_dir=tmp_path)
+
+    # Assert.
+    assert list(dataset.entries[0].data.columns) == ["eta_mpa_s"]
+
+
+def test_dataset_release_keeps_data_of_entries_that_are_not_lazy(
+    snapshot_dataset: SnapshotDataset,
+) -> None:
+    # Arrange.
+    data = snapshot_dataset.entries[0].data
+
+    # Act.
+    snapshot_dataset.release()
+
+    # Assert.
+    assert snapshot_dataset.entries[0].data is data
+
+
+def test_entry_release_raises_entry_error_if_entry_is_not_lazy() -> None:
+    # Arrange.
+    entry = Entry.from_data(
+        "id_a", IonicLiquid("C[NH3+].[Cl-]"), pd.DataFrame({"a": [1.0]})
+    )
+
+    # Act & assert.
+    with pytest.raises(EntryError):
+        entry.release()
+
+
+def test_dataset_compact_data_codes_ids_and_downcasts_columns(
+    snapshot_dataset: SnapshotDataset,
+) -> None:
+    # Act.
+    data = snapshot_dataset.compact_data()
+
+    # Assert.
+    assert list(data.columns) == [
+        "entry_id",
+        "ionic_liquid_id",
+        "data_point_id",
+        "mock_header",
+        "other_header",
+    ]
+    assert list(data["entry_id"].cat.categories) == ["id_a", "id_b", "id_c"]
+    assert list(data["entry_id"]) == ["id_a", "id_a", "id_b", "id_b", "id_c", "id_c"]
+    assert list(data["ionic_liquid_id"]) == [0, 0, 1, 1, 0, 0]
+    assert list(data["data_point_id"]) == [0, 1] * 3
+    assert list(data["mock_header"]) == [1.0, 2.0] * 3
+    assert data.dtypes.to_dict() == {
+        "entry_id": "category",
+        "ionic_liquid_id": "int8",
+        "data_point_id": "int8",
+        "mock_header": "float32",
+        "other_header": "int8",
+    }
+
+
+def test_dataset_compact_data_keeps_floats_and_other_columns(
+    snapshot_dataset: SnapshotDataset,
+) -> None:
+    # Arrange.
+    for entry in snapshot_dataset.entries:
+        entry.data = entry.data.assign(other_header=["a", "b"])
+
+    # Act.
+    data = snapshot_dataset.compact_data(float_dtype=None)
+
+    # Assert.
+    assert data["mock_header"].dtype == "float64"
+    assert list(data["other_header"]) == ["a", "b"] * 3
+
+
+def test_dataset_memory_report_compares_data_with_compact_data(
+    snapshot_dataset: SnapshotDataset,
+) -> None:
+    # Act.
+    report = snapshot_dataset.memory_report()
+
+    # Assert.
+    assert list(report.columns) == ["data", "compact"]
+    assert report.loc["entry_id", "data"] == 0
+    assert report.loc["mock_header", "compact"] == 6 * 4
+    assert report.loc["Total", "compact"] < report.loc["Total", "data"]
+    assert report.loc["Total"].tolist() == report.drop("Total").sum().tolist()
+
+
+class RecordingCallback(ProgressCallback):
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.events: list[EntryEvent] = []
+
+    def on_start(self, progress: Progress) -> None:
+        self.calls.append(f"start:{progress.total}")
+
+    def on_entry(self, event: EntryEvent, progress: Progress) -> None:
+        self.calls.append(f"entry:{progress.completed}")
+        self.events.append(event)
+
+    def on_end(self, progress: Progress) -> None:
+        self.calls.append(f"end:{progress.failed}")
+
+
+@pytest.mark.parametrize("max_processes", [None, 2])
+def test_dataset_populate_reports_entry_events_to_callbacks(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+    max_processes: int | None,
+) -> None:
+    # Arrange.
+    dataset = ProcessDataset()
+    callback = RecordingCallback()
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.add_entry("id_b", "AAUFrd", [2.0])
+    ilthermo_server.add_entry("id_c", "AAUFrd", [3.0])
+    ilthermo_server.responses["id_b"]["dhead"] = [["Density, kg/m3", "Liquid"]]
+
+    # Mock.
+    mocker.patch("ilthermoml.dataset._cached_get_entry", NullCache().cache(get_entry))
+
+    # Act.
+    dataset.populate(max_processes=max_processes, callbacks=[callback])
+
+    # Assert.
+    assert callback.calls == [
+        "start:4",
+        "entry:1",
+        "entry:2",
+        "entry:3",
+        "entry:4",
+        "end:2",
+    ]
+    assert [(event.entry_id, event.reason) for event in callback.events] == [
+        ("id_a", None),
+        ("id_b", "MissingColumnError"),
+        ("id_c", None),
+        ("id_missing", "EntryFetchError"),
+    ]
+    assert set(callback.events[0].timings) == {"fetch", "parse", "prepare", "dedup"}
+    assert set(callback.events[3].timings) == {"fetch"}
+    assert dataset.stats.histograms["dedup.seconds"].count == len(["id_a", "id_c"])
+
+
+def test_dataset_apopulate_reports_entry_events_to_callbacks(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+) -> None:
+    # Arrange.
+    dataset = ProcessDataset()
+    callback = RecordingCallback()
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.add_entry("id_c", "AAUFrd", [3.0])
+    ilthermo_server.latency = 0.01
+
+    # Mock.
+    mocker.patch("ilthermoml.dataset._cached_get_entry", NullCache().cache(get_entry))
+
+    # Act.
+    asyncio.run(dataset.apopulate(max_concurrency=4, callbacks=[callback]))
+
+    # Assert.
+    assert [(event.entry_id, event.failed) for event in callback.events] == [
+        ("id_a", False),
+        ("id_b", True),
+        ("id_c", False),
+        ("id_missing", True),
+    ]
+    assert callback.calls[-1] == "end:2"
+    assert [entry.id for entry in dataset.entries] == ["id_a", "id_c"]
+    assert dataset.stats.histograms["get_entry.seconds"].count == len(callback.events)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ilthermoml.failures import Failure, FailureLog
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_failure_log_records_failures_by_version(tmp_path: Path) -> None:
+    # Arrange.
+    failure_log = FailureLog(tmp_path / "failures.db")
+
+    # Act.
+    failure_log.add("v1", Failure("id_a", "KeyError", "missing column"))
+    failure_log.add("v1", Failure("id_b", "EntryError", "multiple components"))
+    failure_log.add("v1", Failure("id_c", "KeyError", "missing column"))
+    failure_log.add("v2", Failure("id_d", "KeyError", "missing column"))
+
+    # Assert.
+    assert failure_log.get("v1") == [
+        Failure("id_a", "KeyError", "missing column"),
+        Failure("id_b", "EntryError", "multiple components"),
+        Failure("id_c", "KeyError", "missing column"),
+    ]
+    assert failure_log.entry_ids("v2") == {"id_d"}
+    assert failure_log.summary("v1") == {"EntryError": 1, "KeyError": 2}
+    assert failure_log.get("v3") == []
+
+
+def test_failure_log_persists_failures(tmp_path: Path) -> None:
+    # Arrange.
+    failure_log = FailureLog(tmp_path / "failures.db")
+    failure_log.add("v1", Failure("id_a", "KeyError", "missing column"))
+    failure_log.close()
+
+    # Act.
+    failure_log = FailureLog(tmp_path / "failures.db")
+
+    # Assert.
+    assert failure_log.entry_ids("v1") == {"id_a"}
+
+
+def test_failure_log_clear_removes_failures_of_version(tmp_path: Path) -> None:
+    # Arrange.
+    failure_log = FailureLog(tmp_path / "failures.db")
+    failure_log.add("v1", Failure("id_a", "KeyError", "missing column"))
+    failure_log.add("v2", Failure("id_b", "KeyError", "missing column"))
+
+    # Act.
+    failure_log.clear("v1")
+
+    # Assert.
+    assert failure_log.entry_ids("v1") == set()
+    assert failure_log.entry_ids("v2") == {"id_b"}
+
+    failure_log.clear()
+    assert failure_log.entry_ids("v2") == set()
@@ -12,6 +12,7 @@ from ilthermoml.featurization import (
     PadelMoleculeFeaturizer,
     RDKitMoleculeFeaturizer,
     SaltFeaturizer,
+    padel_calc_descriptors,
 )
 
 if TYPE_CHECKING:
@@ -166,3 +167,63 @@ def test_salt_featurizer_value_is_none_when_descriptor_is_none() -> None:
 
     # Act & assert.
     assert not featurize(salt)["Test"]
+
+
+def test_salt_featurizer_stats_record_cache_hits_and_misses(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch(
+        "ilthermoml.featurization.CalcMolDescriptors",
+        return_value={"Test": 1.0},
+    )
+
+    # Arrange.
+    featurize = SaltFeaturizer(max, RDKitMoleculeFeaturizer())
+    salt = Salt("[Na+].[Cl-]")
+
+    # Act.
+    featurize(salt)
+    featurize(salt)
+
+    # Assert.
+    stats = featurize.stats.to_dict()
+    assert stats["counters"] == {"cache.hits": 2, "cache.misses": 2}
+    assert stats["histograms"]["featurize.seconds"]["count"] == 4  # noqa: PLR2004
+    assert (
+        stats["children"]["featurizer"]["histograms"]["featurize.seconds"]["count"] == 2  # noqa: PLR2004
+    )
+
+
+def test_padel_molecule_featurizer_stats_include_descriptor_cache_stats() -> None:
+    # Act.
+    featurize = PadelMoleculeFeaturizer()
+
+    # Assert.
+    assert (
+        featurize.stats.children["padel_calc_descriptors"]
+        is padel_calc_descriptors.stats
+    )
+
+
+def test_molecule_featurizer_records_stats_without_calling_init(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch(
+        "ilthermoml.featurization.CalcMolDescriptors",
+        return_value={"Test": 1.0},
+    )
+
+    # Arrange.
+    class MockFeaturizer(RDKitMoleculeFeaturizer):
+        def __init__(self, prefix: str) -> None:
+            self.prefix = prefix
+
+    featurize = MockFeaturizer("test")
+
+    # Act.
+    featurize(Ion("[Na+]"))
+
+    # Assert.
+    assert featurize.stats.histograms["featurize.seconds"].count == 1
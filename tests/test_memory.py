@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ilthermoml.memory import DiskCache, NullCache, create_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+calls: list[int] = []
+
+
+def square(value: int, verbose: bool = False) -> int:  # noqa: ARG001, FBT001, FBT002
+    calls.append(value)
+
+    return value**2
+
+
+def set_in_cache(location: Path, key: str) -> None:
+    DiskCache(location).set(key, os.getpid())
+
+
+def test_cached_function_calls_function_once_per_arguments(tmp_path: Path) -> None:
+    # Arrange.
+    calls.clear()
+    cached_square = DiskCache(tmp_path).cache(square, ignore=["verbose"])
+
+    # Act.
+    results = [cached_square(2), cached_square(2, verbose=True), cached_square(3)]
+
+    # Assert.
+    assert results == [4, 4, 9]
+    assert calls == [2, 3]
+    assert cached_square.stats.counters == {"cache.hits": 1, "cache.misses": 2}
+    assert cached_square.check_call_in_cache(2)
+    assert not cached_square.check_call_in_cache(4)
+
+
+def test_disk_cache_raises_key_error_for_missing_key(tmp_path: Path) -> None:
+    # Arrange.
+    cache = DiskCache(tmp_path)
+
+    # Act & Assert.
+    with pytest.raises(KeyError):
+        cache.get("missing")
+
+
+@pytest.mark.parametrize("compression", [0, 9])
+def test_disk_cache_round_trips_values(tmp_path: Path, compression: int) -> None:
+    # Arrange.
+    cache = DiskCache(tmp_path, compression=compression)
+    value = {"a": [1.0] * 1000, "b": None}
+
+    # Act.
+    cache.set("key", value)
+
+    # Assert.
+    assert cache.get("key") == value
+
+
+def test_disk_cache_evicts_least_recently_used_values(tmp_path: Path) -> None:
+    # Arrange.
+    cache = DiskCache(tmp_path)
+    cache.set("a", b"a" * 1000)
+    cache.max_bytes = 2 * cache.size
+
+    # Act.
+    cache.set("b", b"b" * 1000)
+    cache.get("a")
+    cache.set("c", b"c" * 1000)
+
+    # Assert.
+    assert cache.get("a") == b"a" * 1000
+    assert cache.get("c") == b"c" * 1000
+    assert cache.size <= cache.max_bytes
+
+    with pytest.raises(KeyError):
+        cache.get("b")
+
+
+def test_disk_cache_evicts_all_values_larger_than_limit(tmp_path: Path) -> None:
+    # Arrange.
+    cache = DiskCache(tmp_path, max_bytes=0)
+
+    # Act.
+    cache.set("a", b"a" * 1000)
+    cache.set("b", b"b" * 1000)
+
+    # Assert.
+    assert cache.size == 0
+
+
+def test_disk_cache_keeps_total_size_of_values(tmp_path: Path) -> None:
+    # Arrange.
+    cache = DiskCache(tmp_path)
+    cache.set("a", b"a" * 1000)
+    cache.set("b", b"b" * 1000)
+    size = cache.size
+
+    # Act.
+    cache.set("a", b"a" * 3000)
+    replaced_size = cache.size
+    reopened_size = DiskCache(tmp_path).size
+
+    # Assert.
+    assert replaced_size == size + 2000
+    assert reopened_size == replaced_size
+
+
+def test_disk_cache_writes_accesses_in_batches(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    # Mock.
+    mocker.patch("ilthermoml.memory._ACCESS_BATCH_SIZE", 2)
+
+    # Arrange.
+    cache = DiskCache(tmp_path)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    reader = DiskCache(tmp_path, max_bytes=cache.size)
+
+    # Act.
+    reader.get("a")
+    pending_accesses = dict(reader._accesses)  # noqa: SLF001
+    reader.get("b")
+    reader.set("d", 4)
+
+    # Assert.
+    assert list(pending_accesses) == ["a"]
+    assert not reader._accesses  # noqa: SLF001
+    assert [reader.get(key) for key in ("a", "b", "d")] == [1, 2, 4]
+
+    with pytest.raises(KeyError):
+        reader.get("c")
+
+
+def test_disk_cache_caches_functions_without_source(tmp_path: Path) -> None:
+    # Arrange.
+    cached_abs = DiskCache(tmp_path).cache(abs)
+
+    # Act.
+    result = cached_abs(-1)
+
+    # Assert.
+    assert result == 1
+    assert cached_abs.check_call_in_cache(-1)
+
+
+def test_disk_cache_expires_values_after_ttl(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    # Arrange.
+    cache = DiskCache(tmp_path, ttl=60.0)
+
+    mock_time = mocker.patch("ilthermoml.memory.time.time", return_value=0.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Act.
+    mock_time.return_value = 30.0
+    a = cache.get("a")
+
+    mock_time.return_value = 90.0
+    cache.set("c", 3)
+
+    # Assert.
+    assert a == 1
+    assert cache.get("c") == 3  # noqa: PLR2004
+
+    with pytest.raises(KeyError):
+        cache.get("a")
+    with pytest.raises(KeyError):
+        cache.get("b")
+
+
+def test_disk_cache_get_removes_expired_value(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    # Arrange.
+    cache = DiskCache(tmp_path, ttl=60.0)
+
+    mock_time = mocker.patch("ilthermoml.memory.time.time", return_value=0.0)
+    cache.set("a", 1)
+
+    # Act.
+    mock_time.return_value = 90.0
+
+    with pytest.raises(KeyError):
+        cache.get("a")
+
+    # Assert.
+    assert cache.size == 0
+
+
+def test_disk_cache_clear_removes_all_values(tmp_path: Path) -> None:
+    # Arrange.
+    cache = DiskCache(tmp_path)
+    cache.set("a", 1)
+
+    # Act.
+    cache.clear()
+
+    # Assert.
+    assert cache.size == 0
+
+
+def test_disk_cache_is_shared_between_processes(tmp_path: Path) -> None:
+    # Arrange.
+    cache = DiskCache(tmp_path)
+    cache.set("parent", os.getpid())
+
+    # Act.
+    process = multiprocessing.get_context("spawn").Process(
+        target=set_in_cache, args=(tmp_path, "child")
+    )
+    process.start()
+    process.join()
+
+    # Assert.
+    assert cache.get("parent") == os.getpid()
+    assert cache.get("child") == process.pid
+
+
+def test_null_cache_stores_nothing() -> None:
+    # Arrange.
+    calls.clear()
+    cached_square = NullCache().cache(square)
+
+    # Act.
+    cached_square(2)
+    cached_square(2)
+
+    # Assert.
+    assert calls == [2, 2]
+    assert not cached_square.check_call_in_cache(2)
+
+
+@pytest.mark.parametrize(
+    ("backend", "cache_type"), [("disk", DiskCache), ("null", NullCache)]
+)
+def test_create_cache_creates_configured_backend(
+    mocker: MockerFixture, tmp_path: Path, backend: str, cache_type: type
+) -> None:
+    # Mock.
+    mocker.patch("ilthermoml.settings.CACHE_BACKEND", backend)
+    mocker.patch("ilthermoml.settings.CACHE_LOCATION", tmp_path)
+
+    # Act.
+    cache = create_cache()
+
+    # Assert.
+    assert isinstance(cache, cache_type)
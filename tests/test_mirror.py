@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pytest
+
+from ilthermoml.client import CircuitBreaker
+from ilthermoml.exceptions import CircuitOpenError
+from ilthermoml.mirror import Mirror
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+    from tests.conftest import ILThermoStub
+
+
+def test_mirror_stores_responses_by_entry_id(tmp_path: Path) -> None:
+    # Arrange.
+    mirror = Mirror(tmp_path / "mirror.db")
+
+    # Act.
+    mirror.put("id_a", {"key": "value"})
+
+    # Assert.
+    assert mirror.get("id_a") == {"key": "value"}
+    assert mirror.get("id_b") is None
+    assert "id_a" in mirror
+    assert "id_b" not in mirror
+    assert len(mirror) == 1
+
+
+def test_mirror_persists_responses(tmp_path: Path) -> None:
+    # Arrange.
+    mirror = Mirror(tmp_path / "mirror.db")
+    mirror.put("id_a", {"key": "value"})
+    mirror.close()
+
+    # Act.
+    mirror = Mirror(tmp_path / "mirror.db")
+
+    # Assert.
+    assert mirror.entry_ids() == ["id_a"]
+
+
+def test_mirror_download_retrieves_entries_not_mirrored_yet(
+    ilthermo_server: ILThermoStub,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    mirror = Mirror(tmp_path / "mirror.db")
+    mirror.put("id_a", {"key": "value"})
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+    ilthermo_server.add_entry("id_b", "AAUFrd", [2.0])
+
+    # Act.
+    downloaded_entry_ids = mirror.download(["id_a", "id_b", "id_c"])
+
+    # Assert.
+    assert downloaded_entry_ids == ["id_b"]
+    assert sorted(ilthermo_server.requests) == ["id_b", "id_c"]
+    assert mirror.get("id_b") == ilthermo_server.responses["id_b"]
+
+
+def test_mirror_download_property_retrieves_entries_found(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    mirror = Mirror(tmp_path / "mirror.db")
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+
+    # Mock.
+    mock_search = mocker.patch(
+        "ilthermopy.Search", return_value=pd.DataFrame({"id": ["id_a"]})
+    )
+
+    # Act.
+    downloaded_entry_ids = mirror.download_property("Viscosity")
+
+    # Assert.
+    mock_search.assert_called_once_with(prop="Viscosity")
+    assert downloaded_entry_ids == ["id_a"]
+
+
+def test_mirror_download_aborts_while_circuit_is_open(
+    mocker: MockerFixture,
+    ilthermo_server: ILThermoStub,
+    tmp_path: Path,
+) -> None:
+    # Arrange.
+    mirror = Mirror(tmp_path / "mirror.db")
+
+    ilthermo_server.add_entry("id_a", "AAUFrd", [1.0])
+
+    # Mock.
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    breaker.record_failure()
+    mocker.patch("ilthermoml.client._circuit_breaker", breaker)
+
+    # Act & assert.
+    with pytest.raises(CircuitOpenError):
+        mirror.download(["id_a"])
+
+    assert not ilthermo_server.requests
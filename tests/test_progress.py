@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ilthermoml.progress import EntryEvent, Progress, TqdmProgress
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_progress_aggregates_entry_events(mocker: MockerFixture) -> None:
+    # Mock.
+    mocker.patch("ilthermoml.progress.time.perf_counter", return_value=2.0)
+
+    # Arrange.
+    progress = Progress(total=3, start=0.0)
+
+    # Act.
+    progress.update(EntryEvent("id_a", timings={"fetch": 1.0, "prepare": 0.5}))
+    progress.update(EntryEvent("id_b", "KeyError", {"fetch": 2.0, "other": 1.0}))
+
+    # Assert.
+    assert progress.to_dict() == {
+        "total": 3,
+        "completed": 2,
+        "failed": 1,
+        "elapsed": 2.0,
+        "throughput": 1.0,
+        "stage_seconds": {
+            "fetch": 3.0,
+            "parse": 0.0,
+            "prepare": 0.5,
+            "dedup": 0.0,
+            "other": 1.0,
+        },
+    }
+
+
+def test_progress_throughput_is_zero_before_any_time_elapsed(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch("ilthermoml.progress.time.perf_counter", return_value=0.0)
+
+    # Act.
+    progress = Progress(total=1, start=0.0)
+
+    # Assert.
+    assert progress.throughput == 0.0
+
+
+def test_tqdm_progress_updates_progress_bar(mocker: MockerFixture) -> None:
+    # Mock.
+    mock_tqdm = mocker.patch("ilthermoml.progress.tqdm")
+
+    # Arrange.
+    callback = TqdmProgress(desc="mock_desc")
+    progress = Progress(total=2)
+
+    # Act.
+    callback.on_entry(EntryEvent("id_a"), progress)
+    callback.on_start(progress)
+    callback.on_entry(EntryEvent("id_a", "KeyError"), progress)
+    callback.on_end(progress)
+    callback.on_end(progress)
+
+    # Assert.
+    mock_tqdm.assert_called_once_with(total=2, desc="mock_desc")
+    mock_tqdm.return_value.update.assert_called_once_with()
+    mock_tqdm.return_value.close.assert_called_once_with()
+
+
+@pytest.mark.parametrize("reason", [None, "KeyError"])
+def test_entry_event_failed_depends_on_reason(reason: str | None) -> None:
+    # Act.
+    event = EntryEvent("id_a", reason)
+
+    # Assert.
+    assert event.failed == (reason is not None)
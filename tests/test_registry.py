@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import pytest
+
+from ilthermoml.registry import Registry
+
+
+def test_registry_add_returns_registered_item_with_same_key() -> None:
+    # Arrange.
+    registry: Registry[str] = Registry(key=str.lower)
+    registry.add("A")
+
+    # Act.
+    item = registry.add("a")
+
+    # Assert.
+    assert item == "A"
+    assert list(registry) == ["A"]
+    assert repr(registry) == "Registry(['A'])"
+
+
+def test_registry_keeps_items_in_order_of_registration() -> None:
+    # Arrange.
+    registry: Registry[str] = Registry(key=str.lower)
+
+    # Act.
+    for item in ["b", "a", "B", "c"]:
+        registry.add(item)
+
+    # Assert.
+    assert list(registry) == ["b", "a", "c"]
+    assert registry[1] == "a"
+    assert len(registry) == len(["b", "a", "c"])
+
+
+def test_registry_index_returns_index_of_item_with_same_key() -> None:
+    # Arrange.
+    registry: Registry[str] = Registry(key=str.lower)
+
+    for item in ["a", "b", "c"]:
+        registry.add(item)
+
+    # Act & assert.
+    assert registry.index("C") == registry.index("c") == 2  # noqa: PLR2004
+    assert "B" in registry
+    assert "d" not in registry
+
+
+def test_registry_index_raises_value_error_if_item_not_registered() -> None:
+    # Arrange.
+    registry: Registry[str] = Registry(key=str.lower)
+    registry.add("a")
+
+    # Act & assert.
+    with pytest.raises(ValueError, match="not registered"):
+        registry.index("b")
+
+    with pytest.raises(ValueError, match="not registered"):
+        registry.index("a", start=1)
+
+
+def test_registry_does_not_contain_objects_without_key() -> None:
+    # Arrange.
+    registry: Registry[str] = Registry(key=str.lower)
+    registry.add("a")
+    values: list[object] = [1, None]
+
+    # Act & assert.
+    assert all(value not in registry for value in values)
+
+    with pytest.raises(ValueError, match="not registered"):
+        registry.index(values[0])
+
+
+def test_registry_get_returns_item_by_key() -> None:
+    # Arrange.
+    registry: Registry[str] = Registry(key=str.lower)
+    registry.add("A")
+
+    # Act & assert.
+    assert registry.get("a") == "A"
+    assert registry.get("b") is None
+
+
+def test_registry_table_holds_properties_computed_on_registration() -> None:
+    # Arrange.
+    properties = []
+
+    def compute_properties(item: str) -> dict[str, object]:
+        properties.append(item)
+        return {"item": item, "length": len(item)}
+
+    registry: Registry[str] = Registry(key=str.lower, properties=compute_properties)
+
+    # Act.
+    for item in ["a", "bb", "A"]:
+        registry.add(item)
+
+    table = registry.table
+
+    # Assert.
+    assert properties == ["a", "bb"]
+    assert table.to_dict(orient="list") == {"item": ["a", "bb"], "length": [1, 2]}
+    assert registry.table is table
+
+    registry.add("ccc")
+    assert registry.table["length"].tolist() == [1, 2, 3]
+
+
+def test_registry_table_is_empty_without_properties() -> None:
+    # Arrange.
+    registry: Registry[str] = Registry(key=str.lower)
+    registry.add("a")
+
+    # Act.
+    table = registry.table
+
+    # Assert.
+    assert table.columns.empty
+    assert table.index.tolist() == [0]
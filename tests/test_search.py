@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pytest
+
+from ilthermoml.memory import DiskCache
+from ilthermoml.search import _search, _searches, search, search_entry_ids
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+    from unittest.mock import Mock
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def mock_search(mocker: MockerFixture, tmp_path: Path) -> Iterator[Mock]:
+    _searches.clear()
+
+    mocker.patch("ilthermoml.search._cached_search", DiskCache(tmp_path).cache(_search))
+
+    yield mocker.patch(
+        "ilthermopy.Search",
+        return_value=pd.DataFrame(
+            {
+                "id": ["id_a", "id_b", "id_c", "id_d"],
+                "property": ["Viscosity"] * 4,
+                "phases": ["Liquid", "Liquid", "Liquid; Gas", "Liquid"],
+                "num_phases": [1, 1, 2, 1],
+                "num_components": [1, 1, 1, 2],
+                "cmp1_smiles": ["C[N+].[Cl-]", "CCO", "C[N+].[Br-]", None],
+                "cmp2_smiles": [None, None, None, "O"],
+            }
+        ),
+    )
+
+    _searches.clear()
+
+
+def test_search_adds_indexed_columns(mock_search: Mock) -> None:
+    # Act.
+    results = search("Viscosity")
+
+    # Assert.
+    mock_search.assert_called_once_with(prop="Viscosity")
+    assert results["cmp1_num_ions"].tolist() == [2, 1, 2, pd.NA]
+    assert results["cmp2_num_ions"].tolist() == [pd.NA, pd.NA, pd.NA, 1]
+    assert isinstance(results["phases"].dtype, pd.CategoricalDtype)
+    assert isinstance(results["property"].dtype, pd.CategoricalDtype)
+
+
+def test_search_queries_ilthermo_once_per_property(mock_search: Mock) -> None:
+    # Arrange.
+    search("Viscosity")
+    _searches.clear()
+
+    # Act.
+    results = [search("Viscosity"), search("Viscosity")]
+
+    # Assert.
+    mock_search.assert_called_once_with(prop="Viscosity")
+    assert results[0] is results[1]
+
+
+def test_search_refresh_queries_ilthermo_again(mock_search: Mock) -> None:
+    # Arrange.
+    results = search("Viscosity")
+
+    # Act.
+    refreshed_results = search_entry_ids("Viscosity", refresh=True)
+    _searches.clear()
+    search("Viscosity")
+
+    # Assert.
+    assert mock_search.call_count == 2  # noqa: PLR2004
+    assert refreshed_results == results["id"].tolist()
+
+
+def test_search_queries_ilthermo_again_after_ttl(
+    mocker: MockerFixture, mock_search: Mock
+) -> None:
+    # Mock.
+    mocker.patch("ilthermoml.settings.ILTHERMO_SEARCH_TTL", 60.0)
+    mock_time = mocker.patch("ilthermoml.search.time").time
+    mock_time.return_value = 0.0
+
+    # Arrange.
+    search("Viscosity")
+    mock_time.return_value = 60.0
+
+    # Act.
+    results = [search("Viscosity"), search("Viscosity")]
+
+    # Assert.
+    assert mock_search.call_count == 2  # noqa: PLR2004
+    assert results[0] is results[1]
+
+
+def test_search_returns_empty_results_of_property_without_entries(
+    mock_search: Mock,
+) -> None:
+    # Mock.
+    mock_search.return_value = pd.DataFrame()
+
+    # Act.
+    results = search("Viscosity")
+    entry_ids = search_entry_ids("Viscosity", num_components=1)
+
+    # Assert.
+    assert results.empty
+    assert entry_ids == []
+
+
+@pytest.mark.usefixtures("mock_search")
+def test_search_entry_ids_filters_entries() -> None:
+    # Act.
+    entry_ids = search_entry_ids(
+        "Viscosity", num_components=1, phases="Liquid", cmp1_num_ions=2
+    )
+
+    # Assert.
+    assert entry_ids == ["id_a"]
+
+
+@pytest.mark.usefixtures("mock_search")
+def test_search_entry_ids_matches_any_of_collection_values() -> None:
+    # Act.
+    entry_ids = search_entry_ids("Viscosity", limit=2, cmp1_num_ions=[1, 2])
+
+    # Assert.
+    assert entry_ids == ["id_a", "id_b"]
+
+
+@pytest.mark.usefixtures("mock_search")
+def test_search_entry_ids_raises_key_error_for_unknown_column() -> None:
+    # Act & assert.
+    with pytest.raises(KeyError):
+        search_entry_ids("Viscosity", unknown=1)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from rdkit import DataStructs
+from rdkit.Chem import rdFingerprintGenerator
+
+from ilthermoml.chemistry import Anion, Cation
+from ilthermoml.similarity import FingerprintIndex
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+CATIONS = [
+    "CCCCn1cc[n+](C)c1",
+    "CCn1cc[n+](C)c1",
+    "CCCC[n+]1ccccc1",
+    "CCCC[N+](C)(C)C",
+    "CCCC[P+](CCCC)(CCCC)CCCC",
+]
+
+
+def test_fingerprint_index_similarity_matches_rdkit_tanimoto() -> None:
+    # Arrange.
+    cations = [Cation(smiles) for smiles in CATIONS]
+    generator = rdFingerprintGenerator.GetMorganGenerator(radius=2, fpSize=2048)
+    fingerprints = [generator.GetFingerprint(cation.rdkit_mol) for cation in cations]
+
+    index = FingerprintIndex()
+    index.add(cations)
+
+    # Act.
+    similarities = index.similarity(cations)
+
+    # Assert.
+    assert similarities == pytest.approx(
+        np.array(
+            [
+                DataStructs.BulkTanimotoSimilarity(fingerprint, fingerprints)
+                for fingerprint in fingerprints
+            ]
+        )
+    )
+
+
+def test_fingerprint_index_search_returns_top_k_by_decreasing_similarity(
+    mocker: MockerFixture,
+) -> None:
+    # Mock.
+    mocker.patch("ilthermoml.similarity._MAX_PAIRS", 4)
+
+    # Arrange.
+    cations = [Cation(smiles) for smiles in CATIONS]
+    index = FingerprintIndex()
+    index.add(cations)
+
+    # Act.
+    indices, similarities = index.search(cations, k=2)
+
+    # Assert.
+    assert len(index) == len(CATIONS)
+    assert indices[:, 0].tolist() == list(range(len(CATIONS)))
+    assert indices[:2, 1].tolist() == [1, 0]
+    assert similarities[:, 0] == pytest.approx(1.0)
+    assert (similarities[:, 0] >= similarities[:, 1]).all()
+
+
+def test_fingerprint_index_adds_molecules_incrementally() -> None:
+    # Arrange.
+    cations = [Cation(smiles) for smiles in CATIONS]
+    index = FingerprintIndex()
+    incremental_index = FingerprintIndex()
+
+    index.add(cations)
+
+    # Act.
+    for cation in cations:
+        incremental_index.add([cation])
+
+    # Assert.
+    assert incremental_index.similarity(cations) == pytest.approx(
+        index.similarity(cations)
+    )
+
+
+def test_fingerprint_index_search_only_searches_masked_molecules() -> None:
+    # Arrange.
+    index = FingerprintIndex(radius=1, num_bits=64)
+    index.add([Cation(CATIONS[0]), Anion("[Cl-]"), Cation(CATIONS[1])])
+
+    # Act.
+    indices, similarities = index.search(
+        [Cation(CATIONS[0])], k=5, mask=np.array([False, True, True])
+    )
+    empty_indices, empty_similarities = index.search([Cation(CATIONS[0])], k=0)
+
+    # Assert.
+    assert indices.tolist() == [[2, 1]]
+    assert similarities[0, 0] > similarities[0, 1]
+    assert empty_indices.shape == empty_similarities.shape == (1, 0)
+
+
+def test_fingerprint_index_of_no_molecules_is_empty() -> None:
+    # Arrange.
+    index = FingerprintIndex()
+
+    # Act.
+    index.add([])
+
+    # Assert.
+    assert len(index) == 0
+    assert index.similarity([Anion("[Cl-]")]).shape == (1, 0)
+
+
+def test_fingerprint_index_raises_value_error_for_invalid_number_of_bits() -> None:
+    # Act & assert.
+    with pytest.raises(ValueError, match="multiple of 64"):
+        FingerprintIndex(num_bits=100)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ilthermoml.stats import Histogram, Stats
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_histogram_counts_values_in_buckets() -> None:
+    # Arrange.
+    histogram = Histogram((1.0, 10.0))
+
+    # Act.
+    for value in [0.5, 1.0, 2.0, 20.0]:
+        histogram.observe(value)
+
+    # Assert.
+    assert histogram.to_dict() == {
+        "count": 4,
+        "sum": 23.5,
+        "min": 0.5,
+        "max": 20.0,
+        "mean": 5.875,
+        "buckets": {"1": 2, "10": 1, "+Inf": 1},
+    }
+
+
+def test_empty_histogram_has_no_extrema() -> None:
+    # Arrange.
+    histogram = Histogram((1.0,))
+
+    # Act.
+    histogram_dict = histogram.to_dict()
+
+    # Assert.
+    assert histogram_dict["min"] is None
+    assert histogram_dict["max"] is None
+    assert histogram_dict["mean"] is None
+
+
+def test_stats_increments_counters() -> None:
+    # Arrange.
+    stats = Stats()
+
+    # Act.
+    stats.increment("a")
+    stats.increment("a", 2)
+    stats.increment("b")
+
+    # Assert.
+    assert stats.counters == {"a": 3, "b": 1}
+
+
+def test_stats_times_blocks(mocker: MockerFixture) -> None:
+    # Arrange.
+    stats = Stats()
+
+    # Mock.
+    mocker.patch("ilthermoml.stats.time.perf_counter", side_effect=[1.0, 1.5])
+
+    # Act.
+    with pytest.raises(RuntimeError), stats.time("block.seconds"):
+        raise RuntimeError
+
+    # Assert.
+    assert stats.histograms["block.seconds"].total == pytest.approx(0.5)
+
+
+def test_stats_exports_children_as_json() -> None:
+    # Arrange.
+    stats = Stats()
+    child = Stats()
+
+    stats.add_child("child", child)
+    stats.observe("size", 100, bounds=(10.0,))
+    child.increment("count")
+
+    # Act.
+    stats_dict = json.loads(stats.to_json())
+
+    # Assert.
+    assert stats_dict["histograms"]["size"]["buckets"] == {"10": 0, "+Inf": 1}
+    assert stats_dict["children"] == {
+        "child": {"counters": {"count": 1}, "histograms": {}}
+    }
+
+
+def test_stats_reset_clears_counters_and_histograms() -> None:
+    # Arrange.
+    stats = Stats()
+
+    stats.increment("count")
+    stats.observe("seconds", 1.0)
+
+    # Act.
+    stats.reset()
+
+    # Assert.
+    assert stats.to_dict() == {"counters": {}, "histograms": {}}
+
+
+def test_stats_merge_adds_counters_and_histograms() -> None:
+    # Arrange.
+    stats = Stats()
+    other = Stats()
+
+    stats.increment("count")
+    stats.observe("seconds", 1.0)
+    other.increment("count", 2)
+    other.observe("seconds", 3.0)
+    other.observe("size", 100, bounds=(10.0,))
+
+    # Act.
+    stats.merge(pickle.loads(pickle.dumps(other)))  # noqa: S301
+
+    # Assert.
+    assert stats.counters == {"count": 3}
+    assert stats.histograms["seconds"].count == 2  # noqa: PLR2004
+    assert stats.histograms["seconds"].min == 1.0
+    assert stats.histograms["seconds"].max == 3.0  # noqa: PLR2004
+    assert stats.histograms["size"].counts == [0, 1]
+
+
+def test_histogram_merge_raises_value_error_for_different_bounds() -> None:
+    # Arrange.
+    histogram = Histogram((1.0,))
+
+    # Act & assert.
+    with pytest.raises(ValueError, match="different bounds"):
+        histogram.merge(Histogram((2.0,)))